@@ -0,0 +1,80 @@
+import asyncio
+import hashlib
+import html
+import logging
+import re
+from collections import namedtuple
+from urllib.parse import quote_plus
+
+from form_index import form_signature
+
+logger = logging.getLogger(__name__)
+
+# 기준 요청에서 모든 입력 필드에 넣는 무해한 값
+BENIGN_VALUE = 'test'
+
+_NUMBER_RE = re.compile(rb'\d+')
+_SPACE_RE = re.compile(rb'\s+')
+
+# 폼별 기준 응답 요약 (본문 자체는 보관하지 않음)
+Baseline = namedtuple('Baseline', ['status', 'length', 'body_hash', 'signatures'])
+
+def _injected_variants(value):
+    # 응답에 그대로, HTML 이스케이프되어, URL 인코딩되어 나타날 수 있는 형태
+    variants = {value, html.escape(value), html.escape(value, quote=False), quote_plus(value)}
+    return sorted((variant.encode('utf-8') for variant in variants if variant), key=len, reverse=True)
+
+def normalize_body(body, injected_values=()):
+    """주입한 값, 숫자(시간/토큰 등), 공백 차이를 제거해 같은 페이지면 같은 결과가 나오도록 정규화"""
+    body = bytes(body)
+    for value in injected_values:
+        for variant in _injected_variants(value):
+            body = body.replace(variant, b'')
+    body = _NUMBER_RE.sub(b'0', body)
+    body = _SPACE_RE.sub(b' ', body)
+    return body.lower()
+
+def body_hash(body, injected_values=()):
+    return hashlib.blake2b(normalize_body(body, injected_values), digest_size=16).digest()
+
+def build_baseline(status, body, analyzer):
+    normalized = normalize_body(body, (BENIGN_VALUE,))
+    return Baseline(
+        status=status,
+        length=len(body),
+        body_hash=hashlib.blake2b(normalized, digest_size=16).digest(),
+        signatures=analyzer.signatures(analyzer.scan(body))
+    )
+
+class BaselineCache:
+    """폼마다 무해한 값으로 한 번만 요청해 기준 응답을 만들어 두고, 동시에 요청한 워커들이 결과를 공유"""
+
+    def __init__(self, analyzer, fetch):
+        # fetch(session, form) -> (상태 코드, 본문 bytes)
+        self.analyzer = analyzer
+        self.fetch = fetch
+        self._baselines = {}  # 폼 시그니처 -> Future[Baseline 또는 None]
+
+    async def get(self, session, form):
+        key = form_signature(form)
+        future = self._baselines.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._baselines[key] = future
+            try:
+                status, body = await self.fetch(session, form)
+                future.set_result(build_baseline(status, body, self.analyzer))
+            except Exception as e:
+                # 기준 응답이 없으면 응답을 단독으로 판정
+                logger.warning(f"[Baseline] 기준 응답 요청 실패 - 폼: {form['action']}, 에러: {e}")
+                future.set_result(None)
+        return await future
+
+    @staticmethod
+    def is_unchanged(baseline, status, body, payload):
+        """상태 코드와 정규화된 본문 해시가 기준 응답과 같으면 True (페이로드가 아무 영향을 주지 않은 응답)"""
+        return (
+            baseline is not None
+            and status == baseline.status
+            and body_hash(body, (payload, BENIGN_VALUE)) == baseline.body_hash
+        )
@@ -0,0 +1,150 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS frontier (
+    url TEXT PRIMARY KEY,
+    depth INTEGER NOT NULL,
+    done INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS visited (
+    url TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS results (
+    url TEXT PRIMARY KEY,  -- 프론티어 URL (리다이렉트 전 URL)
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS static_urls (
+    url TEXT PRIMARY KEY
+);
+CREATE INDEX IF NOT EXISTS idx_frontier_pending ON frontier(done);
+"""
+
+class CrawlCheckpoint:
+    """크롤링 상태(프론티어, 방문 URL, 페이지별 추출 결과)를 SQLite에 점진적으로 저장하고 재개에 사용
+
+    쓰기는 메모리 버퍼에 모았다가 batch_size개 또는 flush_interval초마다 하나의 트랜잭션으로 반영
+    """
+
+    def __init__(self, path='crawl_checkpoint.sqlite', batch_size=200, flush_interval=5.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        self._pending = []
+        self._last_flush = time.monotonic()
+
+    # 메타 정보
+    def get_meta(self, key):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def saved_max_depth(self):
+        """체크포인트를 만들 때 사용한 최대 크롤링 깊이 (없으면 None)"""
+        value = self.get_meta('max_depth')
+        return int(value) if value is not None else None
+
+    def can_resume(self, base_url):
+        """같은 기본 URL로 진행하다 완료되지 않은 체크포인트가 있는지 확인"""
+        return self.get_meta('base_url') == base_url and self.get_meta('completed') != '1'
+
+    def reset(self, base_url, max_depth):
+        with self._lock:
+            self._pending.clear()
+            with self._conn:
+                for table in ('meta', 'frontier', 'visited', 'results', 'static_urls'):
+                    self._conn.execute(f"DELETE FROM {table}")
+                self._conn.executemany(
+                    "INSERT INTO meta (key, value) VALUES (?, ?)",
+                    [('base_url', base_url), ('max_depth', str(max_depth)), ('completed', '0')]
+                )
+
+    # 크롤링 중 기록 (버퍼링)
+    def _record(self, sql, params):
+        with self._lock:
+            self._pending.append((sql, params))
+            should_flush = (
+                len(self._pending) >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            )
+        if should_flush:
+            self.flush()
+
+    def enqueue(self, url, depth):
+        self._record("INSERT OR IGNORE INTO frontier (url, depth) VALUES (?, ?)", (url, depth))
+
+    def complete(self, url):
+        self._record("UPDATE frontier SET done = 1 WHERE url = ?", (url,))
+
+    def mark_visited(self, url):
+        self._record("INSERT OR IGNORE INTO visited (url) VALUES (?)", (url,))
+
+    def save_result(self, result, frontier_url=None):
+        """페이지 추출 결과를 프론티어 URL 기준으로 저장 (result['url']은 리다이렉트 후 URL일 수 있음)"""
+        self._record("INSERT OR REPLACE INTO results (url, data) VALUES (?, ?)", (frontier_url or result['url'], json.dumps(result, ensure_ascii=False)))
+
+    def save_static_urls(self, urls):
+        with self._lock:
+            with self._conn:
+                self._conn.executemany("INSERT OR IGNORE INTO static_urls (url) VALUES (?)", ((url,) for url in urls))
+                self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('static_done', '1')")
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._last_flush = time.monotonic()
+            if not pending:
+                return
+            try:
+                with self._conn:
+                    for sql, params in pending:
+                        self._conn.execute(sql, params)
+            except sqlite3.Error as e:
+                logger.error(f"[Checkpoint] 체크포인트 저장 실패: {e}")
+
+    # 재개용 조회
+    def load_static_urls(self):
+        if self.get_meta('static_done') != '1':
+            return None
+        return {row[0] for row in self._conn.execute("SELECT url FROM static_urls")}
+
+    def iter_frontier(self, pending_only=True):
+        sql = "SELECT url, depth FROM frontier"
+        if pending_only:
+            sql += " WHERE done = 0"
+        yield from self._conn.execute(sql + " ORDER BY depth")
+
+    def iter_visited(self):
+        for row in self._conn.execute("SELECT url FROM visited"):
+            yield row[0]
+
+    def iter_results(self):
+        """(프론티어 URL, 추출 결과)를 저장한 순서대로 반환"""
+        for url, data in self._conn.execute("SELECT url, data FROM results ORDER BY rowid"):
+            yield url, json.loads(data)
+
+    def pending_count(self):
+        return self._conn.execute("SELECT COUNT(*) FROM frontier WHERE done = 0").fetchone()[0]
+
+    def close(self):
+        """남은 기록을 반영하고, 처리되지 않은 프론티어가 없으면 완료된 체크포인트로 표시"""
+        self.flush()
+        completed = self.pending_count() == 0
+        with self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('completed', ?)", ('1' if completed else '0',))
+        self._conn.close()
+        if not completed:
+            logger.info(f"[Checkpoint] 처리되지 않은 URL이 남아 있습니다. 다음 실행에서 이어서 진행할 수 있습니다: {self.path}")
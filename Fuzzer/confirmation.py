@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import secrets
+
+from baseline import BENIGN_VALUE, body_hash
+
+logger = logging.getLogger(__name__)
+
+# 시간 지연 확인에 사용할 sleep 시간(초)과 인정할 최소 지연 비율
+SLEEP_SECONDS = 3
+TIMING_TOLERANCE = 0.8
+# 명령 실행 확인에 사용할 구분자
+COMMAND_SEPARATORS = (';', '|', '&&', '\n')
+
+def inconclusive_status(status):
+    # 429/5xx는 입력이 아니라 서버 상태(과부하, 일시 오류)를 반영하므로 비교에 사용하지 않음
+    return status == 429 or status >= 500
+
+class Confirmer:
+    """1단계(응답 검사)에서 후보로 판정된 (폼, 필드, 취약점 유형)에만 확인용 요청을 보내 취약점을 확정
+
+    - SQL Injection: 따옴표 에러 쌍(' / ''), 참/거짓 조건 쌍
+    - Command Injection: 산술 결과 마커 출력(echo), sleep 시간 지연 쌍
+    - XSS: 이스케이프되지 않은 마커 태그 반사
+    같은 (폼, 필드, 유형)의 확인 결과는 캐시해 동시에 들어온 후보들이 함께 사용
+    """
+
+    def __init__(self, analyzer, probe, form_key):
+        # probe(session, form, fields, value, timing=False) -> (상태 코드, 본문 bytes, 전송부터 응답을 다 읽을 때까지의 시간)
+        self.analyzer = analyzer
+        self.probe = probe
+        self.form_key = form_key
+        self._results = {}  # (폼 시그니처, 필드, 유형) -> Future[(확정 여부, 확인 방법)]
+        self.probes_sent = 0
+
+    async def confirm(self, session, form, fields, vuln_type, baseline):
+        """(확정 여부, 확인 방법 설명)을 반환"""
+        key = (self.form_key(form), tuple(fields or ()), vuln_type)
+        future = self._results.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._results[key] = future
+            try:
+                result = await self._confirm(session, form, fields, vuln_type, baseline)
+            except Exception as e:
+                logger.warning(f"[Confirmer] 확인 요청 실패 - 폼: {form['action']}, 유형: {vuln_type}, 에러: {e}")
+                result = (False, None)
+            future.set_result(result)
+        return await future
+
+    async def _confirm(self, session, form, fields, vuln_type, baseline):
+        if vuln_type == 'SQL Injection':
+            checks = (self._sql_error_pair, self._sql_boolean_pair)
+        elif vuln_type == 'Command Injection':
+            checks = (self._command_echo, self._command_timing)
+        elif vuln_type == 'XSS':
+            checks = (self._markup_echo,)
+        else:
+            return False, None
+        for check in checks:
+            technique = await check(session, form, fields, baseline)
+            if technique:
+                return True, technique
+        return False, None
+
+    async def _send(self, session, form, fields, value, timing=False):
+        # timing=True: 응답 시간을 비교하는 요청 (probe가 호스트 지연 시간 통계에서 제외)
+        self.probes_sent += 1
+        return await self.probe(session, form, fields, value, timing=timing)
+
+    def _sql_errors(self, body, baseline):
+        ignore = baseline.signatures if baseline is not None else frozenset()
+        return {hit.signature.lower() for hit in self.analyzer.scan(body) if hit.kind == 'sql_error'} - ignore
+
+    async def _sql_error_pair(self, session, form, fields, baseline):
+        # 따옴표 하나는 에러, 짝을 맞춘 따옴표는 에러 없음 -> 입력이 쿼리 문법에 영향을 줌
+        _, broken, _ = await self._send(session, form, fields, BENIGN_VALUE + "'")
+        errors = self._sql_errors(broken, baseline)
+        if not errors:
+            return None
+        _, balanced, _ = await self._send(session, form, fields, BENIGN_VALUE + "''")
+        if errors & self._sql_errors(balanced, baseline):
+            return None
+        return "따옴표 에러 쌍 (' / '')"
+
+    async def _sql_boolean_pair(self, session, form, fields, baseline):
+        # 참 조건은 기준 응답과 같고 거짓 조건은 같은 상태 코드에 본문이 달라야 함
+        # (상태 코드만 다르거나 어느 한쪽이 429/5xx이면 판단할 수 없으므로 확정하지 않음)
+        if baseline is None:
+            return None
+        for true_value, false_value in (
+            (f"{BENIGN_VALUE}' AND '1'='1", f"{BENIGN_VALUE}' AND '1'='2"),
+            ("1 AND 1=1", "1 AND 1=2"),
+        ):
+            true_status, true_body, _ = await self._send(session, form, fields, true_value)
+            if inconclusive_status(true_status) or true_status != baseline.status:
+                continue
+            if body_hash(true_body, (true_value, BENIGN_VALUE)) != baseline.body_hash:
+                continue
+            false_status, false_body, _ = await self._send(session, form, fields, false_value)
+            if inconclusive_status(false_status) or false_status != true_status:
+                continue
+            if body_hash(false_body, (false_value, BENIGN_VALUE)) != baseline.body_hash:
+                return f"참/거짓 조건 쌍 ({true_value} / {false_value})"
+        return None
+
+    async def _command_echo(self, session, form, fields, baseline):
+        # 셸이 계산해야만 나오는 값을 출력시켜 단순 반사와 구분
+        a, b = secrets.randbelow(9000) + 1000, secrets.randbelow(9000) + 1000
+        marker = f"fz{a + b}zf".encode()
+        for separator in COMMAND_SEPARATORS:
+            _, body, _ = await self._send(session, form, fields, f"{BENIGN_VALUE}{separator}echo fz$(({a}+{b}))zf")
+            if marker in body:
+                return f"명령 출력 마커 ({separator.strip() or '개행'} echo)"
+        return None
+
+    async def _command_timing(self, session, form, fields, baseline):
+        # sleep 0과 sleep N의 응답 시간 차이를 두 번 확인해 네트워크 지연과 구분
+        for separator in COMMAND_SEPARATORS[:2]:
+            for _ in range(2):
+                _, _, fast = await self._send(session, form, fields, f"{BENIGN_VALUE}{separator}sleep 0", timing=True)
+                _, _, slow = await self._send(session, form, fields, f"{BENIGN_VALUE}{separator}sleep {SLEEP_SECONDS}", timing=True)
+                if slow - fast < SLEEP_SECONDS * TIMING_TOLERANCE:
+                    break
+            else:
+                return f"시간 지연 쌍 ({separator} sleep 0 / sleep {SLEEP_SECONDS})"
+        return None
+
+    async def _markup_echo(self, session, form, fields, baseline):
+        # 임의의 태그가 이스케이프되지 않고 그대로 반사되는지 확인
+        tag = 'fz' + secrets.token_hex(4)
+        _, body, _ = await self._send(session, form, fields, f"<{tag}>")
+        if f"<{tag}>".encode() in body:
+            return f"마커 태그 반사 (<{tag}>)"
+        return None
@@ -17,6 +17,8 @@ import urllib.robotparser
 
 # PDF 리포트 모듈 임포트
 from report import generate_pdf_report
+# 정적 크롤러 모듈 임포트
+from static_crawler import StaticCrawler
 
 # Configure Logging
 logging.basicConfig(
@@ -29,51 +31,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# 크롤러 클래스 및 함수 정의
-class StaticCrawler:
-    def __init__(self, base_url, robot_parser=None):
-        self.base_url = base_url
-        self.robot_parser = robot_parser
-        self.visited = set()
-        self.to_visit = deque([base_url])
-        self.urls = set()
-
-    def is_valid_url(self, url):
-        parsed = urlparse(url)
-        if parsed.netloc != urlparse(self.base_url).netloc:
-            return False
-        if parsed.scheme not in ['http', 'https']:
-            return False
-        if self.robot_parser and not self.robot_parser.can_fetch("*", url):
-            logger.info(f"robots.txt에 의해 크롤링이 금지된 URL: {url}")
-            return False
-        return True
-
-    def crawl(self):
-        while self.to_visit:
-            url = self.to_visit.popleft()
-            if url in self.visited:
-                continue
-            self.visited.add(url)
-            try:
-                logger.info(f"[StaticCrawler] 방문 중: {url}")
-                response = requests.get(url, timeout=10)
-                if response.status_code != 200:
-                    logger.warning(f"[StaticCrawler] 비정상적인 상태 코드({response.status_code}) - URL: {url}")
-                    continue
-                soup = BeautifulSoup(response.text, 'html.parser')
-                for link in soup.find_all('a', href=True):
-                    new_url = urljoin(self.base_url, link['href'])
-                    new_url = new_url.rstrip('/')
-                    if self.is_valid_url(new_url) and new_url not in self.visited:
-                        self.urls.add(new_url)
-                        self.to_visit.append(new_url)
-            except requests.RequestException as e:
-                logger.error(f"[StaticCrawler] 요청 실패 - URL: {url}, 에러: {e}")
-                continue
-        logger.info(f"[StaticCrawler] 크롤링 완료: {len(self.urls)}개의 URL 수집.")
-        return self.urls
-
+# 크롤러 함수 정의
 def extract_urls_dynamic(driver, base_url):
     urls = set()
     try:
@@ -0,0 +1,169 @@
+import codecs
+import re
+from collections import namedtuple
+
+# 응답 본문에서 찾는 시그니처 (모두 ASCII라 원본 바이트에서 바로 비교 가능)
+SQL_ERROR_SIGNATURES = ['error', 'sql', 'syntax']  # 대소문자 무시
+COMMAND_OUTPUT_SIGNATURES = ['root:', 'uid=']
+COMMAND_NOT_FOUND_SIGNATURE = 'command not found'  # 셸이 주입된 명령을 해석했다는 흔적
+
+# 증거로 남길 탐지 위치 앞뒤 바이트 수
+EVIDENCE_RADIUS = 60
+
+# 탐지 결과 하나 (kind: 'reflection', 'sql_error', 'command_output', 'command_not_found', signature: bytes)
+DetectorHit = namedtuple('DetectorHit', ['kind', 'signature', 'position'])
+
+_GROUP_KINDS = {
+    'reflection': 'reflection',
+    'sql': 'sql_error',
+    'cmd': 'command_output',
+    'notfound': 'command_not_found',
+}
+
+def _alternation(signatures):
+    # 긴 시그니처를 먼저 시도해 같은 위치에서 가장 긴 것이 선택되도록 정렬
+    return b'|'.join(re.escape(signature) for signature in sorted(signatures, key=len, reverse=True))
+
+def is_ascii_compatible(charset):
+    """ASCII 문자를 같은 바이트로 인코딩하는 문자셋인지 확인 (UTF-16/32 등은 False)"""
+    try:
+        return 'ascii-test'.encode(charset) == b'ascii-test'
+    except (LookupError, TypeError):
+        return False
+
+def decode_evidence(data, start, end, charset='utf-8'):
+    """탐지 위치 주변의 작은 구간만 잘라 디코딩"""
+    window = bytes(memoryview(data)[max(0, start):end])
+    try:
+        return window.decode(charset, errors='replace')
+    except LookupError:
+        return window.decode('utf-8', errors='replace')
+
+class ResponseAnalyzer:
+    """모든 시그니처(반사된 페이로드, SQL 에러, 명령 실행 흔적)를 하나의 bytes 정규식으로 미리 컴파일해
+    응답 본문을 디코딩하지 않고 원본 바이트에서 한 번만 훑으면서 모든 탐지 결과를 수집
+    """
+
+    def __init__(self, payload_types):
+        # payload_types: {페이로드: 취약점 유형('SQL Injection', 'XSS', 'Command Injection')}
+        self.payload_types = dict(payload_types)
+        self.payload_bytes = {payload: payload.encode('utf-8') for payload in self.payload_types}
+        groups = []
+        reflected = [self.payload_bytes[payload] for payload, vuln_type in self.payload_types.items() if vuln_type == 'XSS']
+        if reflected:
+            groups.append(b"(?P<reflection>" + _alternation(reflected) + b")")
+        # (?i:...)는 bytes 패턴에서 ASCII 대소문자만 무시하므로 lower() 없이 비교 가능
+        groups.append(b"(?P<sql>(?i:" + _alternation([s.encode() for s in SQL_ERROR_SIGNATURES]) + b"))")
+        groups.append(b"(?P<cmd>" + _alternation([s.encode() for s in COMMAND_OUTPUT_SIGNATURES]) + b")")
+        groups.append(b"(?P<notfound>" + re.escape(COMMAND_NOT_FOUND_SIGNATURE.encode()) + b")")
+        # 전방 탐색으로 감싸 서로 겹치는 시그니처도 위치마다 찾도록 함
+        self.pattern = re.compile(b"(?=(?:" + b'|'.join(groups) + b"))")
+        signatures = reflected + SQL_ERROR_SIGNATURES + COMMAND_OUTPUT_SIGNATURES + [COMMAND_NOT_FOUND_SIGNATURE]
+        self.max_signature_length = max(len(signature) for signature in signatures)
+
+    def scan(self, data):
+        """본문(bytes, bytearray, memoryview)을 한 번 훑어 모든 탐지 결과를 반환"""
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        hits = []
+        for match in self.pattern.finditer(data):
+            group = match.lastgroup
+            hits.append(DetectorHit(_GROUP_KINDS[group], match.group(group), match.start()))
+        return hits
+
+    def confirms(self, payload, hit, ignore=frozenset()):
+        """이후 내용과 관계없이 이 탐지 결과만으로 취약점 후보 판정이 나는지 확인 (스트림 검사는 여기서 읽기를 중단)
+
+        ignore: 기준(baseline) 응답에도 있던 시그니처(소문자 bytes) - 페이로드와 무관하므로 근거로 쓰지 않음
+        """
+        vuln_type = self.payload_types.get(payload)
+        if hit.kind != 'reflection' and hit.signature.lower() in ignore:
+            return False
+        if vuln_type == 'SQL Injection':
+            return hit.kind == 'sql_error'
+        if vuln_type == 'XSS':
+            return hit.kind == 'reflection' and self.payload_bytes[payload] in hit.signature
+        if vuln_type == 'Command Injection':
+            return hit.kind in ('command_output', 'command_not_found')
+        return False
+
+    def verdict(self, payload, hits, ignore=frozenset()):
+        """페이로드 유형과 탐지 결과로 취약점 유형을 판정 (해당 없으면 None)
+
+        시그니처가 하나라도 있어야 후보가 되며, 'command not found'가 없다는 것만으로는 판정하지 않음
+        """
+        if any(self.confirms(payload, hit, ignore) for hit in hits):
+            return self.payload_types.get(payload)
+        return None
+
+    def signatures(self, hits):
+        """탐지 결과에서 시그니처 집합(소문자 bytes)을 추출 - 기준 응답의 ignore 집합으로 사용"""
+        return frozenset(hit.signature.lower() for hit in hits if hit.kind != 'reflection')
+
+    def stream(self, payload, charset='utf-8', ignore=frozenset()):
+        return StreamScanner(self, payload, charset, ignore)
+
+class StreamScanner:
+    """응답 본문을 바이트 청크 단위로 받아 검사하고, 판정이 확정되면 더 읽지 않도록 알려줌
+
+    청크 경계에 걸친 시그니처를 놓치지 않도록 (가장 긴 시그니처 길이 - 1)만큼을 다음 청크 앞에 이어 붙여 검사.
+    UTF-16 등 ASCII 호환이 아닌 문자셋만 UTF-8로 변환해서 검사하고, 나머지는 디코딩하지 않음
+    """
+
+    def __init__(self, analyzer, payload, charset='utf-8', ignore=frozenset()):
+        self.analyzer = analyzer
+        self.payload = payload
+        self.ignore = ignore
+        self.charset = charset or 'utf-8'
+        self.hits = []
+        self.evidence = None
+        self._transcoder = None
+        if not is_ascii_compatible(self.charset):
+            try:
+                self._transcoder = codecs.getincrementaldecoder(self.charset)(errors='replace')
+            except LookupError:
+                self.charset = 'utf-8'
+            else:
+                self.charset = 'utf-8'
+        self._overlap = analyzer.max_signature_length - 1
+        self._buffer = bytearray()
+        self._offset = 0  # _buffer[0]의 본문 내 위치
+        self._verdict = None
+
+    def _scan(self, final):
+        # 마지막이 아니면 뒤쪽 overlap 구간에서 시작하는 시그니처는 다음 청크와 함께 검사
+        limit = len(self._buffer) if final else len(self._buffer) - self._overlap
+        for hit in self.analyzer.scan(self._buffer):
+            if hit.position >= limit:
+                break
+            self.hits.append(hit._replace(position=hit.position + self._offset))
+            if self._verdict is None and self.analyzer.confirms(self.payload, hit, self.ignore):
+                self._verdict = self.analyzer.payload_types[self.payload]
+                self.evidence = decode_evidence(
+                    self._buffer,
+                    hit.position - EVIDENCE_RADIUS,
+                    hit.position + len(hit.signature) + EVIDENCE_RADIUS,
+                    self.charset
+                )
+        if limit > 0:
+            del self._buffer[:limit]
+            self._offset += limit
+
+    def feed(self, chunk):
+        """청크(bytes)를 검사하고, 판정이 확정되어 더 읽을 필요가 없으면 True를 반환"""
+        if self._transcoder is not None:
+            chunk = self._transcoder.decode(chunk).encode('utf-8')
+        self._buffer += chunk
+        if len(self._buffer) > self._overlap:
+            self._scan(final=False)
+        return self._verdict is not None
+
+    def finish(self):
+        """남은 본문을 검사하고 (취약점 유형 또는 None, 탐지 결과 목록)을 반환"""
+        if self._verdict is None:
+            if self._transcoder is not None:
+                self._buffer += self._transcoder.decode(b'', final=True).encode('utf-8')
+            self._scan(final=True)
+            self._buffer = bytearray()
+            return self.analyzer.verdict(self.payload, self.hits, self.ignore), self.hits
+        return self._verdict, self.hits
@@ -0,0 +1,235 @@
+import json
+import logging
+from datetime import datetime
+
+from scan_store import finding_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# 지원하는 리포트 형식과 파일 확장자 ('pdf'만 ReportLab 필요)
+REPORT_FORMATS = ('pdf', 'html', 'json', 'sarif')
+REPORT_EXTENSIONS = {'pdf': '.pdf', 'html': '.html', 'json': '.json', 'sarif': '.sarif'}
+DEFAULT_REPORT_FORMATS = ('pdf',)
+# HTML 리포트의 한 페이지당 행 수
+HTML_PAGE_SIZE = 100
+
+TOOL_NAME = 'WebFuzzerTool'
+SARIF_SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+# 취약점 유형별 SARIF 규칙 (id, 설명, CWE)
+SARIF_RULES = {
+    'SQL Injection': ('sql-injection', 'SQL Injection', 'CWE-89'),
+    'XSS': ('xss', 'Cross-site Scripting (XSS)', 'CWE-79'),
+    'Command Injection': ('command-injection', 'OS Command Injection', 'CWE-78'),
+}
+
+def parse_report_formats(text):
+    """쉼표로 구분한 형식 문자열('pdf, json' 등)을 형식 튜플로 변환 (비어 있으면 기본 형식)"""
+    formats = []
+    for name in (text or '').split(','):
+        name = name.strip().lower()
+        if not name:
+            continue
+        if name not in REPORT_FORMATS:
+            logger.warning(f"[Exporter] 지원하지 않는 리포트 형식은 무시합니다: {name} (사용 가능: {', '.join(REPORT_FORMATS)})")
+        elif name not in formats:
+            formats.append(name)
+    return tuple(formats) or DEFAULT_REPORT_FORMATS
+
+# 항목마다 인코더를 새로 만들지 않도록 하나를 재사용
+_json = json.JSONEncoder(ensure_ascii=False, default=str).encode
+
+def _write_array(out, items, indent=''):
+    # 반복자의 항목을 하나씩 JSON 배열로 기록 (전체 목록을 메모리에 만들지 않음)
+    out.write('[')
+    for index, item in enumerate(items):
+        out.write(',\n' if index else '\n')
+        out.write(indent + _json(item))
+    out.write('\n' + indent[:-2] + ']' if indent else ']')
+
+def _form_rows(extraction_results):
+    # 페이지별 폼 추출 결과를 (페이지 URL, 폼) 행으로 펼침
+    for result in extraction_results or []:
+        for form in result.get('forms', []):
+            yield {'url': result['url'], 'action': form.get('action', ''), 'method': (form.get('method') or '').upper(), 'inputs': form.get('inputs', [])}
+
+def _unique_form_rows(unique_forms):
+    # 중복 제거된 폼을 발견 페이지마다 한 행으로 펼침
+    for form in unique_forms or []:
+        pages = form.get('pages', [])
+        for page_url in pages or ['']:
+            yield {'action': form.get('action', ''), 'method': form.get('method') or '', 'inputs': form.get('inputs', []), 'page_count': len(pages), 'page': page_url}
+
+def write_json_report(crawled_urls, extraction_results, vulnerabilities, attempts, output_path='fuzzer_report.json', unique_forms=None):
+    """퍼저 결과를 하나의 JSON 문서로 기록 (목록은 항목 단위로 순회하며 기록)"""
+    with open(output_path, 'w', encoding='utf-8') as out:
+        out.write('{\n  "tool": ' + _json(TOOL_NAME) + ',\n')
+        out.write('  "generated_at": ' + _json(datetime.now().isoformat(timespec='seconds')) + ',\n')
+        sections = (
+            ('crawled_urls', crawled_urls or []),
+            ('forms', _form_rows(extraction_results)),
+            ('unique_forms', unique_forms or []),
+            ('vulnerabilities', vulnerabilities or []),
+            ('attempts', attempts or []),
+        )
+        for index, (name, items) in enumerate(sections):
+            out.write(f'  "{name}": ')
+            _write_array(out, items, indent='    ')
+            out.write(',\n' if index < len(sections) - 1 else '\n')
+        out.write('}\n')
+
+def _sarif_rule(vuln_type):
+    rule_id, name, cwe = SARIF_RULES.get(vuln_type, (vuln_type.lower().replace(' ', '-'), vuln_type, None))
+    rule = {'id': rule_id, 'name': name.replace(' ', ''), 'shortDescription': {'text': name}}
+    if cwe:
+        rule['properties'] = {'tags': ['security', cwe]}
+    return rule
+
+def _sarif_result(finding):
+    message = f"{finding.get('type')} - 페이로드: {finding.get('payload')}"
+    if finding.get('parameter'):
+        message += f", 파라미터: {finding['parameter']}"
+    if finding.get('confirmation'):
+        message += f", 확인 방법: {finding['confirmation']}"
+    return {
+        'ruleId': _sarif_rule(finding.get('type') or '')['id'],
+        'level': 'error',
+        'message': {'text': message},
+        'locations': [{'physicalLocation': {'artifactLocation': {'uri': finding.get('form', '')}}}],
+        'partialFingerprints': {'findingKey/v1': finding_fingerprint(finding)},
+        'properties': {
+            'parameter': finding.get('parameter'),
+            'payload': finding.get('payload'),
+            'responseCode': finding.get('response_code'),
+            'evidence': finding.get('evidence'),
+        },
+    }
+
+def write_sarif_report(crawled_urls, extraction_results, vulnerabilities, attempts, output_path='fuzzer_report.sarif', unique_forms=None):
+    """확인된 취약점을 SARIF 2.1.0 형식으로 기록 (CI 코드 스캐닝 연동용, 퍼징 시도 내역은 포함하지 않음)"""
+    rules = [_sarif_rule(vuln_type) for vuln_type in SARIF_RULES]
+    with open(output_path, 'w', encoding='utf-8') as out:
+        out.write('{\n  "$schema": ' + _json(SARIF_SCHEMA) + ',\n  "version": "2.1.0",\n  "runs": [{\n')
+        out.write('    "tool": ' + _json({'driver': {'name': TOOL_NAME, 'rules': rules}}) + ',\n')
+        out.write('    "results": ')
+        _write_array(out, (_sarif_result(finding) for finding in vulnerabilities or []), indent='      ')
+        out.write('\n  }]\n}\n')
+
+HTML_HEAD = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>웹 퍼저 리포트</title>
+<style>
+body { font-family: sans-serif; margin: 2em; }
+table { border-collapse: collapse; width: 100%; margin-bottom: 0.5em; table-layout: fixed; }
+th, td { border: 1px solid #444; padding: 4px 8px; text-align: left; vertical-align: top; word-break: break-all; }
+th { background: #777; color: #fff; }
+.pager { margin-bottom: 2em; }
+.pager button { margin-right: 4px; }
+</style>
+</head>
+<body>
+<h1>웹 퍼저 리포트</h1>
+"""
+
+# 데이터 블록(JSON)을 읽어 표를 페이지 단위로 그리는 스크립트
+HTML_SCRIPT = """<script>
+const PAGE_SIZE = %d;
+function renderTable(id, columns) {
+  const rows = JSON.parse(document.getElementById(id + '-data').textContent);
+  const table = document.getElementById(id);
+  const pager = document.getElementById(id + '-pager');
+  const filter = document.getElementById(id + '-filter');
+  let visible = rows, page = 0;
+  function draw() {
+    const pages = Math.max(1, Math.ceil(visible.length / PAGE_SIZE));
+    page = Math.min(page, pages - 1);
+    table.innerHTML = '';
+    const head = table.insertRow();
+    columns.forEach(([title]) => { const th = document.createElement('th'); th.textContent = title; head.appendChild(th); });
+    visible.slice(page * PAGE_SIZE, (page + 1) * PAGE_SIZE).forEach(row => {
+      const tr = table.insertRow();
+      columns.forEach(([, key]) => { tr.insertCell().textContent = typeof key === 'function' ? key(row) : (row[key] ?? ''); });
+    });
+    pager.innerHTML = '';
+    const info = document.createElement('span');
+    info.textContent = ` ${page + 1} / ${pages} 페이지 (${visible.length}건) `;
+    [['처음', 0], ['이전', page - 1], ['다음', page + 1], ['끝', pages - 1]].forEach(([label, target]) => {
+      const button = document.createElement('button');
+      button.textContent = label;
+      button.disabled = target < 0 || target >= pages || target === page;
+      button.onclick = () => { page = target; draw(); };
+      pager.appendChild(button);
+    });
+    pager.appendChild(info);
+  }
+  if (filter) {
+    filter.oninput = () => {
+      const text = filter.value.toLowerCase();
+      visible = text ? rows.filter(row => JSON.stringify(row).toLowerCase().includes(text)) : rows;
+      page = 0;
+      draw();
+    };
+  }
+  draw();
+}
+const inputs = row => (row.inputs || []).map(field => `${field.name || ''} (type: ${field.type || ''})`).join(', ');
+renderTable('urls', [['크롤링한 URL', 'url']]);
+renderTable('forms', [['URL', 'url'], ['폼 액션', 'action'], ['메소드', 'method'], ['입력 필드', inputs]]);
+renderTable('unique-forms', [['폼 액션', 'action'], ['메소드', row => (row.method || '').toUpperCase()], ['입력 필드', inputs], ['발견 페이지 수', 'page_count'], ['발견 페이지', 'page']]);
+renderTable('vulnerabilities', [['유형', 'type'], ['폼 액션', 'form'], ['파라미터', 'parameter'], ['페이로드', 'payload'], ['확인 방법', 'confirmation']]);
+renderTable('attempts', [['폼 액션', 'form_action'], ['파라미터', 'parameter'], ['페이로드', 'payload'], ['응답 코드', 'response_code'], ['결과', 'result']]);
+</script>
+</body>
+</html>
+""" % HTML_PAGE_SIZE
+
+def _write_html_section(out, section_id, title, items):
+    # 표 자리와 데이터 블록을 기록
+    # (</script>나 <!--<script>로 블록이 끝나거나 이어지지 않도록 <, >, &를 JSON 유니코드 이스케이프로 기록)
+    out.write(f'<h2>{title}</h2>\n<input id="{section_id}-filter" placeholder="검색">\n')
+    out.write(f'<table id="{section_id}"></table>\n<div class="pager" id="{section_id}-pager"></div>\n')
+    out.write(f'<script type="application/json" id="{section_id}-data">')
+    out.write('[')
+    for index, item in enumerate(items):
+        if index:
+            out.write(',\n')
+        out.write(_json(item).replace('&', '\\u0026').replace('<', '\\u003c').replace('>', '\\u003e'))
+    out.write(']</script>\n')
+
+def write_html_report(crawled_urls, extraction_results, vulnerabilities, attempts, output_path='fuzzer_report.html', unique_forms=None):
+    """외부 파일 없이 열리는 HTML 리포트를 기록 (표는 브라우저에서 HTML_PAGE_SIZE행씩 페이지로 나눠 표시)"""
+    with open(output_path, 'w', encoding='utf-8') as out:
+        out.write(HTML_HEAD)
+        out.write(f"<p>생성 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>\n")
+        _write_html_section(out, 'urls', '1. 크롤링 결과', ({'url': url} for url in crawled_urls or []))
+        _write_html_section(out, 'forms', '2. 폼과 입력 필드', _form_rows(extraction_results))
+        _write_html_section(out, 'unique-forms', '퍼징 대상 폼 (중복 제거, 발견 페이지마다 한 행)', _unique_form_rows(unique_forms))
+        _write_html_section(out, 'vulnerabilities', '3. 발견된 취약점', vulnerabilities or [])
+        _write_html_section(out, 'attempts', '퍼징 시도 및 결과', attempts or [])
+        out.write(HTML_SCRIPT)
+
+REPORT_WRITERS = {
+    'html': write_html_report,
+    'json': write_json_report,
+    'sarif': write_sarif_report,
+}
+
+def generate_reports(formats, crawled_urls, extraction_results, vulnerabilities, attempts, output_base='fuzzer_report', unique_forms=None, **pdf_options):
+    """선택한 형식마다 output_base + 확장자 경로에 리포트를 생성하고 생성된 경로 목록을 반환 (pdf_options는 PDF 생성 옵션)"""
+    written = []
+    for report_format in formats:
+        output_path = output_base + REPORT_EXTENSIONS[report_format]
+        if report_format == 'pdf':
+            # ReportLab과 폰트는 PDF를 만들 때만 불러옴
+            from report import generate_pdf_report
+            generate_pdf_report(crawled_urls, extraction_results, vulnerabilities, attempts, output_path=output_path, unique_forms=unique_forms, **pdf_options)
+            written.append(output_path)
+            continue
+        try:
+            REPORT_WRITERS[report_format](crawled_urls, extraction_results, vulnerabilities, attempts, output_path=output_path, unique_forms=unique_forms)
+            written.append(output_path)
+            logger.info(f"[Exporter] {report_format.upper()} 리포트가 {output_path}에 생성되었습니다.")
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(f"[Exporter] {report_format.upper()} 리포트 생성 중 오류 발생: {e}")
+    return written
@@ -0,0 +1,72 @@
+import logging
+import os
+import threading
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+logger = logging.getLogger(__name__)
+
+# 패키지 기준 폰트 디렉토리 (실행 위치와 관계없이 사용)
+FONT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fonts')
+# 저장소에 포함된 한글 TTF (NanumGothic.ttf/NanumGothicBold.ttf가 없을 때 대신 사용)
+BUNDLED_FONT = 'NanumGothicLight.ttf'
+# 리포트에 사용하는 글꼴 이름 -> (찾아볼 TTF 파일 이름 목록(앞에서부터), 모두 없을 때 사용할 기본 글꼴)
+REPORT_FONTS = {
+    'NanumGothic': (('NanumGothic.ttf', BUNDLED_FONT), 'Helvetica'),
+    'NanumGothic-Bold': (('NanumGothicBold.ttf', BUNDLED_FONT), 'Helvetica-Bold'),
+}
+
+class FontManager:
+    """리포트 글꼴을 프로세스당 한 번만 찾아서 등록하고, 등록된 글꼴 이름을 반환
+
+    TTF 파일은 글꼴마다 지정된 파일 이름 순서대로 font_dirs에서 찾으며(기본: 패키지의 fonts/, 현재 디렉토리의 fonts/),
+    모두 찾지 못하거나 읽을 수 없으면 경고 후 기본 글꼴(Helvetica)을 사용
+    """
+
+    def __init__(self, fonts=None, font_dirs=None):
+        self.fonts = fonts or REPORT_FONTS
+        self.font_dirs = font_dirs or (FONT_DIR, 'fonts')
+        self._resolved = {}  # 글꼴 이름 -> 실제로 사용할 글꼴 이름
+        self._lock = threading.Lock()
+
+    def find(self, filename):
+        for font_dir in self.font_dirs:
+            path = os.path.join(font_dir, filename)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def resolve(self, name):
+        """글꼴 이름을 등록된 글꼴 이름으로 변환 (처음 요청될 때만 TTF 파일을 읽음)"""
+        with self._lock:
+            if name not in self._resolved:
+                self._resolved[name] = self._register(name)
+            return self._resolved[name]
+
+    def _register(self, name):
+        filenames, fallback = self.fonts[name]
+        if name in pdfmetrics.getRegisteredFontNames():
+            return name
+        for filename in filenames:
+            path = self.find(filename)
+            if path is None:
+                continue
+            try:
+                pdfmetrics.registerFont(TTFont(name, path))
+            except Exception as e:
+                logger.error(f"[FontManager] {path} 글꼴 등록 실패: {e}")
+                continue
+            if filename != filenames[0]:
+                logger.info(f"[FontManager] {filenames[0]} 파일이 없어 {filename} 파일을 {name} 글꼴로 사용합니다.")
+            logger.info(f"[FontManager] {name} 글꼴 등록 성공: {path}")
+            return name
+        logger.warning(f"[FontManager] {', '.join(filenames)} 파일을 사용할 수 없어 {fallback} 글꼴을 사용합니다 (한글이 표시되지 않음). 검색 위치: {', '.join(self.font_dirs)}")
+        return fallback
+
+# 프로세스 전체에서 공유하는 글꼴 관리자
+font_manager = FontManager()
+
+def report_fonts():
+    """리포트 본문/굵은 글꼴 이름 (regular, bold)"""
+    return font_manager.resolve('NanumGothic'), font_manager.resolve('NanumGothic-Bold')
@@ -0,0 +1,31 @@
+from frontier import canonicalize_url
+
+def form_signature(form):
+    """표준화한 action, 메소드, 정렬된 입력 필드(이름, 타입)로 폼을 식별하는 키"""
+    fields = sorted((input_field.get('name') or '', input_field.get('type') or '') for input_field in form.get('inputs', []))
+    return canonicalize_url(form['action']), form.get('method', 'get').lower(), tuple(fields)
+
+class FormIndex:
+    """여러 페이지에 반복해서 나타나는 같은 폼을 하나로 묶고, 폼이 발견된 페이지 목록을 함께 보관"""
+
+    def __init__(self):
+        self._forms = {}  # 시그니처 -> 폼 (발견 페이지 목록 'pages' 포함)
+        self.total = 0  # 중복을 포함한 전체 폼 수
+
+    def add(self, form, page_url):
+        """처음 보는 폼이면 True, 이미 있는 폼이면 발견 페이지만 추가하고 False를 반환"""
+        self.total += 1
+        signature = form_signature(form)
+        existing = self._forms.get(signature)
+        if existing is not None:
+            if page_url not in existing['pages']:
+                existing['pages'].append(page_url)
+            return False
+        self._forms[signature] = {**form, 'pages': [page_url]}
+        return True
+
+    def forms(self):
+        return list(self._forms.values())
+
+    def __len__(self):
+        return len(self._forms)
@@ -0,0 +1,197 @@
+import hashlib
+import math
+import re
+import string
+import threading
+from array import array
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, quote
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# 퍼센트 인코딩이 필요 없는 문자 (RFC 3986 unreserved)
+_UNRESERVED = set(string.ascii_letters + string.digits + '-._~')
+# 경로에서 그대로 두는 문자 (이미 인코딩된 %XX 포함)
+_PATH_SAFE = "/:@!$&'()*+,;=-._~%"
+_PERCENT_RE = re.compile(r'%([0-9A-Fa-f]{2})')
+
+def _normalize_percent(match):
+    char = chr(int(match.group(1), 16))
+    return char if char in _UNRESERVED else '%' + match.group(1).upper()
+
+def canonicalize_url(url):
+    """같은 페이지를 가리키는 URL을 하나의 표준 형태로 변환
+
+    - scheme, host를 소문자로 변환하고 기본 포트(:80, :443)를 제거
+    - fragment(#...)를 제거
+    - 쿼리 파라미터를 이름/값 순으로 정렬
+    - 퍼센트 인코딩을 통일하고 끝의 '/'를 제거 (기존 rstrip('/') 규칙 유지)
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = f"[{host}]" if ':' in host else host  # IPv6 주소
+    if parts.username or parts.password:
+        userinfo = parts.username or ''
+        if parts.password:
+            userinfo += ':' + parts.password
+        netloc = f"{userinfo}@{netloc}"
+    if port is not None and port != DEFAULT_PORTS.get(scheme):
+        netloc = f"{netloc}:{port}"
+
+    path = _PERCENT_RE.sub(_normalize_percent, quote(parts.path, safe=_PATH_SAFE)).rstrip('/')
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, netloc, path, query, ''))
+
+class SeenIndex:
+    """큐에 넣었거나 방문한 URL의 표준 형태를 기록해, 각 URL이 한 번만 큐에 들어가도록 보장"""
+
+    def __init__(self, store=None):
+        self._seen = store if store is not None else set()
+        self._lock = threading.Lock()
+
+    def add(self, url):
+        """처음 보는 URL이면 기록 후 표준 형태를 반환하고, 이미 본 URL이면 None을 반환"""
+        key = canonicalize_url(url)
+        with self._lock:
+            if key in self._seen:
+                return None
+            self._seen.add(key)
+            return key
+
+    def __contains__(self, url):
+        return canonicalize_url(url) in self._seen
+
+    def __len__(self):
+        return len(self._seen)
+
+def _fingerprint(key, digest_size=8):
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=digest_size).digest(), 'little')
+
+class FingerprintSet:
+    """URL 대신 64비트 해시 지문만 배열 기반 오픈 어드레싱 테이블에 저장하는 집합 (URL당 약 16바이트)
+
+    서로 다른 URL의 지문이 충돌할 확률은 URL 수 n에 대해 약 n^2 / 2^65로 무시할 수 있는 수준
+    """
+
+    def __init__(self, capacity=1024, max_load=0.6):
+        size = 1
+        while size < capacity / max_load:
+            size <<= 1
+        self._table = array('Q', bytes(8 * size))  # 0은 빈 슬롯
+        self._mask = size - 1
+        self._max_load = max_load
+        self._count = 0
+
+    def _slot(self, fingerprint):
+        table = self._table
+        mask = self._mask
+        index = fingerprint & mask
+        while True:
+            value = table[index]
+            if value == 0 or value == fingerprint:
+                return index
+            index = (index + 1) & mask
+
+    def _resize(self):
+        old_table = self._table
+        self._table = array('Q', bytes(8 * 2 * len(old_table)))
+        self._mask = len(self._table) - 1
+        for fingerprint in old_table:
+            if fingerprint:
+                self._table[self._slot(fingerprint)] = fingerprint
+
+    def add(self, key):
+        fingerprint = _fingerprint(key) or 1
+        index = self._slot(fingerprint)
+        if self._table[index] == 0:
+            self._table[index] = fingerprint
+            self._count += 1
+            if self._count > self._max_load * len(self._table):
+                self._resize()
+
+    def __contains__(self, key):
+        fingerprint = _fingerprint(key) or 1
+        return self._table[self._slot(fingerprint)] != 0
+
+    def __len__(self):
+        return self._count
+
+class _BloomFilter:
+    def __init__(self, capacity, error_rate):
+        self.capacity = capacity
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def add(self, hash1, hash2):
+        bits = self.bits
+        num_bits = self.num_bits
+        for i in range(self.num_hashes):
+            position = (hash1 + i * hash2) % num_bits
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def contains(self, hash1, hash2):
+        bits = self.bits
+        num_bits = self.num_bits
+        for i in range(self.num_hashes):
+            position = (hash1 + i * hash2) % num_bits
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+class ScalableBloomFilter:
+    """용량이 차면 더 큰 필터를 추가하는 블룸 필터 (전체 오탐률은 error_rate 이하로 유지)
+
+    오탐이 발생하면 처음 보는 URL을 이미 방문한 것으로 판단해 건너뛸 수 있으므로,
+    error_rate는 누락을 허용할 수 있는 수준으로 설정해야 함
+    """
+
+    def __init__(self, initial_capacity=100000, error_rate=0.001, growth=2, tightening=0.5):
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth = growth
+        self.tightening = tightening
+        self._filters = []
+        self._count = 0
+
+    def _hashes(self, key):
+        fingerprint = _fingerprint(key, digest_size=16)
+        return fingerprint & 0xFFFFFFFFFFFFFFFF, (fingerprint >> 64) | 1
+
+    def add(self, key):
+        hash1, hash2 = self._hashes(key)
+        if any(bloom.contains(hash1, hash2) for bloom in self._filters):
+            return
+        if not self._filters or self._filters[-1].count >= self._filters[-1].capacity:
+            # 필터 i의 오탐률을 error_rate * (1 - r) * r^i 로 두면 전체 오탐률 합이 error_rate 이하
+            index = len(self._filters)
+            capacity = self.initial_capacity * (self.growth ** index)
+            error_rate = self.error_rate * (1 - self.tightening) * (self.tightening ** index)
+            self._filters.append(_BloomFilter(capacity, error_rate))
+        self._filters[-1].add(hash1, hash2)
+        self._count += 1
+
+    def __contains__(self, key):
+        hash1, hash2 = self._hashes(key)
+        return any(bloom.contains(hash1, hash2) for bloom in self._filters)
+
+    def __len__(self):
+        return self._count
+
+URL_STORES = {
+    'set': set,
+    'fingerprint': FingerprintSet,
+    'bloom': ScalableBloomFilter,
+}
+
+def create_url_store(kind='set', **options):
+    """방문 URL 저장소 생성 - 'set'(원본 문자열), 'fingerprint'(64비트 지문), 'bloom'(스케일러블 블룸 필터)"""
+    if kind not in URL_STORES:
+        raise ValueError(f"지원하지 않는 URL 저장소입니다: {kind}")
+    return URL_STORES[kind](**options)
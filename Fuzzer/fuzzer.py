@@ -1,20 +1,51 @@
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urlparse, urljoin
-from collections import deque
+from urllib.parse import urlparse, urljoin, urlsplit, urlunsplit, parse_qsl
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+import json
 import logging
 from datetime import datetime
 import asyncio
 import aiohttp
-import urllib.robotparser
-
-# PDF 리포트 모듈 임포트
-from report import generate_pdf_report
+import queue
+import threading
+import time
+
+# 리포트 생성(PDF/HTML/JSON/SARIF) 모듈 임포트
+from exporters import REPORT_FORMATS, generate_reports, parse_report_formats
+# URL 표준화 및 프론티어 중복 제거 모듈 임포트
+from frontier import SeenIndex, canonicalize_url, create_url_store
+# 폼 중복 제거 모듈 임포트
+from form_index import FormIndex, form_signature
+# 응답 분석 모듈 임포트
+from detectors import ResponseAnalyzer
+# 폼별 기준 응답(baseline) 비교 모듈 임포트
+from baseline import BaselineCache, BENIGN_VALUE
+# 크롤링 체크포인트 모듈 임포트
+from checkpoint import CrawlCheckpoint
+# 크롤링 범위 및 robots.txt 판정 모듈 임포트
+from scope import CrawlScope, RobotsRules
+# HTML 파서 모듈 임포트
+from html_parsers import extract_forms
+# 정적 크롤러 모듈 임포트
+from static_crawler import StaticCrawler
+# 호스트별 적응형 동시 요청 제어 모듈 임포트
+from throttle import HostThrottle
+# 재시도/백오프 및 서킷 브레이커 모듈 임포트
+from resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
+# canary 반사 확인 모듈 임포트
+from reflection import find_reflections, make_canaries
+# 필드별 주입 작업 스케줄러 및 퍼징 예산 모듈 임포트
+from scheduler import BudgetExceededError, InjectionScheduler, ScanBudget, injectable_fields
+# 취약점 후보 확인(2단계) 모듈 임포트
+from confirmation import Confirmer
+# 퍼징 결과 기록(JSONL 스풀) 모듈 임포트
+from result_sink import JsonlSpool, MemorySink, TeeSink
+# 스캔 결과 누적 저장소 모듈 임포트
+from scan_store import ScanStore
 
 # Configure Logging
 logging.basicConfig(
@@ -27,51 +58,36 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# 크롤러 클래스 및 함수 정의
-class StaticCrawler:
-    def __init__(self, base_url, robot_parser=None):
-        self.base_url = base_url
-        self.robot_parser = robot_parser
-        self.visited = set()
-        self.to_visit = deque([base_url])
-        self.urls = set()
-
-    def is_valid_url(self, url):
-        parsed = urlparse(url)
-        if parsed.netloc != urlparse(self.base_url).netloc:
-            return False
-        if parsed.scheme not in ['http', 'https']:
-            return False
-        if self.robot_parser and not self.robot_parser.can_fetch("*", url):
-            logger.info(f"robots.txt에 의해 크롤링이 금지된 URL: {url}")
-            return False
-        return True
-
-    def crawl(self):
-        while self.to_visit:
-            url = self.to_visit.popleft()
-            if url in self.visited:
-                continue
-            self.visited.add(url)
-            try:
-                logger.info(f"[StaticCrawler] 방문 중: {url}")
-                response = requests.get(url, timeout=10)
-                if response.status_code != 200:
-                    logger.warning(f"[StaticCrawler] 비정상적인 상태 코드({response.status_code}) - URL: {url}")
-                    continue
-                soup = BeautifulSoup(response.text, 'html.parser')
-                for link in soup.find_all('a', href=True):
-                    new_url = urljoin(self.base_url, link['href'])
-                    new_url = new_url.rstrip('/')
-                    if self.is_valid_url(new_url) and new_url not in self.visited:
-                        self.urls.add(new_url)
-                        self.to_visit.append(new_url)
-            except requests.RequestException as e:
-                logger.error(f"[StaticCrawler] 요청 실패 - URL: {url}, 에러: {e}")
-                continue
-        logger.info(f"[StaticCrawler] 크롤링 완료: {len(self.urls)}개의 URL 수집.")
-        return self.urls
-
+# 동적 크롤링에 사용할 기본 브라우저 워커 수
+DEFAULT_DYNAMIC_WORKERS = 4
+# 연속으로 이 횟수만큼 방문에 실패한 브라우저는 재시작(또는 종료)하고, URL 하나는 이 수만큼의 서로 다른 브라우저에서 방문 시도
+MAX_DRIVER_FAILURES = 3
+MAX_PAGE_ATTEMPTS = 2
+# 방문 URL 저장소 ('set', 'fingerprint', 'bloom') - 수십만 URL 이상의 대규모 크롤링에서는 'fingerprint' 권장
+URL_STORE = 'set'
+# 크롤링 체크포인트 파일 (중단된 크롤링 재개용)
+CHECKPOINT_PATH = 'crawl_checkpoint.sqlite'
+# 응답에 반사되는 필드에만 보내는 페이로드 유형
+REFLECTION_TYPES = frozenset({'XSS'})
+# 기준 응답과 달리 서버 오류(5xx)가 나면 후보로 보는 페이로드 유형
+STATUS_CHANGE_TYPES = frozenset({'SQL Injection', 'Command Injection'})
+# 퍼징 범위 정책 - 'first': (폼, 취약점 유형)별로 처음 확인된 취약점에서 중단,
+# 'per-field': (폼, 필드, 취약점 유형)별로 처음 확인된 취약점에서 중단, 'exhaustive': 모든 페이로드 전송
+SCAN_POLICIES = ('first', 'per-field', 'exhaustive')
+DEFAULT_SCAN_POLICY = 'first'
+# 퍼징 예산 - 폼 하나에 보낼 최대 요청 수, 퍼징 전체 최대 실행 시간(초) (None이면 제한 없음)
+FORM_REQUEST_BUDGET = 200
+FUZZ_TIME_LIMIT = 60 * 60
+# 퍼징 시도/취약점을 기록할 스풀 파일 (.gz이면 gzip 압축)
+RESULT_SPOOL_PATH = 'fuzz_results.jsonl.gz'
+# 여러 번의 스캔 결과를 누적 저장하는 데이터베이스 (스캔 간 비교용)
+SCAN_DB_PATH = 'scan_results.sqlite'
+# 리포트의 취약점 없는 시도 표시 방식 ('all', 'cap', 'summary')
+REPORT_NON_VULNERABLE_MODE = 'cap'
+# 퍼저 워커 수 및 호스트별 동시 요청 한도의 상한 (실제 한도는 응답 상태/지연 시간에 따라 조절)
+FUZZ_MAX_CONCURRENCY = 32
+
+# 크롤러 함수 정의
 def extract_urls_dynamic(driver, base_url):
     urls = set()
     try:
@@ -87,6 +103,96 @@ def extract_urls_dynamic(driver, base_url):
         logger.error(f"[DynamicCrawler] URL 추출 중 오류 발생: {e}")
     return urls
 
+# 링크, 폼, 독립 입력 필드를 한 번의 execute_script 호출로 수집하는 스크립트 (동일 출처 iframe 포함)
+EXTRACT_PAGE_SCRIPT = """
+var result = {links: [], forms: [], inputs: []};
+var seenLinks = new Set();
+
+function field(el) {
+    var tag = el.tagName.toLowerCase();
+    return {tag: tag, type: el.getAttribute('type') || tag, name: el.getAttribute('name')};
+}
+
+function collect(doc, depth) {
+    var anchors = doc.getElementsByTagName('a');
+    for (var i = 0; i < anchors.length; i++) {
+        var href = anchors[i].href;
+        if (href && !seenLinks.has(href)) {
+            seenLinks.add(href);
+            result.links.push(href);
+        }
+    }
+
+    var forms = doc.getElementsByTagName('form');
+    for (var i = 0; i < forms.length; i++) {
+        var form = forms[i];
+        var action = form.getAttribute('action');
+        var resolved = doc.URL;
+        if (action) {
+            try { resolved = new URL(action, doc.baseURI).href; } catch (e) { resolved = action; }
+        }
+        var inputs = [];
+        var fields = form.querySelectorAll('input, textarea');
+        for (var j = 0; j < fields.length; j++) {
+            inputs.push(field(fields[j]));
+        }
+        result.forms.push({
+            action: resolved,
+            method: (form.getAttribute('method') || 'get').toLowerCase(),
+            inputs: inputs
+        });
+    }
+
+    // iframe 안의 독립 입력 필드는 해당 프레임 URL로 전송해야 하므로 프레임 URL을 함께 기록
+    var frameUrl = depth > 0 ? (doc.defaultView ? doc.defaultView.location.href : doc.URL) : null;
+    var fields = doc.querySelectorAll('input, textarea');
+    for (var i = 0; i < fields.length; i++) {
+        if (!fields[i].closest('form')) {
+            var entry = field(fields[i]);
+            if (frameUrl) {
+                entry.url = frameUrl;
+            }
+            result.inputs.push(entry);
+        }
+    }
+
+    if (depth >= 3) {
+        return;
+    }
+    var frames = doc.querySelectorAll('iframe, frame');
+    for (var i = 0; i < frames.length; i++) {
+        var frameDoc = null;
+        try { frameDoc = frames[i].contentDocument; } catch (e) { frameDoc = null; }  // 다른 출처 iframe
+        if (frameDoc && frameDoc.documentElement) {
+            collect(frameDoc, depth + 1);
+        }
+    }
+}
+
+collect(document, 0);
+return JSON.stringify(result);
+"""
+
+def extract_page_dynamic(driver, url, base_url):
+    """페이지의 링크, 폼, 독립 입력 필드를 브라우저 안에서 한 번에 추출 (iframe 안의 독립 입력 필드에는 프레임 URL('url')이 포함됨)"""
+    WebDriverWait(driver, 10).until(
+        EC.visibility_of_element_located((By.TAG_NAME, "body"))
+    )
+    extracted = json.loads(driver.execute_script(EXTRACT_PAGE_SCRIPT))
+
+    base_netloc = urlparse(base_url).netloc
+    urls = set()
+    for href in extracted['links']:
+        parsed_href = urlparse(href)
+        if parsed_href.scheme in ['http', 'https'] and parsed_href.netloc == base_netloc:
+            urls.add(href.rstrip('/'))
+
+    forms = [
+        {'action': form['action'] or url, 'method': form['method'], 'inputs': form['inputs']}
+        for form in extracted['forms']
+    ]
+    return urls, forms, extracted['inputs']
+
 def extract_forms_dynamic(driver, url):
     forms = []
     independent_inputs = []
@@ -94,93 +200,230 @@ def extract_forms_dynamic(driver, url):
         WebDriverWait(driver, 10).until(
             EC.visibility_of_element_located((By.TAG_NAME, "body"))
         )
-        page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
-
-        # 폼 정보 추출 (input과 textarea만 수집)
-        for form in soup.find_all('form'):
-            form_details = {}
-            action = form.get('action')
-            method = form.get('method', 'get').lower()
-            inputs = []
-
-            input_tags = form.find_all(['input', 'textarea'])
-            for input_tag in input_tags:
-                tag_name = input_tag.name
-                input_type = input_tag.get('type', tag_name)
-                input_name = input_tag.get('name')
-                inputs.append({'tag': tag_name, 'type': input_type, 'name': input_name})
-
-            form_details['action'] = urljoin(url, action) if action else url
-            form_details['method'] = method
-            form_details['inputs'] = inputs
-            forms.append(form_details)
-
-        # 폼 외부의 입력 필드 추출 (input과 textarea만 수집)
-        all_input_tags = soup.find_all(['input', 'textarea'])
-        for input_tag in all_input_tags:
-            if not input_tag.find_parent('form'):
-                tag_name = input_tag.name
-                input_type = input_tag.get('type', tag_name)
-                input_name = input_tag.get('name')
-                independent_inputs.append({'tag': tag_name, 'type': input_type, 'name': input_name})
+        # 폼 정보와 폼 외부의 입력 필드를 한 번의 순회로 추출 (input과 textarea만 수집)
+        forms, independent_inputs = extract_forms(driver.page_source, url)
 
     except Exception as e:
         logger.error(f"[DynamicCrawler] 폼 추출 중 오류 발생 - URL: {url}, 에러: {e}")
 
     return forms, independent_inputs
 
-def crawl_dynamic(driver, base_url, max_depth, visited_urls, extraction_results, robot_parser=None):
-    queue = deque()
-    queue.append((base_url, 0))  # (URL, 현재 깊이)
-
-    while queue:
-        current_url, depth = queue.popleft()
-
-        if current_url in visited_urls:
-            continue
+def visit_page_dynamic(driver, current_url, depth, base_url, visited_urls, extraction_results, robot_parser=None, lock=None, seen=None, checkpoint=None, throttle=None):
+    """한 페이지를 방문해 폼을 추출하고, 다음에 방문할 (URL, 깊이) 목록을 반환"""
+    lock = lock or threading.Lock()
+    logger.info(f"[DynamicCrawler] 방문 중: {current_url}, 깊이: {depth}")
+    if throttle is not None:
+        # 동시 요청 수와 Crawl-delay 간격은 공유하되, 렌더링까지 포함한 브라우저 로드 시간은 HTTP 응답 지연 시간과 비교할 수 없으므로 통계에 반영하지 않음
+        # (브라우저는 상태 코드도 알 수 없으므로 오류만 반영)
+        with throttle.slot(current_url, sample_latency=False):
+            driver.get(current_url)
+    else:
+        driver.get(current_url)
 
-        if depth > max_depth:
-            logger.info(f"[DynamicCrawler] 최대 깊이({max_depth}) 도달 - URL: {current_url}, 스킵.")
-            continue
+    current_after_redirect = driver.current_url
+    if seen is not None:
+        # 리다이렉트된 URL도 본 것으로 기록해 다시 큐에 들어가지 않도록 함
+        seen.add(current_after_redirect)
 
-        logger.info(f"[DynamicCrawler] 방문 중: {current_url}, 깊이: {depth}")
-        try:
-            driver.get(current_url)
+    # robots.txt에 의해 크롤링이 금지된 URL인지 확인
+    if robot_parser and not robot_parser.can_fetch("*", current_after_redirect):
+        logger.info(f"robots.txt에 의해 크롤링이 금지된 URL: {current_after_redirect}")
+        with lock:
+            visited_urls.add(current_after_redirect)
+        if checkpoint:
+            checkpoint.mark_visited(current_after_redirect)
+        return []
 
-            current_after_redirect = driver.current_url
-            parsed_current = urlparse(current_after_redirect)
+    with lock:
+        visited_urls.add(current_after_redirect)
+    if checkpoint:
+        checkpoint.mark_visited(current_after_redirect)
 
-            # robots.txt에 의해 크롤링이 금지된 URL인지 확인
-            if robot_parser and not robot_parser.can_fetch("*", current_after_redirect):
-                logger.info(f"robots.txt에 의해 크롤링이 금지된 URL: {current_after_redirect}")
-                visited_urls.add(current_after_redirect)
+    try:
+        new_urls, forms, independent_inputs = extract_page_dynamic(driver, current_after_redirect, base_url)
+    except Exception as e:
+        # 스크립트 실행이 실패하면 기존 방식(요소별 조회 + page_source 파싱)으로 추출
+        logger.warning(f"[DynamicCrawler] 스크립트 추출 실패, 기존 방식으로 추출 - URL: {current_after_redirect}, 에러: {e}")
+        forms, independent_inputs = extract_forms_dynamic(driver, current_after_redirect)
+        new_urls = extract_urls_dynamic(driver, base_url)
+    logger.info(f"[DynamicCrawler] 발견된 폼: {len(forms)}개, 독립 입력 필드: {len(independent_inputs)}개 - URL: {current_after_redirect}")
+
+    result = {
+        'url': current_after_redirect,
+        'forms': forms,
+        'independent_inputs': independent_inputs,
+        'fuzzing_results': []
+    }
+    with lock:
+        extraction_results.append(result)
+    if checkpoint:
+        checkpoint.save_result(result, current_url)
+
+    # 새로운 URL 추출
+    next_items = []
+    for url in new_urls:
+        with lock:
+            if url in visited_urls:
                 continue
+        if seen is not None and url in seen:
+            continue
+        if robot_parser and not robot_parser.can_fetch("*", url):
+            logger.info(f"robots.txt에 의해 크롤링이 금지된 URL: {url}")
+            continue
+        next_items.append((url, depth + 1))
+    return next_items
 
-            visited_urls.add(current_after_redirect)
-
-            forms, independent_inputs = extract_forms_dynamic(driver, current_after_redirect)
-            logger.info(f"[DynamicCrawler] 발견된 폼: {len(forms)}개, 독립 입력 필드: {len(independent_inputs)}개 - URL: {current_after_redirect}")
+def crawl_dynamic(driver, base_url, max_depth, visited_urls, extraction_results, robot_parser=None):
+    crawl_dynamic_pool([driver], base_url, max_depth, visited_urls, extraction_results, robot_parser)
+
+def crawl_dynamic_pool(drivers, base_url, max_depth, visited_urls, extraction_results, robot_parser=None, url_store='set', checkpoint=None, resume=False, throttle=None, driver_factory=None):
+    """브라우저 K개(len(drivers))가 공유 프론티어에서 (URL, 깊이)를 가져가 병렬로 크롤링
+
+    깊이 단위로 진행해(한 깊이의 페이지를 모두 방문한 뒤 다음 깊이 시작) 워커 수와 관계없이 각 URL이 가장 얕은 깊이로 방문됨.
+    연속으로 MAX_DRIVER_FAILURES번 방문에 실패한 브라우저는 driver_factory로 다시 만들거나(없으면 워커 종료),
+    실패한 URL은 서로 다른 브라우저 MAX_PAGE_ATTEMPTS개에서 실패할 때까지 프론티어에 다시 넣음.
+    checkpoint가 주어지면 프론티어/방문 URL/추출 결과를 기록하고, resume=True이면 마지막 체크포인트부터 이어서 진행
+    """
+    frontier = queue.Queue()
+    lock = threading.Lock()
+    seen = SeenIndex(create_url_store(url_store))  # 큐에 넣었거나 방문한 URL (표준 형태)
+    levels = {}  # 깊이 -> 아직 방문하지 않은 URL 목록 (다음 깊이에서 발견된 URL은 현재 깊이가 끝난 뒤 방문)
+    failed_on = {}  # URL -> 방문에 실패한 브라우저 집합
+    alive = len(drivers)  # 방문 가능한 브라우저 워커 수
+
+    if checkpoint and resume:
+        saved_depth = checkpoint.saved_max_depth()
+        if saved_depth is not None and saved_depth != max_depth:
+            raise ValueError(f"체크포인트의 최대 깊이({saved_depth})와 요청한 최대 깊이({max_depth})가 다릅니다.")
+        # 처리가 끝나지 않은 URL은 다시 방문하도록 방문 기록과 추출 결과에서 제외 (표준 형태로 비교)
+        pending = {}
+        for url, depth in checkpoint.iter_frontier(pending_only=False):
+            seen.add(url)
+        for url, depth in checkpoint.iter_frontier():
+            pending[canonicalize_url(url)] = (url, depth)
+        for url in checkpoint.iter_visited():
+            if canonicalize_url(url) not in pending:
+                visited_urls.add(url)
+                seen.add(url)
+        extraction_results.extend(result for frontier_url, result in checkpoint.iter_results() if canonicalize_url(frontier_url) not in pending)
+        for url, depth in pending.values():
+            levels.setdefault(depth, []).append(url)
+        logger.info(f"[DynamicCrawler] 체크포인트에서 재개 - 처리된 페이지: {len(extraction_results)}개, 남은 URL: {len(pending)}개")
+    else:
+        seen.add(base_url)
+        levels[0] = [base_url]  # (URL, 현재 깊이)
+        if checkpoint:
+            checkpoint.enqueue(base_url, 0)
+
+    def visit(driver, current_url, depth):
+        for next_url, next_depth in visit_page_dynamic(driver, current_url, depth, base_url, visited_urls, extraction_results, robot_parser, lock, seen, checkpoint, throttle):
+            # 최대 깊이를 넘는 URL은 큐에 넣지 않고, 표준 형태 기준으로 처음 보는 URL만 다음 깊이에 추가
+            if next_depth > max_depth:
+                continue
+            canonical_url = seen.add(next_url)
+            if canonical_url:
+                with lock:
+                    levels.setdefault(next_depth, []).append(canonical_url)
+                if checkpoint:
+                    checkpoint.enqueue(canonical_url, next_depth)
+
+    def failed(driver, item, error):
+        # 실패한 URL은 다른(또는 재시작한) 브라우저가 다시 방문하도록 프론티어에 되돌림 (처리 완료로 표시하지 않아 재개 시에도 다시 방문)
+        current_url = item[0]
+        with lock:
+            drivers_failed = failed_on.setdefault(current_url, set())
+            drivers_failed.add(driver)
+            retry = len(drivers_failed) < MAX_PAGE_ATTEMPTS
+        if retry:
+            logger.warning(f"[DynamicCrawler] 방문 중 오류 발생, 다시 시도합니다 - URL: {current_url}, 에러: {error}")
+            frontier.put(item)
+        else:
+            logger.error(f"[DynamicCrawler] 방문 중 오류 발생 - URL: {current_url}, 에러: {error}")
 
-            result = {
-                'url': current_after_redirect,
-                'forms': forms,
-                'independent_inputs': independent_inputs,
-                'fuzzing_results': []
-            }
-            extraction_results.append(result)
-
-            # 새로운 URL 추출 및 큐에 추가
-            new_urls = extract_urls_dynamic(driver, base_url)
-            for url in new_urls:
-                if url not in visited_urls:
-                    if robot_parser and not robot_parser.can_fetch("*", url):
-                        logger.info(f"robots.txt에 의해 크롤링이 금지된 URL: {url}")
+    def restart(index):
+        # 연속으로 실패한 브라우저를 새로 만들고, 만들 수 없으면 None
+        if driver_factory is None:
+            return None
+        try:
+            drivers[index].quit()
+        except Exception:
+            pass
+        try:
+            drivers[index] = driver_factory()
+        except Exception as e:
+            logger.error(f"[DynamicCrawler] 브라우저 재시작 실패: {e}")
+            return None
+        logger.info(f"[DynamicCrawler] 브라우저 워커 {index + 1}을 재시작했습니다.")
+        return drivers[index]
+
+    def worker(index):
+        nonlocal alive
+        driver = drivers[index]
+        failures = 0  # 이 브라우저의 연속 실패 횟수
+        while True:
+            item = frontier.get()
+            try:
+                if item is None:
+                    return
+                if driver is None:
+                    # 방문 가능한 브라우저가 하나도 남지 않으면 남은 URL은 방문하지 않고 비움 (체크포인트에는 처리되지 않은 URL로 남음)
+                    continue
+                current_url, depth = item
+
+                with lock:
+                    already_visited = current_url in visited_urls
+
+                if already_visited:
+                    pass
+                elif depth > max_depth:
+                    logger.info(f"[DynamicCrawler] 최대 깊이({max_depth}) 도달 - URL: {current_url}, 스킵.")
+                else:
+                    try:
+                        visit(driver, current_url, depth)
+                    except Exception as e:
+                        failed(driver, item, e)
+                        failures += 1
+                        if failures >= MAX_DRIVER_FAILURES:
+                            logger.error(f"[DynamicCrawler] 브라우저 워커 {index + 1}이 연속 {failures}번 실패했습니다.")
+                            failures = 0
+                            driver = restart(index)
+                            if driver is None:
+                                with lock:
+                                    alive -= 1
+                                    last = alive == 0
+                                if not last:
+                                    logger.error(f"[DynamicCrawler] 브라우저 워커 {index + 1}을 종료합니다.")
+                                    return
+                                logger.error("[DynamicCrawler] 방문 가능한 브라우저가 없어 남은 URL을 방문하지 않습니다.")
                         continue
-                    queue.append((url, depth + 1))
+                    failures = 0
 
-        except Exception as e:
-            logger.error(f"[DynamicCrawler] 방문 중 오류 발생 - URL: {current_url}, 에러: {e}")
+                if checkpoint:
+                    checkpoint.complete(current_url)
+            finally:
+                frontier.task_done()
+
+    threads = [
+        threading.Thread(target=worker, args=(index,), name=f"DynamicCrawler-{index + 1}", daemon=True)
+        for index in range(len(drivers))
+    ]
+    for thread in threads:
+        thread.start()
+
+    # 깊이 순서대로 한 깊이의 URL을 모두 처리한 뒤 다음 깊이로 진행
+    while levels and alive:
+        depth = min(levels)
+        with lock:
+            urls = levels.pop(depth)
+        for url in urls:
+            frontier.put((url, depth))
+        frontier.join()
+
+    # 종료 신호 전달 (이미 종료된 워커 몫의 신호는 큐에 남아도 무방)
+    for _ in threads:
+        frontier.put(None)
+    for thread in threads:
+        thread.join()
 
 # 퍼징 모듈 정의
 
@@ -211,91 +454,401 @@ command_injection_payloads = [
     "`reboot`",
 ]
 
+# 페이로드별 취약점 유형
+PAYLOAD_TYPES = {
+    **{payload: 'SQL Injection' for payload in sql_injection_payloads},
+    **{payload: 'XSS' for payload in xss_payloads},
+    **{payload: 'Command Injection' for payload in command_injection_payloads},
+}
+
 class AsyncFuzzer:
-    def __init__(self, forms, payloads, concurrency=10):
+    def __init__(self, forms, payloads, concurrency=10, max_response_bytes=1024 * 1024, chunk_size=16 * 1024, throttle=None,
+                 retry=None, breaker=None, connect_timeout=5, read_timeout=15, scan_policy=DEFAULT_SCAN_POLICY,
+                 budget=None, pairwise=False, sink=None):
+        if scan_policy not in SCAN_POLICIES:
+            raise ValueError(f"지원하지 않는 퍼징 정책: {scan_policy} (사용 가능: {', '.join(SCAN_POLICIES)})")
         self.forms = forms
         self.payloads = payloads
-        self.concurrency = concurrency
-        self.vulnerabilities = []
-        self.attempts = []  # 퍼징 시도 내역을 저장할 리스트
-
-    async def fuzz_form(self, session, form, payload):
+        self.scan_policy = scan_policy
+        self.confirmed = set()  # 취약점이 확인된 (폼 시그니처, 취약점 유형)과 (폼 시그니처, 필드, 취약점 유형)
+        self.budget = budget or ScanBudget()
+        self.pairwise = pairwise  # 단일 필드 주입 뒤 상위 필드 쌍에도 동시에 주입
+        self._form_keys = {id(form): form_signature(form) for form in forms}
+        self.reflections = {}  # 폼 시그니처 -> {반사되는 필드 이름: [문맥, ...]} (사전 확인 실패 시 None)
+        self.skipped_jobs = 0  # 정책에 의해 보내지 않은 작업 수
+        self.concurrency = concurrency  # 전체 워커 수 (호스트별 동시 요청 수는 throttle이 조절)
+        self.throttle = throttle or HostThrottle(max_limit=concurrency)
+        self.retry = retry or RetryPolicy()
+        # 연속으로 실패하는 호스트/엔드포인트는 남은 작업을 요청 없이 바로 건너뜀
+        self.breaker = breaker or CircuitBreaker()
+        self.timeout = aiohttp.ClientTimeout(total=None, connect=connect_timeout, sock_read=read_timeout)
+        self.max_response_bytes = max_response_bytes  # 응답 하나에서 읽을 최대 바이트 수
+        self.chunk_size = chunk_size
+        # 퍼징 시도/취약점 기록 위치 (기본은 메모리, 대규모 스캔은 JsonlSpool로 파일에 기록하고 집계만 메모리에 유지)
+        self.sink = sink or MemorySink()
+        self.attempts = self.sink.attempts
+        self.vulnerabilities = self.sink.findings
+        self.analyzer = ResponseAnalyzer({payload: PAYLOAD_TYPES[payload] for payload in payloads if payload in PAYLOAD_TYPES})
+        self.baselines = BaselineCache(self.analyzer, self.fetch_baseline)
+        # 1단계 검사에서 나온 후보만 확인용 요청으로 2단계 확인
+        self.confirmer = Confirmer(self.analyzer, self.send_probe, self.form_key)
+        self.unconfirmed = 0  # 확인되지 않아 제외한 후보 수
+
+    def build_data(self, form, value, fields=None):
+        """fields가 주어지면 해당 필드에만, 아니면 텍스트 필드 전체에 value를 넣고 나머지 입력 필드는 'test'로 채움"""
         data = {}
+        if form['method'] != 'post':
+            # action URL에 있던 GET 파라미터는 원래 값으로 함께 전송
+            data.update(parse_qsl(urlsplit(form['action']).query, keep_blank_values=True))
         for input_field in form['inputs']:
-            if input_field['type'] == 'text':
-                data[input_field['name']] = payload
+            if fields is None:
+                targeted = input_field['type'] == 'text'
             else:
-                data[input_field['name']] = 'test'
+                targeted = input_field['name'] in fields
+            data[input_field['name']] = value if targeted else 'test'
+        if fields is not None:
+            data.update((name, value) for name in fields if name in data)
+        return data
+
+    def send(self, session, form, data):
+        if form['method'] == 'post':
+            return session.post(form['action'], data=data)
+        # GET 파라미터는 모두 data에 들어 있으므로 action URL의 쿼리는 제거
+        return session.get(urlunsplit(urlsplit(form['action'])._replace(query='')), params=data)
+
+    async def probe_reflections(self, session, form):
+        """모든 필드(GET 파라미터 포함)에 서로 다른 canary를 넣은 요청 하나로 응답에 반사되는 필드와 문맥을 확인"""
+        key = self.form_key(form)
+        canaries = make_canaries(name for name in self.build_data(form, BENIGN_VALUE) if name)
+
+        async def handle(response):
+            return find_reflections(await self.read_body(response), canaries)
+
         try:
-            if form['method'] == 'post':
-                async with session.post(form['action'], data=data) as response:
-                    text = await response.text()
-                    self.analyze_response(text, payload, form, response.status)
-            else:
-                async with session.get(form['action'], params=data) as response:
-                    text = await response.text()
-                    self.analyze_response(text, payload, form, response.status)
+            reflections = await self.request(session, form, canaries, handle)
+        except Exception as e:
+            # 확인에 실패한 폼은 기존처럼 모든 반사형 페이로드를 텍스트 필드에 전송
+            logger.warning(f"[AsyncFuzzer] 반사 확인 요청 실패 - 폼: {form['action']}, 에러: {e}")
+            reflections = None
+        else:
+            if reflections:
+                logger.info(f"[AsyncFuzzer] 반사되는 필드 발견 - 폼: {form['action']}, 필드: {reflections}")
+        self.reflections[key] = reflections
+
+    def ranked_fields(self, form):
+        # 필드 타입과 반사 여부로 정렬한 주입 대상 필드
+        return injectable_fields(form, self.reflections.get(self.form_key(form)))
+
+    def target_fields(self, form, payload, fields):
+        """페이로드를 넣을 수 있는 필드 - 반사형 페이로드는 반사가 확인된 필드만 (사전 확인 결과가 없으면 전체)"""
+        if PAYLOAD_TYPES.get(payload) not in REFLECTION_TYPES:
+            return fields
+        reflections = self.reflections.get(self.form_key(form))
+        if reflections is None:
+            return fields
+        return [field for field in fields if field in reflections]
+
+    async def request(self, session, form, data, handle, timed=False, sample_latency=True):
+        """서킷 확인 -> 요청 -> handle(response) 순서로 처리하고, 타임아웃/연결 오류와 재시도 대상 상태 코드는 백오프 후 재시도
+
+        timed=True면 (handle 결과, 전송부터 handle 종료까지의 시간)을 반환 (슬롯 대기와 백오프는 포함하지 않음).
+        sample_latency=False면 일부러 느리게 만든 응답이 호스트 동시 요청 한도를 줄이지 않도록 지연 시간을 throttle에 반영하지 않음.
+        서킷이 열려 있으면 CircuitOpenError를, 재시도를 모두 소진하면 마지막 오류를 발생시킴
+        """
+        url = form['action']
+        error = None
+        for attempt in range(self.retry.retries + 1):
+            blocked = self.breaker.check(url)
+            if blocked is not None:
+                # 이미 요청을 보낸 작업은 건너뜀이 아닌 마지막 실패 원인으로 기록
+                raise error if attempt else blocked
+            retry_after = None
+            try:
+                async with self.throttle.slot_async(url, sample_latency=sample_latency) as slot:
+                    started = time.monotonic()
+                    async with self.send(session, form, data) as response:
+                        slot.observe(response.status, response.headers.get('Retry-After'))
+                        if response.status in self.retry.retry_statuses and attempt < self.retry.retries:
+                            # 과부하/게이트웨이 오류 응답은 분석하지 않고 다시 시도
+                            retry_after = slot.retry_after
+                            error = aiohttp.ClientResponseError(response.request_info, response.history, status=response.status)
+                        else:
+                            result = await handle(response)
+                            if timed:
+                                result = result, time.monotonic() - started
+                            error = None
+                if response.status in (502, 503, 504):
+                    self.breaker.failure(url)
+                else:
+                    self.breaker.success(url)
+                if error is None:
+                    return result
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.breaker.failure(url)
+                error = e
+                if attempt == self.retry.retries:
+                    raise
+            except BaseException:
+                # handle()의 예외나 작업 취소로 끝난 요청이 half-open 시험 요청이었다면 서킷이 계속 막히지 않도록 해제
+                self.breaker.abandon(url)
+                raise
+            delay = self.retry.delay(attempt, retry_after)
+            logger.debug(f"[AsyncFuzzer] 재시도 {attempt + 1}/{self.retry.retries} - 폼: {url}, {delay:.2f}초 후, 원인: {error!r}")
+            await asyncio.sleep(delay)
+
+    def charge(self, form):
+        """요청 하나를 예산에 반영하고 한도를 넘으면 False를 반환 (서킷이 열려 있으면 예산을 쓰지 않고 CircuitOpenError 발생)"""
+        blocked = self.breaker.peek(form['action'])
+        if blocked is not None:
+            raise blocked
+        return self.budget.charge(self.form_key(form), urlparse(form['action']).netloc.lower())
+
+    async def send_probe(self, session, form, fields, value, timing=False):
+        # 확인용 요청 - (상태 코드, 본문, 소요 시간)을 반환 (확인용 요청도 예산에 포함하며, 한도를 넘으면 확인을 중단)
+        # timing=True는 sleep처럼 응답 시간 자체를 비교하는 요청 (throttle 지연 시간 통계에서 제외)
+        if not self.charge(form):
+            raise BudgetExceededError(self.form_key(form), urlparse(form['action']).netloc.lower())
+
+        async def handle(response):
+            return response.status, await self.read_body(response)
+
+        (status, body), elapsed = await self.request(session, form, self.build_data(form, value, fields), handle, timed=True, sample_latency=not timing)
+        return status, body, elapsed
+
+    async def read_body(self, response):
+        """응답 본문을 최대 max_response_bytes까지 끝까지 읽음 (content.read(n)은 이미 도착한 만큼만 반환하므로 사용하지 않음)"""
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(self.chunk_size):
+            body += chunk[:self.max_response_bytes - len(body)]
+            if len(body) >= self.max_response_bytes:
+                logger.debug(f"[AsyncFuzzer] 응답 크기 제한({self.max_response_bytes}바이트) 도달 - URL: {response.url}")
+                break
+        return bytes(body)
+
+    async def fetch_baseline(self, session, form):
+        # 모든 텍스트 필드에 무해한 값을 넣은 요청으로 기준 응답을 가져옴
+        async def handle(response):
+            return response.status, await self.read_body(response)
+        return await self.request(session, form, self.build_data(form, BENIGN_VALUE), handle)
+
+    def is_settled(self, form, payload, fields=()):
+        """정책상 더 보낼 필요가 없는 작업이면 True ('first': 같은 폼/유형, 'per-field': 같은 폼/필드/유형에 확인된 취약점 존재)"""
+        if self.scan_policy == 'first':
+            return (self.form_key(form), PAYLOAD_TYPES.get(payload)) in self.confirmed
+        if self.scan_policy == 'per-field':
+            return (self.form_key(form), tuple(fields), PAYLOAD_TYPES.get(payload)) in self.confirmed
+        return False
+
+    def form_key(self, form):
+        key = self._form_keys.get(id(form))
+        return key if key is not None else form_signature(form)
+
+    async def fuzz_form(self, session, form, payload, fields=None):
+        # fields: 페이로드를 넣을 필드 이름 (None이면 텍스트 필드 전체)
+        if self.is_settled(form, payload, fields or ()):
+            # 큐에 들어간 뒤 같은 유형의 취약점이 확인된 작업은 보내지 않음
+            self.skipped_jobs += 1
+            return
+        parameter = ', '.join(fields) if fields else None
+        try:
+            if not self.charge(form):
+                return
+            baseline = await self.baselines.get(session, form)
+            data = self.build_data(form, payload, fields)
+            vuln_type, status, evidence, delta = await self.request(session, form, data, lambda response: self.read_and_analyze(response, payload, form, baseline))
+            confirmation = None
+            if vuln_type and not self.is_settled(form, payload, fields or ()):
+                # 2단계: 후보에 대해서만 확인용 요청을 보내 확정
+                confirmed, confirmation = await self.confirmer.confirm(session, form, fields, vuln_type, baseline)
+                if not confirmed:
+                    logger.debug(f"[AsyncFuzzer] 확인되지 않은 후보 제외 - 폼: {form['action']}, 파라미터: {parameter}, 페이로드: '{payload}', 유형: {vuln_type}")
+                    self.unconfirmed += 1
+                    vuln_type = None
+            self.record_result(vuln_type, payload, form, status, evidence, delta, fields, confirmation)
+        except CircuitOpenError as e:
+            # 서킷이 열린 호스트/엔드포인트의 남은 작업은 요청 없이 건너뜀으로 기록
+            logger.debug(f"[AsyncFuzzer] 건너뜀 - 폼: {form['action']}, 페이로드: '{payload}', 원인: {e}")
+            self.sink.add_attempt({
+                'form_action': form['action'],
+                'parameter': parameter,
+                'payload': payload,
+                'result': f"건너뜀: {e}"
+            })
         except Exception as e:
             logger.error(f"[AsyncFuzzer] 요청 실패 - 폼: {form['action']}, 페이로드: '{payload}', 에러: {e}")
-            self.attempts.append({
+            self.sink.add_attempt({
                 'form_action': form['action'],
+                'parameter': parameter,
                 'payload': payload,
                 'result': f"요청 실패: {e}"
             })
             return
 
-    def analyze_response(self, text, payload, form, status):
-        vulnerability_detected = False
+    async def read_and_analyze(self, response, payload, form, baseline=None):
+        """1단계 검사: 응답을 최대 max_response_bytes까지 읽어 원본 바이트 그대로 검사
+
+        기준 응답이 있으면(반사형 제외) 본문을 먼저 끝까지 읽고, 정규화한 해시가 기준 응답과 같으면 패턴 검사 없이 제외.
+        그 외에는 청크 단위로 검사하다가 후보 판정이 나면 즉시 읽기를 중단.
+        기준 응답에도 있던 시그니처는 근거로 쓰지 않으며, (후보 유형 또는 None, 상태 코드, 증거, 기준 응답 대비 변화)를 반환
+        """
+        # 증거 구간을 디코딩할 문자셋은 응답 헤더에서 가져옴 (본문 기반 문자셋 추정은 하지 않음)
+        ignore = baseline.signatures if baseline is not None else frozenset()
+        scanner = self.analyzer.stream(payload, response.charset or 'utf-8', ignore)
+
+        if baseline is not None and PAYLOAD_TYPES.get(payload) not in REFLECTION_TYPES:
+            # 해시 비교 한 번으로 기준 응답과 같은(페이로드가 영향을 주지 않은) 응답을 걸러냄
+            # (반사형은 페이로드가 그대로 나타난 것 자체가 근거이므로 비교하지 않음)
+            body = await self.read_body(response)
+            if BaselineCache.is_unchanged(baseline, response.status, body, payload):
+                logger.debug(f"[AsyncFuzzer] 기준 응답과 동일해 제외 - 폼: {form['action']}, 페이로드: '{payload}'")
+                return None, response.status, None, self.describe_delta(baseline, response.status, body)
+            scanner.feed(body)
+        else:
+            body = bytearray()
+            async for chunk in response.content.iter_chunked(self.chunk_size):
+                chunk = chunk[:self.max_response_bytes - len(body)]
+                body += chunk
+                if scanner.feed(chunk):
+                    break
+                if len(body) >= self.max_response_bytes:
+                    logger.debug(f"[AsyncFuzzer] 응답 크기 제한({self.max_response_bytes}바이트) 도달 - 폼: {form['action']}")
+                    break
+
+        vuln_type, hits = scanner.finish()
+        evidence = scanner.evidence
+        if vuln_type is None and self.is_server_error(baseline, response.status) and PAYLOAD_TYPES.get(payload) in STATUS_CHANGE_TYPES:
+            vuln_type = PAYLOAD_TYPES[payload]
+            evidence = f"상태 코드 변화: {baseline.status} -> {response.status}"
+        return vuln_type, response.status, evidence, self.describe_delta(baseline, response.status, body)
+
+    @staticmethod
+    def is_server_error(baseline, status):
+        # 기준 응답은 정상인데 페이로드를 넣은 응답만 서버 오류인 경우
+        return baseline is not None and baseline.status < 500 <= status
+
+    def describe_delta(self, baseline, status, body):
+        # 리포트에 남길 기준 응답 대비 변화 (상태 코드, 길이 차이)
+        if baseline is None:
+            return None
+        return {
+            'baseline_status': baseline.status,
+            'status_changed': status != baseline.status,
+            'length_delta': len(body) - baseline.length
+        }
+
+    def record_result(self, vuln_type, payload, form, status, evidence=None, delta=None, fields=None, confirmation=None):
         result = "취약점 없음"
-        # SQL Injection 분석
-        if payload in sql_injection_payloads and ("error" in text.lower() or "sql" in text.lower() or "syntax" in text.lower()):
-            self.vulnerabilities.append({
-                'type': 'SQL Injection',
-                'payload': payload,
-                'form': form['action'],
-                'response_code': status
-            })
-            vulnerability_detected = True
-            result = "SQL Injection 취약점 발견"
-        # XSS 분석
-        elif payload in xss_payloads and payload in text:
-            self.vulnerabilities.append({
-                'type': 'XSS',
+        parameter = ', '.join(fields) if fields else None
+        if vuln_type and self.is_settled(form, payload, fields or ()):
+            # 전송 중에 같은 키의 취약점이 먼저 확정된 작업은 정책상 중복이므로 시도만 기록
+            logger.debug(f"[AsyncFuzzer] 이미 확인된 취약점이라 중복 제외 - 폼: {form['action']}, 파라미터: {parameter}, 페이로드: '{payload}', 유형: {vuln_type}")
+            result = f"중복 제외: {vuln_type} 취약점 이미 확인됨"
+        elif vuln_type:
+            self.sink.add_finding({
+                'type': vuln_type,
                 'payload': payload,
                 'form': form['action'],
-                'response_code': status
+                'parameter': parameter,
+                'response_code': status,
+                'evidence': evidence,
+                'confirmation': confirmation,
+                'baseline_delta': delta
             })
-            vulnerability_detected = True
-            result = "XSS 취약점 발견"
-        # Command Injection 분석
-        elif payload in command_injection_payloads and ("root:" in text or "uid=" in text or "command not found" not in text):
-            self.vulnerabilities.append({
-                'type': 'Command Injection',
-                'payload': payload,
-                'form': form['action'],
-                'response_code': status
-            })
-            vulnerability_detected = True
-            result = "Command Injection 취약점 발견"
-
-        if vulnerability_detected:
-            logger.info(f"[AsyncFuzzer] 취약점 발견 - 폼: {form['action']}, 페이로드: '{payload}', 유형: {self.vulnerabilities[-1]['type']}")
+            result = f"{vuln_type} 취약점 발견"
+            self.confirmed.add((self.form_key(form), vuln_type))
+            self.confirmed.add((self.form_key(form), tuple(fields or ()), vuln_type))
+            logger.info(f"[AsyncFuzzer] 취약점 발견 - 폼: {form['action']}, 파라미터: {parameter}, 페이로드: '{payload}', 유형: {vuln_type}")
 
         # 퍼징 시도 내역 기록
-        self.attempts.append({
+        self.sink.add_attempt({
             'form_action': form['action'],
+            'parameter': parameter,
             'payload': payload,
+            'response_code': status,
             'result': result
         })
 
+    def iter_jobs(self):
+        """필드별 (폼, 페이로드, 필드) 주입 작업을 우선순위 순으로 필요할 때마다 하나씩 생성
+
+        폼들을 번갈아 가며 생성해 한 폼의 같은 유형 페이로드가 한꺼번에 전송 중이 되지 않도록 하고,
+        정책상 더 보낼 필요가 없거나 예산을 다 쓴 폼/호스트의 작업은 생성하지 않음
+        """
+        def skip(form, payload, fields):
+            if self.is_settled(form, payload, fields):
+                self.skipped_jobs += 1
+                return True
+            return False
+
+        return InjectionScheduler(
+            self.forms, self.payloads, self.ranked_fields, self.target_fields, self.form_key,
+            budget=self.budget, skip=skip, pairwise=self.pairwise
+        )
+
+    async def worker(self, jobs, handle):
+        while True:
+            job = await jobs.get()
+            try:
+                if job is None:
+                    return
+                await handle(*job)
+            except Exception as e:
+                logger.error(f"[AsyncFuzzer] 작업 처리 중 오류 발생 - 폼: {job[0]['action']}, 에러: {e}")
+            finally:
+                jobs.task_done()
+
+    async def run_jobs(self, jobs_iter, handle):
+        # 크기가 제한된 큐로 생산자를 막아(backpressure) 메모리 사용량을 작업 수가 아닌 동시성에 비례하게 유지
+        jobs = asyncio.Queue(maxsize=self.concurrency * 2)
+        workers = [asyncio.create_task(self.worker(jobs, handle)) for _ in range(self.concurrency)]
+        for job in jobs_iter:
+            await jobs.put(job)
+        for _ in workers:
+            await jobs.put(None)
+        await asyncio.gather(*workers)
+
     async def run(self):
         connector = aiohttp.TCPConnector(limit=self.concurrency)
-        async with aiohttp.ClientSession(connector=connector) as session:
-            tasks = []
-            for form in self.forms:
-                for payload in self.payloads:
-                    tasks.append(self.fuzz_form(session, form, payload))
-            await asyncio.gather(*tasks)
+        async with aiohttp.ClientSession(connector=connector, timeout=self.timeout) as session:
+            if any(PAYLOAD_TYPES.get(payload) in REFLECTION_TYPES for payload in self.payloads):
+                # 폼마다 요청 하나로 반사되는 필드를 먼저 확인
+                await self.run_jobs(((form,) for form in self.forms), lambda form: self.probe_reflections(session, form))
+                reflective = sum(1 for reflections in self.reflections.values() if reflections != {})
+                logger.info(f"[AsyncFuzzer] 반사 확인 완료 - 폼 {len(self.forms)}개 중 {reflective}개에 반사형 페이로드를 전송합니다.")
+            await self.run_jobs(self.iter_jobs(), lambda form, payload, fields: self.fuzz_form(session, form, payload, fields))
+        if self.skipped_jobs:
+            logger.info(f"[AsyncFuzzer] 취약점이 이미 확인된 작업 {self.skipped_jobs}개를 보내지 않았습니다.")
+        if self.unconfirmed:
+            logger.info(f"[AsyncFuzzer] 확인 요청 {self.confirmer.probes_sent}개로 후보를 확인했고, 확인되지 않은 후보 {self.unconfirmed}개를 제외했습니다.")
+        if self.budget.skipped or self.budget.exhausted():
+            logger.info(f"[AsyncFuzzer] 퍼징 예산 한도로 일부 작업을 보내지 않았습니다 - 전송한 요청: {self.budget.count}개")
+
+def index_forms(extraction_results):
+    """페이지별 추출 결과의 폼과 독립 입력 필드를 FormIndex에 모음 (여러 페이지에 반복되는 같은 폼은 한 번만 퍼징)"""
+    form_index = FormIndex()
+    for result in extraction_results:
+        for form in result['forms']:
+            # 입력 필드가 없는 폼 제외
+            if form['inputs']:
+                form_index.add(form, result['url'])
+        # 독립 입력 필드를 별도의 폼으로 취급 (iframe 안의 필드는 프레임 URL로 전송)
+        for input_field in result['independent_inputs']:
+            if input_field['name']:
+                input_field = dict(input_field)
+                action = input_field.pop('url', None) or result['url']
+                form_index.add({
+                    'action': action,
+                    'method': 'get',
+                    'inputs': [input_field]
+                }, result['url'])
+    return form_index
+
+def create_driver():
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--no-sandbox")
+    return webdriver.Chrome(options=chrome_options)
 
 def main():
     base_url = input("크롤링할 기본 URL을 입력하세요: ").strip()
@@ -304,18 +857,42 @@ def main():
     except ValueError:
         logger.error("최대 크롤링 깊이는 정수여야 합니다.")
         return
+    try:
+        dynamic_workers = int(input(f"동시에 실행할 브라우저 수를 입력하세요 (기본값 {DEFAULT_DYNAMIC_WORKERS}): ").strip() or DEFAULT_DYNAMIC_WORKERS)
+    except ValueError:
+        logger.error("브라우저 수는 정수여야 합니다.")
+        return
+    report_formats = parse_report_formats(input(f"리포트 형식을 입력하세요 ({', '.join(REPORT_FORMATS)} 중 쉼표로 여러 개, 기본값 pdf): "))
+
+    # 크롤링 체크포인트 확인
+    checkpoint = CrawlCheckpoint(CHECKPOINT_PATH)
+    resume = False
+    if checkpoint.can_resume(base_url):
+        resume = input("완료되지 않은 이전 크롤링 체크포인트가 있습니다. 이어서 진행할까요? (y/N): ").strip().lower() == 'y'
+    if resume:
+        # 재개할 때는 체크포인트를 만들 때의 최대 깊이를 사용 (깊이가 달라지면 이미 처리한 페이지의 링크 수집 범위가 맞지 않음)
+        saved_depth = checkpoint.saved_max_depth()
+        if saved_depth is not None and saved_depth != max_depth:
+            logger.warning(f"[Main] 체크포인트의 최대 크롤링 깊이({saved_depth})로 이어서 진행합니다 (입력한 깊이: {max_depth}).")
+            max_depth = saved_depth
+    else:
+        checkpoint.reset(base_url, max_depth)
+
+    # 이번 스캔 기록 시작
+    store = ScanStore(SCAN_DB_PATH)
+    scan_id = store.start_scan(base_url, max_depth)
 
     # robots.txt 체크
     robots_url = urljoin(base_url, '/robots.txt')  # 올바른 robots.txt URL 생성
-    rp = urllib.robotparser.RobotFileParser()
+    rp = None
     try:
         response = requests.get(robots_url, timeout=10)
         if response.status_code == 200:
-            rp.parse(response.text.splitlines())
+            # 규칙을 한 번 컴파일해 두고 경로별 판정 결과를 캐시
+            rp = RobotsRules.parse(response.text)
             logger.info("robots.txt가 발견되었습니다. 크롤링 규칙을 따릅니다.")
         else:
             logger.info("robots.txt가 존재하지 않습니다. 크롤링 규칙을 제한하지 않습니다.")
-            rp = None
     except requests.RequestException as e:
         # robots.txt 접근 실패 시 상태 코드와 에러 이유를 로깅
         if hasattr(e, 'response') and e.response is not None:
@@ -323,49 +900,59 @@ def main():
             logger.error(f"robots.txt 접근 실패 - 상태 코드: {status_code}, 에러: {e}")
         else:
             logger.error(f"robots.txt 접근 실패 - 에러: {e}")
-        rp = None
+
+    # 호스트별 동시 요청 한도는 정적/동적 크롤러와 퍼저가 함께 사용 (과부하 신호가 다음 단계에도 이어지도록)
+    throttle = HostThrottle(initial_limit=4, max_limit=FUZZ_MAX_CONCURRENCY)
+    if rp:
+        throttle.set_crawl_delay(base_url, rp.crawl_delay("*"))
 
     # 정적 크롤러 초기화 및 실행
-    static_crawler = StaticCrawler(base_url, rp)
-    static_crawled_urls = static_crawler.crawl()
+    scope = CrawlScope(base_url, robots=rp)
+    static_crawler = StaticCrawler(base_url, rp, concurrency=10, per_host_limit=4, url_store=URL_STORE, scope=scope, throttle=throttle)
+    static_crawled_urls = checkpoint.load_static_urls() if resume else None
+    if static_crawled_urls is None:
+        static_crawled_urls = static_crawler.crawl()
+        checkpoint.save_static_urls(static_crawled_urls)
+    else:
+        logger.info(f"[StaticCrawler] 체크포인트의 정적 크롤링 결과 사용: {len(static_crawled_urls)}개의 URL")
 
-    # Selenium WebDriver 초기화 (헤드리스 모드)
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--no-sandbox")
-    try:
-        driver = webdriver.Chrome(options=chrome_options)
-    except Exception as e:
-        logger.error(f"Selenium WebDriver 초기화 실패: {e}")
+    # Selenium WebDriver 초기화 (헤드리스 모드, 브라우저 워커 수만큼)
+    drivers = []
+    for _ in range(max(1, dynamic_workers)):
+        try:
+            drivers.append(create_driver())
+        except Exception as e:
+            logger.error(f"Selenium WebDriver 초기화 실패: {e}")
+            break
+    if not drivers:
+        checkpoint.close()
+        store.close()
         return
+    logger.info(f"[DynamicCrawler] 브라우저 워커 {len(drivers)}개로 크롤링을 시작합니다.")
 
-    visited_urls_dynamic = set()
+    visited_urls_dynamic = create_url_store(URL_STORE)
     extraction_results_dynamic = []
 
     try:
-        crawl_dynamic(driver, base_url, max_depth, visited_urls_dynamic, extraction_results_dynamic, rp)
+        crawl_dynamic_pool(drivers, base_url, max_depth, visited_urls_dynamic, extraction_results_dynamic, rp, URL_STORE, checkpoint, resume, throttle, driver_factory=create_driver)
     finally:
-        driver.quit()
+        for driver in drivers:
+            driver.quit()
+        checkpoint.close()
 
     # 정적 및 동적 크롤러에서 수집한 URL 결합
-    combined_urls = static_crawled_urls.union(visited_urls_dynamic)
-
-    # 동적 크롤러 결과에서 폼 추출
-    forms = []
-    for result in extraction_results_dynamic:
-        forms.extend(result['forms'])
-        # 독립 입력 필드를 별도의 폼으로 취급
-        for input_field in result['independent_inputs']:
-            if input_field['name']:
-                forms.append({
-                    'action': result['url'],
-                    'method': 'get',
-                    'inputs': [input_field]
-                })
+    if isinstance(visited_urls_dynamic, set):
+        combined_urls = static_crawled_urls.union(visited_urls_dynamic)
+    else:
+        # 압축 저장소는 URL 문자열을 보관하지 않으므로 추출 결과의 URL을 사용
+        combined_urls = static_crawled_urls.union(result['url'] for result in extraction_results_dynamic)
 
-    # 입력 필드가 없는 폼 제거
-    forms = [form for form in forms if form['inputs']]
+    # 동적 크롤러 결과에서 폼 추출 (여러 페이지에 반복되는 같은 폼은 한 번만 퍼징)
+    form_index = index_forms(extraction_results_dynamic)
+    forms = form_index.forms()
+    logger.info(f"[Main] 폼 중복 제거: 전체 {form_index.total}개 중 고유한 폼 {len(forms)}개를 퍼징합니다.")
+    store.add_pages(scan_id, combined_urls)
+    store.add_forms(scan_id, forms)
 
     if not forms:
         logger.info("[Main] 퍼징할 폼이 발견되지 않았습니다.")
@@ -374,20 +961,45 @@ def main():
     else:
         # 비동기 퍼저 초기화 및 실행
         payloads = sql_injection_payloads + xss_payloads + command_injection_payloads
-        fuzzer = AsyncFuzzer(forms, payloads, concurrency=10)
-        asyncio.run(fuzzer.run())
+        budget = ScanBudget(per_form=FORM_REQUEST_BUDGET, time_limit=FUZZ_TIME_LIMIT)
+        # 시도 내역은 스풀 파일에 바로 기록하고, 리포트는 스풀에서 다시 읽음
+        # 스캔 결과 데이터베이스에도 같은 내용을 일괄 기록
+        spool = JsonlSpool(RESULT_SPOOL_PATH)
+        sink = TeeSink(spool, store.recorder(scan_id))
+        fuzzer = AsyncFuzzer(forms, payloads, concurrency=FUZZ_MAX_CONCURRENCY, throttle=throttle, budget=budget, sink=sink)
+        try:
+            asyncio.run(fuzzer.run())
+        finally:
+            sink.close()
         vulnerabilities = fuzzer.vulnerabilities
-        attempts = fuzzer.attempts  # 퍼징 시도 내역 가져오기
+        attempts = fuzzer.attempts  # 퍼징 시도 내역 (스풀에서 순회할 때마다 읽어옴)
+
+    store.finish_scan(scan_id)
+    previous_scan_id = store.previous_scan(scan_id)
+    if previous_scan_id is not None:
+        # 직전 스캔과 취약점 비교
+        diff = store.diff(previous_scan_id, scan_id)
+        logger.info(
+            f"[Main] 직전 스캔(#{previous_scan_id}) 대비 - 새 취약점: {len(diff['new'])}개, "
+            f"해결된 취약점: {len(diff['fixed'])}개, 유지된 취약점: {len(diff['persisting'])}개"
+        )
+        for finding in diff['new']:
+            logger.info(f"[Main] 새 취약점 - 유형: {finding['type']}, 폼: {finding['form_action']}, 파라미터: {finding['parameter']}")
+    logger.info(f"[Main] 스캔 #{scan_id} 결과를 저장했습니다: {SCAN_DB_PATH}")
 
-    # PDF 리포트 생성
-    generate_pdf_report(
+    # 리포트 생성 (선택한 형식마다 fuzzer_report.<확장자>)
+    generate_reports(
+        report_formats,
         crawled_urls=combined_urls,
         extraction_results=extraction_results_dynamic,
         vulnerabilities=vulnerabilities if vulnerabilities else [],
         attempts=attempts if attempts else [],
-        output_path='fuzzer_report.pdf'
+        output_base='fuzzer_report',
+        unique_forms=forms,
+        non_vulnerable_mode=REPORT_NON_VULNERABLE_MODE
     )
 
+    store.close()
     logger.info("[Main] 웹 퍼징이 완료되었습니다.")
 
 if __name__ == "__main__":
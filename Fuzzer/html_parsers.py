@@ -0,0 +1,174 @@
+import logging
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, Tag
+
+# 선택적 고속 파서 (설치되어 있지 않으면 html.parser로 대체)
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxHTMLParser
+except ImportError:
+    SelectolaxHTMLParser = None
+
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+# 표 구조 요소 - HTML5 파서는 이 안에 나온 <form>을 빈 요소로 만들고 입력 필드를 형제 쪽에 둠
+TABLE_SECTION_TAGS = frozenset({'table', 'tbody', 'thead', 'tfoot', 'tr'})
+
+logger = logging.getLogger(__name__)
+
+class SelectolaxBackend:
+    name = 'selectolax'
+
+    @staticmethod
+    def parse(html):
+        return SelectolaxHTMLParser(html).root
+
+    @staticmethod
+    def tag(node):
+        return node.tag
+
+    @staticmethod
+    def attr(node, name):
+        attributes = node.attributes
+        if name not in attributes:
+            return None
+        # 값이 없는 속성(<a href>)은 빈 문자열로 취급
+        return attributes[name] or ''
+
+    @staticmethod
+    def children(node):
+        return list(node.iter(include_text=False))
+
+class LxmlBackend:
+    name = 'lxml'
+    # huge_tree: 기본 파서는 256단계 이상 중첩된 노드를 조용히 버림
+    _parser = lxml.html.HTMLParser(huge_tree=True) if lxml is not None else None
+
+    @classmethod
+    def parse(cls, html):
+        try:
+            return lxml.html.document_fromstring(html, parser=cls._parser)
+        except ValueError:
+            # 인코딩 선언이 포함된 문자열은 bytes로 다시 파싱
+            return lxml.html.document_fromstring(html.encode('utf-8'), parser=cls._parser)
+
+    @staticmethod
+    def tag(node):
+        return node.tag if isinstance(node.tag, str) else None
+
+    @staticmethod
+    def attr(node, name):
+        return node.get(name)
+
+    @staticmethod
+    def children(node):
+        return [child for child in node if isinstance(child.tag, str)]
+
+class HtmlParserBackend:
+    name = 'html.parser'
+
+    @staticmethod
+    def parse(html):
+        return BeautifulSoup(html, 'html.parser')
+
+    @staticmethod
+    def tag(node):
+        return node.name
+
+    @staticmethod
+    def attr(node, name):
+        return node.get(name)
+
+    @staticmethod
+    def children(node):
+        return [child for child in node.children if isinstance(child, Tag)]
+
+PARSER_BACKENDS = {'html.parser': HtmlParserBackend}
+if lxml is not None:
+    PARSER_BACKENDS['lxml'] = LxmlBackend
+if SelectolaxHTMLParser is not None:
+    PARSER_BACKENDS['selectolax'] = SelectolaxBackend
+
+def get_parser(name=None):
+    """이름으로 파서 백엔드를 선택 (지정하지 않으면 설치된 것 중 가장 빠른 백엔드)"""
+    if name is None:
+        for candidate in ('selectolax', 'lxml', 'html.parser'):
+            if candidate in PARSER_BACKENDS:
+                return PARSER_BACKENDS[candidate]
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"지원하지 않거나 설치되지 않은 파서입니다: {name}")
+    return PARSER_BACKENDS[name]
+
+def _field(backend, node, tag):
+    input_type = backend.attr(node, 'type')
+    return {'tag': tag, 'type': input_type if input_type is not None else tag, 'name': backend.attr(node, 'name')}
+
+def parse_page(html, url, parser=None, collect_forms=True):
+    """트리를 한 번만 순회하며 링크(href 원문), 폼, 폼 외부의 독립 입력 필드를 함께 수집
+
+    입력 필드는 가장 가까운 폼에만 속함. 잘못된 마크업은 백엔드의 트리 구성 방식을 따르므로 결과가 다를 수 있음:
+    - 중첩된 <form>: html.parser는 작성된 그대로 안쪽 폼을 따로 만들고, lxml은 안쪽 <form>에서 바깥 폼을 닫고 새 폼을 시작하며,
+      selectolax는 브라우저처럼 안쪽 <form> 태그를 무시하고 첫 </form>에서 바깥 폼을 닫음
+    - 표(<table>, <tr> 등) 바로 안의 <form>: selectolax는 브라우저처럼 빈 폼을 만들고 입력 필드를 형제 쪽에 두므로,
+      빈 폼 뒤의 형제 요소 안에 있는 입력 필드를 그 폼에 연결 (브라우저의 form owner와 같은 결과)
+    """
+    backend = get_parser(parser)
+    links = []
+    forms = []
+    independent_inputs = []
+    if not html or not html.strip():
+        return links, forms, independent_inputs
+
+    # (노드, 노드를 감싸는 폼 칸, 노드가 폼이면 채울 칸) 스택으로 문서 순서대로 순회
+    # 폼 칸은 [폼 또는 None] 리스트로, 표 안의 빈 폼처럼 형제 요소가 나중에 만들어질 폼을 공유할 때 사용
+    stack = [(backend.parse(html), None, None)]
+    while stack:
+        node, owner, slot = stack.pop()
+        form = owner[0] if owner else None
+        tag = backend.tag(node)
+        if tag == 'a':
+            href = backend.attr(node, 'href')
+            if href is not None:
+                links.append(href)
+        elif collect_forms and tag == 'form':
+            action = backend.attr(node, 'action')
+            method = backend.attr(node, 'method')
+            form = {
+                'action': urljoin(url, action) if action else url,
+                'method': (method if method is not None else 'get').lower(),
+                'inputs': []
+            }
+            forms.append(form)
+            owner = [form]
+            if slot is not None:
+                slot[0] = form
+        elif collect_forms and tag in ('input', 'textarea'):
+            if form is not None:
+                form['inputs'].append(_field(backend, node, tag))
+            else:
+                independent_inputs.append(_field(backend, node, tag))
+
+        entries = []
+        child_owner = owner
+        for child in backend.children(node):
+            child_slot = None
+            if collect_forms and tag in TABLE_SECTION_TAGS and backend.tag(child) == 'form' and not backend.children(child):
+                # 표 안의 빈 폼 - 뒤따르는 형제 요소는 이 폼이 만들어진 뒤 채워질 칸을 공유
+                child_slot = [None]
+                entries.append((child, child_owner, child_slot))
+                child_owner = child_slot
+                continue
+            entries.append((child, child_owner, child_slot))
+        stack.extend(reversed(entries))
+
+    return links, forms, independent_inputs
+
+def extract_links(html, url, parser=None):
+    return parse_page(html, url, parser, collect_forms=False)[0]
+
+def extract_forms(html, url, parser=None):
+    _, forms, independent_inputs = parse_page(html, url, parser)
+    return forms, independent_inputs
@@ -0,0 +1,55 @@
+import re
+import secrets
+
+# 반사 위치 문맥을 판단할 때 canary 앞쪽으로 확인하는 바이트 수
+CONTEXT_WINDOW = 2048
+
+_CONTEXT_MARKERS = re.compile(rb'<script\b|</script\s*>|<!--|-->|<|>', re.IGNORECASE)
+
+def make_canary():
+    # 영문 소문자 + 숫자만 사용해 인코딩/이스케이프 영향을 받지 않는 고유 문자열
+    return 'fz' + secrets.token_hex(5)
+
+def make_canaries(field_names):
+    """필드 이름마다 서로 다른 canary를 만들어 {필드 이름: canary}로 반환"""
+    return {name: make_canary() for name in field_names}
+
+def reflection_context(body, position):
+    """반사된 위치의 문맥: 'script'(스크립트 블록), 'comment'(HTML 주석), 'attribute'(태그 내부), 'html'(본문 텍스트)"""
+    start = max(0, position - CONTEXT_WINDOW)
+    in_script = in_comment = in_tag = False
+    for match in _CONTEXT_MARKERS.finditer(body, start, position):
+        marker = match.group().lower()
+        if in_comment:
+            in_comment = marker != b'-->'
+        elif marker == b'<!--':
+            in_comment = True
+        elif marker.startswith(b'<script'):
+            in_script, in_tag = True, True
+        elif marker.startswith(b'</script'):
+            in_script, in_tag = False, False
+        elif marker == b'<':
+            in_tag = not in_script
+        elif marker == b'>':
+            in_tag = False
+    if in_comment:
+        return 'comment'
+    if in_tag:
+        return 'attribute'
+    if in_script:
+        return 'script'
+    return 'html'
+
+def find_reflections(body, canaries):
+    """응답 본문(bytes)을 한 번 훑어 canary가 반사된 필드와 문맥을 {필드 이름: [문맥, ...]}로 반환"""
+    if not canaries:
+        return {}
+    fields = {canary.encode(): name for name, canary in canaries.items()}
+    pattern = re.compile(b'|'.join(re.escape(canary) for canary in fields))
+    reflections = {}
+    for match in pattern.finditer(body):
+        contexts = reflections.setdefault(fields[match.group()], [])
+        context = reflection_context(body, match.start())
+        if context not in contexts:
+            contexts.append(context)
+    return reflections
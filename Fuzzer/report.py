@@ -1,43 +1,104 @@
 from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, LongTable, TableStyle, PageBreak
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
 from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+from collections import Counter
 from datetime import datetime
 import logging
-import os
 from html import escape # HTML 이스케이프를 위한 모듈 추가
 
-def register_fonts(font_dir='fonts/'):
-    """NanumGothic 폰트를 등록하여 PDF에 사용 가능하도록 설정"""
-    try:
-        nanum_gothic_path = os.path.join(font_dir, 'NanumGothic.ttf')
-        nanum_gothic_bold_path = os.path.join(font_dir, 'NanumGothicBold.ttf')
-        
-        if os.path.exists(nanum_gothic_path):
-            pdfmetrics.registerFont(TTFont('NanumGothic', nanum_gothic_path))
-            logging.info("NanumGothic font registered successfully.")
-        else:
-            logging.warning(f"NanumGothic.ttf not found in {font_dir}.")
-        
-        # 폰트 등록
-        if os.path.exists(nanum_gothic_bold_path):
-            pdfmetrics.registerFont(TTFont('NanumGothic-Bold', nanum_gothic_bold_path))
-            logging.info("NanumGothic 폰트 등록 성공")
-        else:
-            logging.warning(f"NanumGothic.ttf 파일을 {font_dir} 디렉토리에서 찾을 수 없습니다.")
-        
-    except Exception as e:
-        logging.error(f"폰트 등록 실패: {e}")
+# 글꼴 등록(프로세스당 한 번) 모듈 임포트
+from font_manager import report_fonts
+
+# 큰 표를 나눌 행 수 (표 하나를 한 번에 배치하지 않도록 이 단위로 LongTable 생성)
+TABLE_CHUNK_ROWS = 200
+# 취약점 없는 시도와 생략된 시도(중복 제외, 건너뜀, 요청 실패) 표시 방식 - 'all': 전부, 'cap': 최대 MAX_NON_VULNERABLE_ROWS행, 'summary': 폼별 시도 수만
+NON_VULNERABLE_MODES = ('all', 'cap', 'summary')
+MAX_NON_VULNERABLE_ROWS = 1000
+# 'all' 방식에서 경고할 시도 수 (시도 하나가 표의 한 행이 되므로 이보다 많으면 PDF 생성이 크게 느려짐)
+LARGE_REPORT_ATTEMPTS = 10000
+# 표 셀 좌우 여백
+CELL_PADDING = 8
 
 def safe_escape(text):
     """HTML 인코딩을 수행하기 전 None 값을 빈 문자열로 처리"""
     return escape(text) if text else ''
 
-def generate_pdf_report(crawled_urls, extraction_results, vulnerabilities, attempts, output_path='fuzzer_report.pdf'):
-    """웹 퍼저 결과를 PDF로 생성"""
-    register_fonts()
+class LazyFlowables(list):
+    """doc.build()가 앞에서부터 꺼내 쓰는 동안 필요한 만큼만 생성기에서 채우는 flowable 목록
+
+    리포트 전체 flowable을 미리 만들어 두지 않아 메모리 사용량이 시도 수와 관계없이 일정하게 유지됨
+    """
+
+    def __init__(self, source, lookahead=4):
+        super().__init__()
+        self._source = iter(source)
+        self._lookahead = lookahead
+
+    def _fill(self):
+        while self._source is not None and list.__len__(self) < self._lookahead:
+            try:
+                self.append(next(self._source))
+            except StopIteration:
+                self._source = None
+
+    def __len__(self):
+        self._fill()
+        return list.__len__(self)
+
+    def __getitem__(self, index):
+        self._fill()
+        return list.__getitem__(self, index)
+
+def table_style(font_name, bold_font_name, font_size, padding=CELL_PADDING):
+    """머리글 행(회색 배경)과 격자가 있는 기본 표 스타일"""
+    return TableStyle([
+        ('FONTNAME', (0, 0), (-1, 0), bold_font_name),
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 1), (-1, -1), font_name),
+        ('FONTSIZE', (0, 1), (-1, -1), font_size),
+        ('LEADING', (0, 1), (-1, -1), font_size * 1.2),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('LEFTPADDING', (0, 0), (-1, -1), padding),
+        ('RIGHTPADDING', (0, 0), (-1, -1), padding),
+        ('TOPPADDING', (0, 0), (-1, -1), padding),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), padding),
+    ])
+
+def table_cell(text, width, style, padding=CELL_PADDING):
+    """셀 너비 안에 들어가는 문자열은 그대로 두고, 넘치는 경우에만 줄바꿈되는 Paragraph로 변환"""
+    text = '' if text is None else str(text)
+    available = width - 2 * padding
+    if all(pdfmetrics.stringWidth(line, style.fontName, style.fontSize) <= available for line in text.split('\n')):
+        return text
+    return Paragraph(safe_escape(text).replace('\n', '<br/>'), style)
+
+def chunked_tables(header, rows, col_widths, style, chunk_rows=TABLE_CHUNK_ROWS):
+    """rows(반복자)를 chunk_rows행씩 나눈 LongTable을 차례로 생성 (머리글 행은 페이지마다 반복)"""
+    chunk = [header]
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) > chunk_rows:
+            yield LongTable(chunk, colWidths=col_widths, repeatRows=1, style=style)
+            chunk = [header]
+    if len(chunk) > 1:
+        yield LongTable(chunk, colWidths=col_widths, repeatRows=1, style=style)
+
+def generate_pdf_report(crawled_urls, extraction_results, vulnerabilities, attempts, output_path='fuzzer_report.pdf', unique_forms=None,
+                        non_vulnerable_mode='cap', max_non_vulnerable_rows=MAX_NON_VULNERABLE_ROWS):
+    """웹 퍼저 결과를 PDF로 생성 (unique_forms: 중복 제거된 퍼징 대상 폼 목록, 각 폼의 'pages'에 발견 페이지)"""
+    if non_vulnerable_mode not in NON_VULNERABLE_MODES:
+        raise ValueError(f"지원하지 않는 표시 방식: {non_vulnerable_mode} (사용 가능: {', '.join(NON_VULNERABLE_MODES)})")
+    if non_vulnerable_mode == 'all' and len(attempts or []) > LARGE_REPORT_ATTEMPTS:
+        logging.warning(
+            f"[PDFReport] 퍼징 시도 {len(attempts)}건을 모두 표시하므로 PDF 생성이 오래 걸릴 수 있습니다. "
+            f"'cap'(최대 {max_non_vulnerable_rows}행) 또는 'summary' 방식을 사용하세요."
+        )
+    font_name, bold_font_name = report_fonts()
 
     # 문서 및 기본 스타일 설정
     doc = SimpleDocTemplate(
@@ -48,221 +109,190 @@ def generate_pdf_report(crawled_urls, extraction_results, vulnerabilities, attem
         topMargin=40,
         bottomMargin=30
     )
-    
+
+    flowables = report_flowables(crawled_urls, extraction_results, attempts, unique_forms, non_vulnerable_mode, max_non_vulnerable_rows, font_name, bold_font_name)
+
+    # PDF 생성 (flowable은 배치하는 동안 필요한 만큼만 생성)
+    try:
+        doc.build(LazyFlowables(flowables))
+        logging.info(f"[PDFReport] 리포트가 {output_path}에 생성되었습니다.")
+    except Exception as e:
+        logging.error(f"[PDFReport] PDF 생성 중 오류 발생: {e}")
+
+def report_flowables(crawled_urls, extraction_results, attempts, unique_forms, non_vulnerable_mode, max_non_vulnerable_rows, font_name, bold_font_name):
+    """리포트의 flowable을 앞에서부터 하나씩 생성"""
     styles = getSampleStyleSheet()
-    styles['Normal'].fontName = 'NanumGothic' if 'NanumGothic' in pdfmetrics.getRegisteredFontNames() else 'Helvetica'
+    styles['Normal'].fontName = font_name
     styles['Normal'].fontSize = 12
     styles.add(ParagraphStyle(name='Bold', fontName=styles['Normal'].fontName, fontSize=12, leading=14, textColor=colors.black, spaceAfter=6))
-    
-    cover_title_style = ParagraphStyle(name='CoverTitle', fontName='NanumGothic-Bold', fontSize=55, alignment=1, spaceAfter=60)
-    cover_date_style = ParagraphStyle(name='CoverDate', fontName='NanumGothic', fontSize=25, alignment=1, spaceAfter=40)
-    toc_style = ParagraphStyle(name='TOC', fontName='NanumGothic-Bold', fontSize=40, alignment=0, spaceAfter=50, leading=24)
-    item_style = ParagraphStyle(name='item', fontName='NanumGothic', fontSize=30, alignment=0, spaceAfter=40, leading=20)
+    normal = styles['Normal']
 
-    flowables = []
+    cover_title_style = ParagraphStyle(name='CoverTitle', fontName=bold_font_name, fontSize=55, alignment=1, spaceAfter=60)
+    cover_date_style = ParagraphStyle(name='CoverDate', fontName=font_name, fontSize=25, alignment=1, spaceAfter=40)
+    toc_style = ParagraphStyle(name='TOC', fontName=bold_font_name, fontSize=40, alignment=0, spaceAfter=50, leading=24)
+    item_style = ParagraphStyle(name='item', fontName=font_name, fontSize=30, alignment=0, spaceAfter=40, leading=20)
 
     # 표지 페이지
-    flowables.append(Spacer(1, 200))
-    flowables.append(Paragraph("웹 퍼저 리포트", cover_title_style))
-    flowables.append(Paragraph(datetime.now().strftime('%Y-%m-%d %H:%M:%S'), cover_date_style))
-    flowables.append(Spacer(1, 80))
-    
-    flowables.append(PageBreak())
+    yield Spacer(1, 200)
+    yield Paragraph("웹 퍼저 리포트", cover_title_style)
+    yield Paragraph(datetime.now().strftime('%Y-%m-%d %H:%M:%S'), cover_date_style)
+    yield Spacer(1, 80)
+
+    yield PageBreak()
 
     # 목차
-    flowables.append(Paragraph("목차", toc_style))
+    yield Paragraph("목차", toc_style)
     toc = [
         '1. 크롤링 결과',
         '2. 폼과 입력 필드',
         '3. 퍼징 시도 및 결과'
     ]
     for item in toc:
-        flowables.append(Paragraph(item, item_style))
-    flowables.append(PageBreak())
+        yield Paragraph(item, item_style)
+    yield PageBreak()
 
     # 1. 크롤링 결과
     section_title_style = ParagraphStyle(
         name='SectionTitle',
-        fontName='NanumGothic-Bold',  
-        fontSize=30,  
-        spaceAfter=33,  
-        textColor=colors.black,  
-        leading=20  
+        fontName=bold_font_name,
+        fontSize=30,
+        spaceAfter=33,
+        textColor=colors.black,
+        leading=20
     )
-    flowables.append(Paragraph("1. 크롤링 결과", section_title_style))
+    yield Paragraph("1. 크롤링 결과", section_title_style)
     if crawled_urls:
-        table_data = [['크롤링한 URL']]
-        for url in crawled_urls:
-            table_data.append([Paragraph(f"- {safe_escape(url)}", styles['Normal'])])
-        
-        # 테이블 스타일 설정
-        table_style = TableStyle([
-            ('FONTNAME', (0, 0), (0, 0), styles['Bold'].fontName),
-            ('BACKGROUND', (0, 0), (0, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (0, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 1), (-1, -1), styles['Normal'].fontName),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ])
-        
-        # 테이블 생성
-        table = Table(table_data, colWidths=[500]) 
-        table.setStyle(table_style)
-
-        # 테이블 추가
-        flowables.append(table)
+        # 테이블 생성 (URL마다 한 행, TABLE_CHUNK_ROWS행씩 나눠서 생성)
+        rows = ([table_cell(f"- {url}", 500, normal)] for url in crawled_urls)
+        yield from chunked_tables(['크롤링한 URL'], rows, [500], table_style(normal.fontName, styles['Bold'].fontName, normal.fontSize))
     else:
-        flowables.append(Paragraph("크롤링한 URL이 없습니다.", styles['Normal']))
+        yield Paragraph("크롤링한 URL이 없습니다.", normal)
 
-    flowables.append(PageBreak())
+    yield PageBreak()
 
     # 2. 폼과 입력 필드
-    flowables.append(Paragraph("2. 폼과 입력 필드", section_title_style))
+    yield Paragraph("2. 폼과 입력 필드", section_title_style)
     if extraction_results:
-        table_data = [['URL', '폼 액션', '메소드', '입력 필드']]
-        for result in extraction_results:
-            for idx, form in enumerate(result.get('forms', []), start=1):
-                inputs_list = ', '.join([
-                    f"{safe_escape(input_field.get('name', ''))} (type: {safe_escape(input_field.get('type', ''))})" 
-                    for input_field in form.get('inputs', [])
-                ])
-                table_data.append([
-                    Paragraph(safe_escape(result['url']), styles['Normal']),
-                    Paragraph(safe_escape(form.get('action', '')), styles['Normal']),
-                    Paragraph(safe_escape(form.get('method', '').upper()), styles['Normal']),
-                    Paragraph(inputs_list, styles['Normal'])
-                ])  
-        
-        # 테이블 스타일 설정
-        table_style = TableStyle([
-            ('FONTNAME', (0, 0), (-1, 0), styles['Bold'].fontName),
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 1), (-1, -1), styles['Normal'].fontName),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 10),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-            ('TOPPADDING', (0, 0), (-1, -1), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-        ])
-        
-        # 테이블 생성
-        table = Table(table_data, colWidths=[150, 150, 50, 150])
-        table.setStyle(table_style)
-        
-        # 테이블 추가
-        flowables.append(table)
+        def form_rows():
+            for result in extraction_results:
+                for form in result.get('forms', []):
+                    inputs_list = ', '.join(
+                        f"{input_field.get('name') or ''} (type: {input_field.get('type') or ''})"
+                        for input_field in form.get('inputs', [])
+                    )
+                    yield [
+                        table_cell(result['url'], 150, normal, 10),
+                        table_cell(form.get('action', ''), 150, normal, 10),
+                        (form.get('method') or '').upper(),
+                        table_cell(inputs_list, 150, normal, 10)
+                    ]
+
+        yield from chunked_tables(
+            ['URL', '폼 액션', '메소드', '입력 필드'], form_rows(), [150, 150, 50, 150],
+            table_style(normal.fontName, styles['Bold'].fontName, normal.fontSize, padding=10)
+        )
     else:
-        flowables.append(Paragraph("폼 정보가 없습니다.", styles['Normal']))
-    flowables.append(PageBreak())
+        yield Paragraph("폼 정보가 없습니다.", normal)
+
+    # 중복 제거된 퍼징 대상 폼과 각 폼이 발견된 페이지
+    if unique_forms:
+        yield Spacer(1, 20)
+        yield Paragraph(f"퍼징 대상 폼 (중복 제거, {len(unique_forms)}개)", styles['Bold'])
+
+        def unique_form_rows():
+            for form in unique_forms:
+                inputs_list = ', '.join(
+                    f"{input_field.get('name') or ''} (type: {input_field.get('type') or ''})"
+                    for input_field in form.get('inputs', [])
+                )
+                action_cell = table_cell(form.get('action', ''), 150, normal)
+                # 셀이 한 페이지를 넘지 않도록 발견 페이지마다 한 행 (메소드와 입력 필드는 폼의 첫 행에만 표시)
+                for index, page_url in enumerate(form.get('pages') or ['']):
+                    if index:
+                        yield [action_cell, '', '', table_cell(page_url, 150, normal)]
+                    else:
+                        yield [action_cell, (form.get('method') or '').upper(), table_cell(inputs_list, 150, normal), table_cell(page_url, 150, normal)]
+
+        yield from chunked_tables(
+            ['폼 액션', '메소드', '입력 필드', '발견 페이지'], unique_form_rows(), [150, 50, 150, 150],
+            table_style(normal.fontName, styles['Bold'].fontName, normal.fontSize)
+        )
+    yield PageBreak()
 
 
     # 3. 퍼징 시도 및 결과
-    flowables.append(Paragraph("3. 퍼징 시도 및 결과", section_title_style))
+    yield Paragraph("3. 퍼징 시도 및 결과", section_title_style)
 
-    # 시도 데이터를 자동으로 분류할 딕셔너리 생성
-    vulnerability_types = {}
+    # 시도의 결과에서 취약점 유형 추출
+    # (취약점 발견도 취약점 없음도 아닌 결과 - 중복 제외, 건너뜀, 요청 실패 - 는 '생략된 시도'로 묶음)
+    def attempt_type(attempt):
+        result = attempt.get('result', '취약점 없음')
+        if result.endswith(' 취약점 발견'):
+            return result[:-len(' 취약점 발견')]
+        return result if result == '취약점 없음' else '생략된 시도'
 
-    for attempt in attempts:
-        # 시도의 결과에서 취약점 유형 추출
-        vulnerability_type = attempt.get('result', '취약점 없음').replace(' 취약점 발견', '')
-        
-        # 새로운 취약점 유형이면 딕셔너리에 추가
-        if vulnerability_type not in vulnerability_types:
-            vulnerability_types[vulnerability_type] = []
-        
-        vulnerability_types[vulnerability_type].append(attempt)
+    # 유형 목록만 먼저 모으고 유형별 시도는 테이블을 만들 때 다시 순회
+    # (attempts가 스풀이면 순회할 때마다 파일에서 읽으므로 시도 전체를 메모리에 올리지 않음)
+    vulnerability_types = list(dict.fromkeys(attempt_type(attempt) for attempt in attempts))
 
-    table_title_style = ParagraphStyle(name='tableTitle', fontName='NanumGothic-Bold', fontSize=23, alignment=1, spaceAfter=23)
+    table_title_style = ParagraphStyle(name='tableTitle', fontName=bold_font_name, fontSize=23, alignment=1, spaceAfter=23)
+    attempt_style = table_style(normal.fontName, styles['Bold'].fontName, normal.fontSize)
 
-    # 취약점 없는 시도와 기타 취약점을 구분하여 처리
-    non_vulnerable_attempts = vulnerability_types.pop('취약점 없음', [])
+    # 취약점 없는 시도, 생략된 시도와 기타 취약점을 구분하여 처리
+    has_non_vulnerable = '취약점 없음' in vulnerability_types
+    has_omitted = '생략된 시도' in vulnerability_types
+    vulnerability_types = [vuln_type for vuln_type in vulnerability_types if vuln_type not in ('취약점 없음', '생략된 시도')]
 
-    flowables.append(Paragraph(f"-- 취약점 발견 시도 --", table_title_style))
+    yield Paragraph(f"-- 취약점 발견 시도 --", table_title_style)
 
-    # 취약점 있는 유형별로 테이블 생성
-    for vuln_type, attempts in vulnerability_types.items():
-        flowables.append(Paragraph(f"{vuln_type}", table_title_style))
-        
-        # 테이블 데이터 초기화
-        table_data = [['폼 액션', '페이로드', '결과']]
-        
-        # 시도 데이터 추가
+    def attempt_rows(vuln_type, limit=None):
+        # 해당 유형의 시도를 표의 행으로 변환 (취약한 파라미터가 있으면 폼 액션 아래에 표시)
+        count = 0
         for attempt in attempts:
-            table_data.append([
-                Paragraph(safe_escape(attempt.get('form_action', '')), styles['Normal']),
-                Paragraph(safe_escape(attempt.get('payload', '')), styles['Normal']),
-                Paragraph(safe_escape(attempt.get('result', '')), styles['Normal'])
-            ])
-
-        # 테이블 스타일 설정
-        table_style = TableStyle([
-            ('FONTNAME', (0, 0), (-1, 0), styles['Bold'].fontName),
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 1), (-1, -1), styles['Normal'].fontName),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ])
-        
-        # 테이블 생성
-        table = Table(table_data, colWidths=[150, 150, 150])
-        table.setStyle(table_style)
-        
-        # 테이블 추가
-        flowables.append(table)
-        flowables.append(PageBreak())  # 페이지 구분
+            if attempt_type(attempt) != vuln_type:
+                continue
+            if limit is not None and count >= limit:
+                return
+            count += 1
+            form_cell = attempt.get('form_action', '')
+            if attempt.get('parameter'):
+                form_cell += f"\n[파라미터: {attempt['parameter']}]"
+            yield [
+                table_cell(form_cell, 150, normal),
+                table_cell(attempt.get('payload', ''), 150, normal),
+                table_cell(attempt.get('result', ''), 150, normal)
+            ]
+
+    def limited_attempts(vuln_type, title):
+        # 취약점이 아닌 시도는 표시 방식(non_vulnerable_mode)에 따라 전부, 일부 또는 폼별 시도 수만 표시
+        yield Paragraph(title, table_title_style)
+        if non_vulnerable_mode == 'summary':
+            # 폼별 시도 수만 표시
+            per_form = Counter(attempt.get('form_action', '') for attempt in attempts if attempt_type(attempt) == vuln_type)
+            rows = ([table_cell(action, 380, normal), str(count)] for action, count in per_form.most_common())
+            yield from chunked_tables(['폼 액션', '시도 수'], rows, [380, 70], attempt_style)
+        else:
+            limit = max_non_vulnerable_rows if non_vulnerable_mode == 'cap' else None
+            yield from chunked_tables(['폼 액션', '페이로드', '결과'], attempt_rows(vuln_type, limit), [150, 150, 150], attempt_style)
+            if limit is not None:
+                total = sum(1 for attempt in attempts if attempt_type(attempt) == vuln_type)
+                if total > limit:
+                    yield Spacer(1, 10)
+                    yield Paragraph(f"{title} {total}건 중 {limit}건만 표시했습니다.", normal)
+
+    # 취약점 있는 유형별로 테이블 생성
+    for vuln_type in vulnerability_types:
+        yield Paragraph(f"{vuln_type}", table_title_style)
+        yield from chunked_tables(['폼 액션', '페이로드', '결과'], attempt_rows(vuln_type), [150, 150, 150], attempt_style)
+        yield PageBreak()  # 페이지 구분
+
+    # 중복 제외, 건너뜀, 요청 실패 시도는 취약점 발견 시도와 섞이지 않도록 따로 표시
+    if has_omitted:
+        yield from limited_attempts('생략된 시도', "생략된 시도")
+        yield PageBreak()
 
     # 취약점 없는 시도 테이블을 마지막에 생성
-    if non_vulnerable_attempts:
-        flowables.append(Paragraph("취약점 없는 시도", table_title_style))
-        table_data = [['폼 액션', '페이로드', '결과']]
-        for attempt in non_vulnerable_attempts:
-            table_data.append([
-                Paragraph(safe_escape(attempt.get('form_action', '')), styles['Normal']),
-                Paragraph(safe_escape(attempt.get('payload', '')), styles['Normal']),
-                Paragraph(safe_escape(attempt.get('result', '')), styles['Normal'])
-            ])
-
-        # 테이블 스타일 설정
-        table_style = TableStyle([
-            ('FONTNAME', (0, 0), (-1, 0), styles['Bold'].fontName),
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 1), (-1, -1), styles['Normal'].fontName),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ])
-        
-        # 테이블 생성
-        table = Table(table_data, colWidths=[150, 150, 150])
-        table.setStyle(table_style)
-
-        # 테이블 추가
-        flowables.append(table)
+    if has_non_vulnerable:
+        yield from limited_attempts('취약점 없음', "취약점 없는 시도")
     else:
-        flowables.append(Paragraph("취약점 없는 시도가 없습니다.", table_title_style))
-
-    # PDF 생성
-    try:
-        doc.build(flowables)
-        logging.info(f"[PDFReport] 리포트가 {output_path}에 생성되었습니다.")
-    except Exception as e:
-        logging.error(f"[PDFReport] PDF 생성 중 오류 발생: {e}")
\ No newline at end of file
+        yield Paragraph("취약점 없는 시도가 없습니다.", table_title_style)
@@ -0,0 +1,107 @@
+import logging
+import random
+import time
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 요청을 보내지 않고 바로 실패 처리할 때 발생"""
+
+    def __init__(self, scope, key):
+        super().__init__(f"{scope} 서킷 열림: {key}")
+        self.scope = scope  # 'host' 또는 'endpoint'
+        self.key = key
+
+class RetryPolicy:
+    """재시도 횟수와 지터가 적용된 지수 백오프 대기 시간 계산"""
+
+    def __init__(self, retries=2, base_delay=0.5, max_delay=8.0, retry_statuses=(429, 502, 503, 504)):
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+
+    def delay(self, attempt, retry_after=None):
+        # full jitter: 0 ~ min(max_delay, base_delay * 2^attempt) 사이에서 무작위로 선택해 재시도가 한꺼번에 몰리지 않게 함
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        if retry_after is not None:
+            return max(backoff, retry_after)
+        return backoff
+
+class _Circuit:
+    def __init__(self):
+        self.failures = 0  # 연속 실패 수
+        self.opened_at = None
+        self.probing = False  # half-open 상태에서 시험 요청이 진행 중인지
+
+class CircuitBreaker:
+    """호스트별, 엔드포인트(호스트 + 경로)별 연속 실패 수를 세어 임계값을 넘으면 서킷을 열고,
+    reset_timeout초 뒤 시험 요청 하나만 허용해 성공하면 다시 닫음
+    """
+
+    def __init__(self, host_threshold=10, endpoint_threshold=5, reset_timeout=30.0):
+        self.thresholds = {'host': host_threshold, 'endpoint': endpoint_threshold}
+        self.reset_timeout = reset_timeout
+        self._circuits = {}
+
+    @staticmethod
+    def _keys(url):
+        parts = urlsplit(url)
+        host = parts.netloc.lower()
+        return (('host', host), ('endpoint', f"{host}{parts.path or '/'}"))
+
+    def _circuit(self, key):
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = self._circuits[key] = _Circuit()
+        return circuit
+
+    def _blocked(self, url):
+        # (서킷이 열려 있으면 CircuitOpenError, 아니면 None, half-open 상태라 시험 요청을 보낼 서킷 목록)
+        now = time.monotonic()
+        probes = []
+        for key in self._keys(url):
+            circuit = self._circuit(key)
+            if circuit.opened_at is None:
+                continue
+            if circuit.probing or now - circuit.opened_at < self.reset_timeout:
+                return CircuitOpenError(*key), []
+            probes.append(circuit)
+        return None, probes
+
+    def peek(self, url):
+        """check()와 같지만 half-open 시험 요청 자리를 차지하지 않음 (요청 전에 미리 건너뛸지 판단할 때 사용)"""
+        return self._blocked(url)[0]
+
+    def check(self, url):
+        """요청을 보내도 되면 None, 서킷이 열려 있으면 CircuitOpenError를 반환"""
+        blocked, probes = self._blocked(url)
+        # half-open: 시험 요청 하나만 통과
+        for circuit in probes:
+            circuit.probing = True
+        return blocked
+
+    def success(self, url):
+        for key in self._keys(url):
+            circuit = self._circuit(key)
+            if circuit.opened_at is not None:
+                logger.info(f"[CircuitBreaker] 서킷 닫힘 - {key[0]}: {key[1]}")
+            circuit.failures = 0
+            circuit.opened_at = None
+            circuit.probing = False
+
+    def failure(self, url):
+        now = time.monotonic()
+        for key in self._keys(url):
+            circuit = self._circuit(key)
+            circuit.failures += 1
+            if circuit.probing or (circuit.opened_at is None and circuit.failures >= self.thresholds[key[0]]):
+                logger.warning(f"[CircuitBreaker] 서킷 열림 - {key[0]}: {key[1]}, 연속 실패 {circuit.failures}회")
+                circuit.opened_at = now
+                circuit.probing = False
+
+    def abandon(self, url):
+        """결과 없이 끝난 요청(처리 중 예외, 취소)의 half-open 시험 요청 표시를 해제 (실패로 세지 않으며, 서킷은 열린 채로 다음 요청이 다시 시험함)"""
+        for key in self._keys(url):
+            self._circuit(key).probing = False
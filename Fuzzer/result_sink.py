@@ -0,0 +1,155 @@
+import gzip
+import json
+import logging
+from collections import Counter
+
+logger = logging.getLogger(__name__)
+
+class ScanStats:
+    """퍼징 결과의 누적 집계 (폼별/결과별/상태 코드별 시도 수, 취약점 수) - 요청 수와 관계없이 크기가 작게 유지됨"""
+
+    def __init__(self):
+        self.attempts = 0
+        self.findings = 0
+        self.by_result = Counter()  # 결과 문자열('취약점 없음', 'XSS 취약점 발견' 등) -> 시도 수
+        self.by_form = Counter()  # (폼 액션, 결과) -> 시도 수
+        self.by_status = Counter()  # 응답 상태 코드 -> 시도 수
+        self.by_type = Counter()  # 취약점 유형 -> 취약점 수
+
+    def add_attempt(self, attempt):
+        self.attempts += 1
+        self.by_result[attempt.get('result')] += 1
+        self.by_form[(attempt.get('form_action'), attempt.get('result'))] += 1
+        if attempt.get('response_code') is not None:
+            self.by_status[attempt['response_code']] += 1
+
+    def add_finding(self, finding):
+        self.findings += 1
+        self.by_type[finding.get('type')] += 1
+
+    def result_types(self):
+        """나온 순서대로 결과 문자열 목록"""
+        return list(self.by_result)
+
+class MemorySink:
+    """퍼징 결과를 메모리 리스트에 보관 (작은 스캔, 테스트용)"""
+
+    def __init__(self):
+        self.stats = ScanStats()
+        self.attempts = []
+        self.findings = []
+
+    def add_attempt(self, attempt):
+        self.stats.add_attempt(attempt)
+        self.attempts.append(attempt)
+
+    def add_finding(self, finding):
+        self.stats.add_finding(finding)
+        self.findings.append(finding)
+
+    def close(self):
+        pass
+
+class _SpoolView:
+    # 스풀에서 한 종류의 기록만 다시 읽어오는 객체 (여러 번 순회 가능)
+    def __init__(self, spool, kind):
+        self.spool = spool
+        self.kind = kind
+
+    def __iter__(self):
+        return self.spool.iter_records(self.kind)
+
+    def __len__(self):
+        return self.spool.stats.attempts if self.kind == 'attempt' else self.spool.stats.findings
+
+    def __bool__(self):
+        return len(self) > 0
+
+class JsonlSpool:
+    """퍼징 시도/취약점을 끝날 때마다 추가 전용 JSONL 파일(.gz이면 gzip 압축)에 기록하고, 메모리에는 집계만 유지
+
+    리포트는 attempts/findings를 순회할 때마다 파일에서 다시 읽으며,
+    flush_every개마다 파일에 반영해 프로세스가 중단되어도 그때까지의 기록은 남음
+    """
+
+    def __init__(self, path='fuzz_results.jsonl.gz', compress=None, flush_every=100):
+        self.path = path
+        self.compress = path.endswith('.gz') if compress is None else compress
+        self.flush_every = flush_every
+        self.stats = ScanStats()
+        self.attempts = _SpoolView(self, 'attempt')
+        self.findings = _SpoolView(self, 'finding')
+        self._file = self._open('wt')
+        self._unflushed = 0
+
+    def _open(self, mode):
+        if self.compress:
+            return gzip.open(self.path, mode, encoding='utf-8')
+        return open(self.path, mode, encoding='utf-8')
+
+    def _write(self, kind, record):
+        self._file.write(json.dumps({'kind': kind, **record}, ensure_ascii=False, default=str) + '\n')
+        self._unflushed += 1
+        if self._unflushed >= self.flush_every:
+            self.flush()
+
+    def add_attempt(self, attempt):
+        self.stats.add_attempt(attempt)
+        self._write('attempt', attempt)
+
+    def add_finding(self, finding):
+        self.stats.add_finding(finding)
+        self._write('finding', finding)
+
+    def flush(self):
+        if self._file is not None and self._unflushed:
+            # gzip은 flush 시 동기화 지점을 기록해 그때까지의 내용을 읽을 수 있음
+            self._file.flush()
+            self._unflushed = 0
+
+    def iter_records(self, kind=None):
+        self.flush()
+        with self._open('rt') as spool_file:
+            try:
+                for line in spool_file:
+                    record = json.loads(line)
+                    if record.pop('kind') == kind or kind is None:
+                        yield record
+            except (EOFError, json.JSONDecodeError):
+                # 기록 중이거나 비정상 종료된 파일은 마지막으로 온전히 기록된 줄까지만 읽음
+                pass
+
+    def close(self):
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+            logger.info(f"[ResultSpool] 퍼징 결과 {self.stats.attempts}건을 저장했습니다: {self.path}")
+
+class TeeSink:
+    """기본 sink(primary)에 기록하면서 다른 기록 대상(ScanStore 등)에도 같은 결과를 전달
+
+    attempts, findings, stats는 기본 sink의 것을 사용
+    """
+
+    def __init__(self, primary, *others):
+        self.primary = primary
+        self.others = others
+        self.stats = primary.stats
+        self.attempts = primary.attempts
+        self.findings = primary.findings
+
+    def add_attempt(self, attempt):
+        self.primary.add_attempt(attempt)
+        for sink in self.others:
+            sink.add_attempt(attempt)
+
+    def add_finding(self, finding):
+        self.primary.add_finding(finding)
+        for sink in self.others:
+            sink.add_finding(finding)
+
+    def close(self):
+        self.primary.close()
+        for sink in self.others:
+            sink.close()
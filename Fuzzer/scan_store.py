@@ -0,0 +1,227 @@
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+
+from form_index import form_signature
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scans (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    base_url TEXT NOT NULL,
+    max_depth INTEGER,
+    started_at TEXT NOT NULL,
+    finished_at TEXT
+);
+CREATE TABLE IF NOT EXISTS pages (
+    scan_id INTEGER NOT NULL REFERENCES scans(id),
+    url TEXT NOT NULL,
+    PRIMARY KEY (scan_id, url)
+);
+CREATE TABLE IF NOT EXISTS forms (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    scan_id INTEGER NOT NULL REFERENCES scans(id),
+    action TEXT NOT NULL,
+    method TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    inputs TEXT NOT NULL,
+    pages TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    scan_id INTEGER NOT NULL REFERENCES scans(id),
+    form_action TEXT NOT NULL,
+    parameter TEXT,
+    payload TEXT,
+    response_code INTEGER,
+    result TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS findings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    scan_id INTEGER NOT NULL REFERENCES scans(id),
+    fingerprint TEXT NOT NULL,
+    type TEXT NOT NULL,
+    form_action TEXT NOT NULL,
+    parameter TEXT,
+    payload TEXT,
+    response_code INTEGER,
+    evidence TEXT,
+    confirmation TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_scans_base_url ON scans(base_url, id);
+CREATE INDEX IF NOT EXISTS idx_forms_scan ON forms(scan_id);
+CREATE INDEX IF NOT EXISTS idx_forms_signature ON forms(signature);
+CREATE INDEX IF NOT EXISTS idx_attempts_scan_result ON attempts(scan_id, result);
+CREATE INDEX IF NOT EXISTS idx_findings_scan_fingerprint ON findings(scan_id, fingerprint);
+CREATE INDEX IF NOT EXISTS idx_findings_action ON findings(form_action, scan_id);
+"""
+
+def finding_fingerprint(finding):
+    """스캔 간 같은 취약점을 식별하는 키 (유형, 폼 액션, 파라미터) - 페이로드가 달라도 같은 취약점으로 봄"""
+    return json.dumps([finding.get('type'), finding.get('form'), finding.get('parameter')], ensure_ascii=False)
+
+class ScanStore:
+    """여러 번의 스캔 결과(페이지, 폼, 퍼징 시도, 취약점)를 하나의 SQLite 파일에 누적 저장하고 스캔 간 비교에 사용
+
+    시도/취약점 기록은 메모리 버퍼에 모았다가 batch_size개마다 하나의 트랜잭션으로 반영
+    """
+
+    def __init__(self, path='scan_results.sqlite', batch_size=500):
+        self.path = path
+        self.batch_size = batch_size
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        self._attempts = []
+        self._findings = []
+
+    # 스캔 단위 기록
+    def start_scan(self, base_url, max_depth=None):
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO scans (base_url, max_depth, started_at) VALUES (?, ?, ?)",
+                (base_url, max_depth, datetime.now().isoformat(timespec='seconds'))
+            )
+        return cursor.lastrowid
+
+    def finish_scan(self, scan_id):
+        self.flush()
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE scans SET finished_at = ? WHERE id = ?", (datetime.now().isoformat(timespec='seconds'), scan_id))
+
+    def add_pages(self, scan_id, urls):
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR IGNORE INTO pages (scan_id, url) VALUES (?, ?)", ((scan_id, url) for url in urls))
+
+    def add_forms(self, scan_id, forms):
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO forms (scan_id, action, method, signature, inputs, pages) VALUES (?, ?, ?, ?, ?, ?)",
+                ((
+                    scan_id, form['action'], form.get('method', 'get'),
+                    json.dumps(form_signature(form), ensure_ascii=False),
+                    json.dumps(form.get('inputs', []), ensure_ascii=False),
+                    json.dumps(form.get('pages', []), ensure_ascii=False)
+                ) for form in forms)
+            )
+
+    # 퍼징 중 기록 (버퍼링)
+    def add_attempt(self, scan_id, attempt):
+        with self._lock:
+            self._attempts.append((
+                scan_id, attempt.get('form_action', ''), attempt.get('parameter'), attempt.get('payload'),
+                attempt.get('response_code'), attempt.get('result', '')
+            ))
+            should_flush = len(self._attempts) >= self.batch_size
+        if should_flush:
+            self.flush()
+
+    def add_finding(self, scan_id, finding):
+        with self._lock:
+            self._findings.append((
+                scan_id, finding_fingerprint(finding), finding.get('type', ''), finding.get('form', ''),
+                finding.get('parameter'), finding.get('payload'), finding.get('response_code'),
+                finding.get('evidence'), finding.get('confirmation')
+            ))
+
+    def flush(self):
+        with self._lock:
+            attempts, self._attempts = self._attempts, []
+            findings, self._findings = self._findings, []
+            if not attempts and not findings:
+                return
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT INTO attempts (scan_id, form_action, parameter, payload, response_code, result) VALUES (?, ?, ?, ?, ?, ?)",
+                        attempts
+                    )
+                    self._conn.executemany(
+                        "INSERT INTO findings (scan_id, fingerprint, type, form_action, parameter, payload, response_code, evidence, confirmation) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        findings
+                    )
+            except sqlite3.Error as e:
+                logger.error(f"[ScanStore] 스캔 결과 저장 실패: {e}")
+
+    def recorder(self, scan_id):
+        """퍼저의 결과 기록 대상(sink)으로 사용할 수 있는 객체"""
+        return _ScanRecorder(self, scan_id)
+
+    # 조회
+    def _rows(self, sql, params=()):
+        self.flush()
+        cursor = self._conn.execute(sql, params)
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor]
+
+    def scans(self, base_url=None):
+        if base_url is None:
+            return self._rows("SELECT * FROM scans ORDER BY id")
+        return self._rows("SELECT * FROM scans WHERE base_url = ? ORDER BY id", (base_url,))
+
+    def previous_scan(self, scan_id):
+        """같은 기본 URL로 실행한 직전 스캔 ID (없으면 None)"""
+        row = self._conn.execute(
+            "SELECT id FROM scans WHERE base_url = (SELECT base_url FROM scans WHERE id = ?) AND id < ? AND finished_at IS NOT NULL "
+            "ORDER BY id DESC LIMIT 1",
+            (scan_id, scan_id)
+        ).fetchone()
+        return row[0] if row else None
+
+    def findings(self, scan_id):
+        return self._rows("SELECT * FROM findings WHERE scan_id = ? ORDER BY id", (scan_id,))
+
+    def findings_for_action(self, form_action):
+        """모든 스캔에서 해당 폼 액션에 대해 발견된 취약점"""
+        return self._rows("SELECT * FROM findings WHERE form_action = ? ORDER BY scan_id, id", (form_action,))
+
+    def iter_attempts(self, scan_id):
+        self.flush()
+        cursor = self._conn.execute(
+            "SELECT form_action, parameter, payload, response_code, result FROM attempts WHERE scan_id = ? ORDER BY id",
+            (scan_id,)
+        )
+        for form_action, parameter, payload, response_code, result in cursor:
+            yield {'form_action': form_action, 'parameter': parameter, 'payload': payload, 'response_code': response_code, 'result': result}
+
+    def diff(self, old_scan_id, new_scan_id):
+        """두 스캔의 취약점을 (유형, 폼 액션, 파라미터) 기준으로 비교해 {'new': [...], 'fixed': [...], 'persisting': [...]}로 반환"""
+        queries = {
+            'new': "SELECT fingerprint FROM findings WHERE scan_id = :new EXCEPT SELECT fingerprint FROM findings WHERE scan_id = :old",
+            'fixed': "SELECT fingerprint FROM findings WHERE scan_id = :old EXCEPT SELECT fingerprint FROM findings WHERE scan_id = :new",
+            'persisting': "SELECT fingerprint FROM findings WHERE scan_id = :old INTERSECT SELECT fingerprint FROM findings WHERE scan_id = :new",
+        }
+        params = {'old': old_scan_id, 'new': new_scan_id}
+        result = {}
+        for status, sql in queries.items():
+            rows = self._rows(sql, params)
+            result[status] = [
+                dict(zip(('type', 'form_action', 'parameter'), json.loads(row['fingerprint'])))
+                for row in rows
+            ]
+        return result
+
+    def close(self):
+        self.flush()
+        self._conn.close()
+
+class _ScanRecorder:
+    # ScanStore의 한 스캔에 퍼징 시도/취약점을 기록 (MemorySink/JsonlSpool과 같은 add_* 메소드 제공)
+    def __init__(self, store, scan_id):
+        self.store = store
+        self.scan_id = scan_id
+
+    def add_attempt(self, attempt):
+        self.store.add_attempt(self.scan_id, attempt)
+
+    def add_finding(self, finding):
+        self.store.add_finding(self.scan_id, finding)
+
+    def close(self):
+        self.store.flush()
@@ -0,0 +1,131 @@
+import logging
+import time
+from collections import deque, namedtuple
+from itertools import combinations
+from urllib.parse import urlsplit, parse_qsl
+
+logger = logging.getLogger(__name__)
+
+# 필드 타입별 우선순위 (높을수록 먼저 주입) - 목록에 없는 타입(submit, checkbox, file 등)은 주입하지 않음
+FIELD_TYPE_RANKS = {
+    'text': 3, 'search': 3, 'textarea': 3, 'url': 3, 'email': 3, 'tel': 3,
+    'hidden': 2, 'number': 2, 'password': 1, 'select': 1,
+}
+# action URL의 GET 파라미터 우선순위
+QUERY_PARAM_RANK = 2
+# 응답에 반사되는 필드에 더하는 우선순위
+REFLECTION_BONUS = 2
+# 조합 주입(pairwise)에 사용할 상위 필드 수
+MAX_PAIRWISE_FIELDS = 4
+
+# 주입 작업 하나 (fields: 페이로드를 넣을 필드 이름 튜플)
+InjectionJob = namedtuple('InjectionJob', ['form', 'payload', 'fields'])
+
+class BudgetExceededError(Exception):
+    """예산 한도를 넘어 요청을 보내지 않을 때 발생 (확인용 요청 등 건너뛸 수 없는 요청에서 사용)"""
+
+    def __init__(self, form_key, host):
+        super().__init__(f"퍼징 예산 한도 초과 - 호스트: {host}")
+        self.form_key = form_key
+        self.host = host
+
+class ScanBudget:
+    """폼별, 호스트별, 전체 요청 수와 전체 실행 시간 한도 (None이면 제한 없음)"""
+
+    def __init__(self, per_form=None, per_host=None, total=None, time_limit=None):
+        self.per_form = per_form
+        self.per_host = per_host
+        self.total = total
+        self.time_limit = time_limit
+        self.started = time.monotonic()
+        self.form_counts = {}
+        self.host_counts = {}
+        self.count = 0
+        self.skipped = 0  # 한도 때문에 보내지 않은 작업 수
+
+    def exhausted(self):
+        """전체 요청 수 또는 시간 한도를 모두 사용했으면 True"""
+        if self.total is not None and self.count >= self.total:
+            return True
+        return self.time_limit is not None and time.monotonic() - self.started >= self.time_limit
+
+    def allows(self, form_key, host):
+        if self.exhausted():
+            return False
+        if self.per_form is not None and self.form_counts.get(form_key, 0) >= self.per_form:
+            return False
+        return self.per_host is None or self.host_counts.get(host, 0) < self.per_host
+
+    def charge(self, form_key, host):
+        """요청 하나를 한도에 반영하고, 한도를 넘으면 False를 반환 (이 경우 요청을 보내지 않음)"""
+        if not self.allows(form_key, host):
+            self.skipped += 1
+            return False
+        self.count += 1
+        self.form_counts[form_key] = self.form_counts.get(form_key, 0) + 1
+        self.host_counts[host] = self.host_counts.get(host, 0) + 1
+        return True
+
+def injectable_fields(form, reflections=None):
+    """주입할 필드 이름을 우선순위 순으로 반환 (필드 타입 + 반사 여부 기준)"""
+    ranks = {}
+    if form.get('method', 'get').lower() != 'post':
+        for name, _ in parse_qsl(urlsplit(form['action']).query, keep_blank_values=True):
+            ranks.setdefault(name, QUERY_PARAM_RANK)
+    for input_field in form['inputs']:
+        rank = FIELD_TYPE_RANKS.get((input_field.get('type') or 'text').lower())
+        if input_field.get('name') and rank is not None:
+            ranks[input_field['name']] = max(rank, ranks.get(input_field['name'], 0))
+    if reflections:
+        for name in reflections:
+            if name in ranks:
+                ranks[name] += REFLECTION_BONUS
+    # 정렬이 안정적이므로 우선순위가 같으면 폼에 나온 순서 유지
+    return sorted(ranks, key=lambda name: -ranks[name])
+
+class InjectionScheduler:
+    """폼마다 (필드, 페이로드) 주입 작업을 우선순위 순으로 필요할 때 하나씩 만들고, 폼들을 번갈아 가며 내보냄
+
+    skip(form, payload, fields)가 True인 작업(이미 확인된 취약점 등)은 건너뛰고,
+    예산(ScanBudget)을 다 쓴 폼/호스트의 작업은 더 만들지 않음
+    """
+
+    def __init__(self, forms, payloads, fields, targets, form_key, budget=None, skip=None, pairwise=False):
+        # fields(form) -> 우선순위 순 필드 목록, targets(form, payload, fields) -> 해당 페이로드를 넣을 수 있는 필드 목록
+        self.forms = forms
+        self.payloads = payloads
+        self.fields = fields
+        self.targets = targets
+        self.form_key = form_key
+        self.budget = budget or ScanBudget()
+        self.skip = skip or (lambda form, payload, fields: False)
+        self.pairwise = pairwise
+
+    def _form_jobs(self, form, fields):
+        # 단일 필드 주입을 먼저, 그다음 상위 필드 쌍에 동시에 주입
+        for field in fields:
+            for payload in self.payloads:
+                if field in self.targets(form, payload, fields):
+                    yield InjectionJob(form, payload, (field,))
+        if self.pairwise:
+            for pair in combinations(fields[:MAX_PAIRWISE_FIELDS], 2):
+                for payload in self.payloads:
+                    targets = self.targets(form, payload, fields)
+                    if all(field in targets for field in pair):
+                        yield InjectionJob(form, payload, pair)
+
+    def __iter__(self):
+        pending = deque((form, self._form_jobs(form, self.fields(form))) for form in self.forms)
+        while pending:
+            if self.budget.exhausted():
+                logger.info("[Scheduler] 전체 퍼징 예산(요청 수/시간)을 모두 사용해 작업 생성을 중단합니다.")
+                return
+            form, jobs = pending.popleft()
+            if not self.budget.allows(self.form_key(form), urlsplit(form['action']).netloc.lower()):
+                # 예산을 다 쓴 폼/호스트는 더 이상 작업을 만들지 않음
+                continue
+            for job in jobs:
+                if not self.skip(job.form, job.payload, job.fields):
+                    pending.append((form, jobs))
+                    yield job
+                    break
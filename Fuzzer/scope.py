@@ -0,0 +1,161 @@
+import logging
+import re
+from functools import lru_cache
+from urllib.parse import urlsplit, unquote
+
+logger = logging.getLogger(__name__)
+
+class _CompiledRules:
+    """한 user-agent 그룹의 Allow/Disallow 규칙을 접두사 트라이 + 와일드카드 정규식으로 컴파일한 결과"""
+
+    def __init__(self, rules, cache_size):
+        self._trie = {}
+        self._wildcards = []
+        for pattern, allow in rules:
+            if '*' in pattern or pattern.endswith('$'):
+                regex = re.escape(pattern).replace(r'\*', '.*')
+                if regex.endswith(r'\$'):
+                    regex = regex[:-2] + '$'
+                self._wildcards.append((re.compile(regex), len(pattern), allow))
+            else:
+                node = self._trie
+                for char in pattern:
+                    node = node.setdefault(char, {})
+                # 같은 경로에 Allow와 Disallow가 모두 있으면 Allow 우선
+                node[None] = node.get(None, False) or allow
+        self.allowed = lru_cache(maxsize=cache_size)(self._allowed)
+
+    def _allowed(self, path):
+        # RFC 9309: 가장 길게 일치하는 규칙을 적용하고, 길이가 같으면 Allow 우선
+        best_length = -1
+        best_allow = True
+        node = self._trie
+        if None in node:
+            best_length, best_allow = 0, node[None]
+        for length, char in enumerate(path, start=1):
+            node = node.get(char)
+            if node is None:
+                break
+            if None in node:
+                best_length, best_allow = length, node[None]
+        for regex, length, allow in self._wildcards:
+            if length >= best_length and regex.match(path):
+                if length > best_length or allow:
+                    best_length, best_allow = length, allow
+        return best_allow
+
+class RobotsRules:
+    """robots.txt를 한 번 파싱/컴파일해 두고 경로별 판정 결과를 LRU로 캐시
+
+    urllib.robotparser.RobotFileParser의 can_fetch(useragent, url), crawl_delay(useragent)와
+    같은 방식으로 사용할 수 있으며, '*' 와일드카드와 '$' 끝 표시를 지원
+    """
+
+    def __init__(self, cache_size=65536):
+        self.cache_size = cache_size
+        self._groups = []  # [(agents, rules, crawl_delay)]
+        self._compiled = {}
+
+    @classmethod
+    def parse(cls, text, cache_size=65536):
+        robots = cls(cache_size)
+        robots._parse_lines(text.splitlines())
+        return robots
+
+    def _parse_lines(self, lines):
+        agents, rules, delay = [], [], None
+        in_rules = False
+        for line in lines:
+            line = line.split('#', 1)[0].strip()
+            if ':' not in line:
+                continue
+            key, value = line.split(':', 1)
+            key, value = key.strip().lower(), value.strip()
+            if key == 'user-agent':
+                if in_rules:
+                    self._groups.append((agents, rules, delay))
+                    agents, rules, delay = [], [], None
+                    in_rules = False
+                agents.append(value.lower())
+            elif key in ('allow', 'disallow'):
+                in_rules = True
+                if agents and value:  # 빈 Disallow는 모두 허용
+                    rules.append((unquote(value), key == 'allow'))
+            elif key == 'crawl-delay':
+                in_rules = True
+                try:
+                    delay = float(value)
+                except ValueError:
+                    pass
+        if agents:
+            self._groups.append((agents, rules, delay))
+
+    def _group_for(self, useragent):
+        name = useragent.split('/')[0].lower()
+        default = None
+        for group in self._groups:
+            for agent in group[0]:
+                if agent == '*':
+                    default = default or group
+                elif agent in name:
+                    return group
+        return default
+
+    def _rules_for(self, useragent):
+        compiled = self._compiled.get(useragent)
+        if compiled is None:
+            group = self._group_for(useragent)
+            compiled = _CompiledRules(group[1] if group else [], self.cache_size)
+            self._compiled[useragent] = compiled
+        return compiled
+
+    def can_fetch(self, useragent, url):
+        parts = urlsplit(url)
+        path = unquote(parts.path) or '/'
+        if path == '/robots.txt':
+            return True
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        return self._rules_for(useragent).allowed(path)
+
+    def crawl_delay(self, useragent):
+        group = self._group_for(useragent)
+        return group[2] if group else None
+
+class CrawlScope:
+    """크롤링 범위(허용 호스트, 서브도메인, 포함/제외 패턴)와 robots 규칙을 한 번에 판정하고 URL별 결과를 캐시"""
+
+    def __init__(self, base_url, robots=None, allowed_hosts=None, include_subdomains=False,
+                 include_patterns=(), exclude_patterns=(), user_agent='*', cache_size=65536):
+        self.robots = robots
+        self.user_agent = user_agent
+        self.allowed_hosts = frozenset(host.lower() for host in (allowed_hosts or [urlsplit(base_url).netloc]))
+        self.include_subdomains = include_subdomains
+        self._include = re.compile('|'.join(f'(?:{p})' for p in include_patterns)) if include_patterns else None
+        self._exclude = re.compile('|'.join(f'(?:{p})' for p in exclude_patterns)) if exclude_patterns else None
+        self.check = lru_cache(maxsize=cache_size)(self._check)
+
+    def _host_allowed(self, netloc):
+        if netloc in self.allowed_hosts:
+            return True
+        if self.include_subdomains:
+            return any(netloc.endswith('.' + host) for host in self.allowed_hosts)
+        return False
+
+    def _check(self, url):
+        """범위 안이면 None, 범위 밖이면 사유('scheme', 'host', 'include', 'exclude', 'robots')를 반환"""
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https'):
+            return 'scheme'
+        if not self._host_allowed(parts.netloc.lower()):
+            return 'host'
+        if self._include is not None and not self._include.search(url):
+            return 'include'
+        if self._exclude is not None and self._exclude.search(url):
+            return 'exclude'
+        if self.robots is not None and not self.robots.can_fetch(self.user_agent, url):
+            return 'robots'
+        return None
+
+    def is_allowed(self, url):
+        return self.check(url) is None
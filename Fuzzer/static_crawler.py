@@ -0,0 +1,107 @@
+import asyncio
+import logging
+from urllib.parse import urljoin
+
+import aiohttp
+
+from frontier import SeenIndex, create_url_store
+from html_parsers import extract_links
+from scope import CrawlScope
+from throttle import HostThrottle
+
+logger = logging.getLogger(__name__)
+
+class StaticCrawler:
+    """aiohttp 기반 정적 크롤러 - 공유 프론티어에서 최대 concurrency개의 요청을 동시에 처리"""
+
+    def __init__(self, base_url, robot_parser=None, concurrency=10, per_host_limit=4, timeout=10, parser=None, url_store='set', scope=None, throttle=None):
+        self.base_url = base_url
+        self.robot_parser = robot_parser
+        # 호스트/스킴/robots 판정을 한 번에 수행하고 URL별로 캐시
+        self.scope = scope or CrawlScope(base_url, robots=robot_parser)
+        self.concurrency = concurrency
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.parser = parser  # None이면 설치된 가장 빠른 파서 백엔드 사용
+        self.urls = set()  # 리포트에 출력할 수집 URL
+        # 큐에 넣었거나 방문한 URL (표준 형태) - 대규모 크롤링에서는 'fingerprint' 또는 'bloom'으로 메모리 절약
+        self.seen = SeenIndex(create_url_store(url_store))
+        # 호스트별 동시 요청 수를 응답 상태/지연 시간에 따라 조절 (퍼저, 동적 크롤러와 공유 가능)
+        self.throttle = throttle or HostThrottle(initial_limit=per_host_limit, max_limit=concurrency)
+
+    def is_valid_url(self, url):
+        reason = self.scope.check(url)
+        if reason == 'robots':
+            logger.info(f"robots.txt에 의해 크롤링이 금지된 URL: {url}")
+        return reason is None
+
+    def crawl(self):
+        return asyncio.run(self.crawl_async())
+
+    async def crawl_async(self):
+        to_visit = asyncio.Queue()
+        self.seen.add(self.base_url)
+        to_visit.put_nowait(self.base_url)
+
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        connector = aiohttp.TCPConnector(limit=self.concurrency)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            workers = [
+                asyncio.create_task(self._worker(session, to_visit))
+                for _ in range(self.concurrency)
+            ]
+            # 모든 URL이 처리되면(큐가 비고 진행 중인 요청이 없으면) 워커 종료
+            await to_visit.join()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        logger.info(f"[StaticCrawler] 크롤링 완료: {len(self.urls)}개의 URL 수집.")
+        return self.urls
+
+    async def _worker(self, session, to_visit):
+        while True:
+            url = await to_visit.get()
+            try:
+                for new_url in await self._fetch_links(session, url):
+                    try:
+                        if not self.is_valid_url(new_url):
+                            continue
+                        # 표준 형태 기준으로 처음 보는 URL만 큐에 추가
+                        canonical_url = self.seen.add(new_url)
+                    except ValueError as e:
+                        # 잘못된 URL 하나 때문에 같은 페이지의 나머지 링크를 잃지 않도록 건너뜀
+                        logger.warning(f"[StaticCrawler] 잘못된 URL 건너뜀 - URL: {new_url}, 에러: {e}")
+                        continue
+                    if canonical_url:
+                        self.urls.add(canonical_url)
+                        to_visit.put_nowait(canonical_url)
+            except Exception as e:
+                # 예상하지 못한 오류도 워커를 종료시키지 않고 해당 URL만 실패로 처리
+                logger.error(f"[StaticCrawler] URL 처리 중 오류 발생 - URL: {url}, 에러: {e}")
+            finally:
+                to_visit.task_done()
+
+    async def _fetch_links(self, session, url):
+        try:
+            async with self.throttle.slot_async(url) as slot:
+                logger.info(f"[StaticCrawler] 방문 중: {url}")
+                async with session.get(url) as response:
+                    slot.observe(response.status, response.headers.get('Retry-After'))
+                    if response.status != 200:
+                        logger.warning(f"[StaticCrawler] 비정상적인 상태 코드({response.status}) - URL: {url}")
+                        return []
+                    text = await response.text(errors='replace')
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"[StaticCrawler] 요청 실패 - URL: {url}, 에러: {e}")
+            return []
+
+        links = []
+        for href in extract_links(text, url, self.parser):
+            try:
+                new_url = urljoin(self.base_url, href)
+            except ValueError as e:
+                logger.warning(f"[StaticCrawler] 잘못된 링크 건너뜀 - 페이지: {url}, 링크: {href}, 에러: {e}")
+                continue
+            links.append(new_url.rstrip('/'))
+        return links
@@ -0,0 +1,48 @@
+import asyncio
+import contextlib
+import os
+import sys
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# 퍼저 모듈은 Fuzzer/ 디렉토리 기준으로 임포트
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+@pytest.fixture
+def serve():
+    """{경로: 핸들러}로 로컬 aiohttp 서버를 띄우고 기본 URL을 넘겨주는 async 컨텍스트 매니저"""
+    @contextlib.asynccontextmanager
+    async def serve(routes):
+        app = web.Application()
+        for path, handler in routes.items():
+            app.router.add_route('*', path, handler)
+        server = TestServer(app, host='127.0.0.1')
+        await server.start_server()
+        try:
+            yield str(server.make_url('/')).rstrip('/')
+        finally:
+            await server.close()
+    return serve
+
+@pytest.fixture(scope='session')
+def fuzzer_module(tmp_path_factory):
+    """fuzzer.py는 임포트할 때 현재 디렉토리에 fuzzer.log를 만들므로 임시 디렉토리에서 임포트"""
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp('fuzzer'))
+    try:
+        import fuzzer
+    finally:
+        os.chdir(cwd)
+    return fuzzer
+
+async def stream_parts(request, parts, delay=0.01):
+    """본문을 여러 번에 나눠 보내는 응답 (각 부분 사이에 delay초 대기)"""
+    response = web.StreamResponse(headers={'Content-Type': 'text/html; charset=utf-8'})
+    await response.prepare(request)
+    for part in parts:
+        await response.write(part)
+        await asyncio.sleep(delay)
+    await response.write_eof()
+    return response
@@ -0,0 +1,55 @@
+import asyncio
+
+from baseline import BENIGN_VALUE, BaselineCache, body_hash, build_baseline, normalize_body
+from detectors import ResponseAnalyzer
+
+PAYLOAD = "' OR '1'='1"
+
+def analyzer():
+    return ResponseAnalyzer({PAYLOAD: 'SQL Injection'})
+
+def test_normalize_removes_injected_values_numbers_and_whitespace():
+    first = f"<p>Search: {BENIGN_VALUE}</p>\n  <span>took 12 ms</span>".encode()
+    second = "<p>Search: &#x27; OR &#x27;1&#x27;=&#x27;1</p> <span>took 7 ms</span>".encode()
+    assert normalize_body(first, (BENIGN_VALUE,)) == normalize_body(second, (PAYLOAD,))
+
+def test_baseline_summarizes_body():
+    body = b'<p>Error: 3 results for test</p>'
+    baseline = build_baseline(200, body, analyzer())
+    assert baseline.status == 200
+    assert baseline.length == len(body)
+    assert baseline.body_hash == body_hash(body, (BENIGN_VALUE,))
+    assert baseline.signatures == {b'error'}
+
+def test_is_unchanged_compares_status_and_normalized_hash():
+    baseline = build_baseline(200, b'<p>Results for test: 0</p>', analyzer())
+    assert BaselineCache.is_unchanged(baseline, 200, f'<p>Results for {PAYLOAD}: 0</p>'.encode(), PAYLOAD)
+    assert not BaselineCache.is_unchanged(baseline, 500, f'<p>Results for {PAYLOAD}: 0</p>'.encode(), PAYLOAD)
+    assert not BaselineCache.is_unchanged(baseline, 200, b'<p>SQL syntax error</p>', PAYLOAD)
+    assert not BaselineCache.is_unchanged(None, 200, b'', PAYLOAD)
+
+def test_cache_fetches_each_form_once_for_concurrent_callers():
+    calls = []
+
+    async def fetch(session, form):
+        calls.append(form['action'])
+        await asyncio.sleep(0.01)
+        return 200, b'ok'
+
+    async def main():
+        cache = BaselineCache(analyzer(), fetch)
+        form = {'action': 'http://example.com/a', 'method': 'get', 'inputs': []}
+        return await asyncio.gather(*(cache.get(None, dict(form)) for _ in range(5)))
+
+    baselines = asyncio.run(main())
+    assert calls == ['http://example.com/a']
+    assert len(set(baselines)) == 1
+
+def test_failed_baseline_fetch_yields_none():
+    async def fetch(session, form):
+        raise ConnectionError('refused')
+
+    async def main():
+        return await BaselineCache(analyzer(), fetch).get(None, {'action': 'http://example.com/a', 'inputs': []})
+
+    assert asyncio.run(main()) is None
@@ -0,0 +1,61 @@
+from checkpoint import CrawlCheckpoint
+
+BASE_URL = 'http://example.com'
+
+def test_interrupted_crawl_can_resume(tmp_path):
+    path = str(tmp_path / 'checkpoint.sqlite')
+    checkpoint = CrawlCheckpoint(path, batch_size=1000, flush_interval=3600)
+    checkpoint.reset(BASE_URL, 2)
+    checkpoint.save_static_urls([f'{BASE_URL}/a', f'{BASE_URL}/b'])
+    checkpoint.enqueue(BASE_URL, 0)
+    checkpoint.enqueue(f'{BASE_URL}/a', 1)
+    checkpoint.enqueue(f'{BASE_URL}/a', 1)
+    checkpoint.mark_visited(BASE_URL)
+    checkpoint.save_result({'url': BASE_URL, 'forms': [{'action': f'{BASE_URL}/login', 'method': 'post', 'inputs': []}]})
+    checkpoint.complete(BASE_URL)
+    # 버퍼에 남은 기록은 close()에서 반영
+    checkpoint.close()
+
+    resumed = CrawlCheckpoint(path)
+    assert resumed.can_resume(BASE_URL)
+    assert not resumed.can_resume('http://other.com')
+    assert resumed.load_static_urls() == {f'{BASE_URL}/a', f'{BASE_URL}/b'}
+    assert list(resumed.iter_frontier()) == [(f'{BASE_URL}/a', 1)]
+    assert list(resumed.iter_visited()) == [BASE_URL]
+    assert [(url, result['url']) for url, result in resumed.iter_results()] == [(BASE_URL, BASE_URL)]
+    assert resumed.saved_max_depth() == 2
+    resumed.close()
+
+def test_finished_crawl_is_marked_completed(tmp_path):
+    path = str(tmp_path / 'checkpoint.sqlite')
+    checkpoint = CrawlCheckpoint(path)
+    checkpoint.reset(BASE_URL, 1)
+    checkpoint.enqueue(BASE_URL, 0)
+    checkpoint.complete(BASE_URL)
+    checkpoint.close()
+
+    reopened = CrawlCheckpoint(path)
+    assert not reopened.can_resume(BASE_URL)
+    assert reopened.load_static_urls() is None
+    reopened.reset(BASE_URL, 1)
+    assert reopened.pending_count() == 0
+    reopened.close()
+
+def test_writes_are_batched(tmp_path):
+    checkpoint = CrawlCheckpoint(str(tmp_path / 'checkpoint.sqlite'), batch_size=3, flush_interval=3600)
+    checkpoint.reset(BASE_URL, 1)
+    checkpoint.enqueue(f'{BASE_URL}/1', 1)
+    checkpoint.enqueue(f'{BASE_URL}/2', 1)
+    assert checkpoint.pending_count() == 0
+    checkpoint.enqueue(f'{BASE_URL}/3', 1)
+    assert checkpoint.pending_count() == 3
+    checkpoint.close()
+
+def test_results_are_keyed_by_frontier_url(tmp_path):
+    checkpoint = CrawlCheckpoint(str(tmp_path / 'checkpoint.sqlite'))
+    checkpoint.reset(BASE_URL, 1)
+    checkpoint.save_result({'url': f'{BASE_URL}/a/', 'forms': []}, f'{BASE_URL}/a')
+    checkpoint.save_result({'url': f'{BASE_URL}/a/', 'forms': [{'action': 'x'}]}, f'{BASE_URL}/a')
+    checkpoint.flush()
+    assert [(url, result['forms']) for url, result in checkpoint.iter_results()] == [(f'{BASE_URL}/a', [{'action': 'x'}])]
+    checkpoint.close()
@@ -0,0 +1,121 @@
+import asyncio
+import re
+
+import confirmation
+from baseline import build_baseline
+from confirmation import Confirmer
+from detectors import ResponseAnalyzer
+
+FORM = {'action': 'http://example.com/search', 'method': 'get', 'inputs': [{'tag': 'input', 'type': 'text', 'name': 'q'}]}
+PAYLOADS = {"' OR '1'='1": 'SQL Injection', "<script>alert('XSS')</script>": 'XSS', '; ls': 'Command Injection'}
+
+class FakeTarget:
+    # respond(value) -> (상태 코드, 본문, 소요 시간)을 돌려주는 가짜 probe, 보낸 값과 timing 플래그를 기록
+    def __init__(self, respond):
+        self.respond = respond
+        self.sent = []
+
+    async def __call__(self, session, form, fields, value, timing=False):
+        self.sent.append((value, timing))
+        return self.respond(value)
+
+def confirm(respond, vuln_type, baseline=None):
+    target = FakeTarget(respond)
+    confirmer = Confirmer(ResponseAnalyzer(PAYLOADS), target, lambda form: form['action'])
+    result = asyncio.run(confirmer.confirm(None, FORM, ('q',), vuln_type, baseline))
+    return result, target
+
+def test_sql_quote_pair_confirms():
+    def respond(value):
+        # 짝이 맞지 않는 따옴표에서만 SQL 에러
+        broken = value.count("'") % 2 == 1
+        return 200, b'You have an error in your SQL syntax' if broken else b'<p>ok</p>', 0.01
+
+    (confirmed, technique), _ = confirm(respond, 'SQL Injection')
+    assert confirmed and technique.startswith('따옴표 에러 쌍')
+
+def test_sql_error_on_every_input_is_not_confirmed():
+    (confirmed, _), _ = confirm(lambda value: (200, b'You have an error in your SQL syntax', 0.01), 'SQL Injection')
+    assert not confirmed
+
+def test_sql_boolean_pair_confirms_against_baseline():
+    analyzer = ResponseAnalyzer(PAYLOADS)
+    baseline = build_baseline(200, b'<p>1 result</p>', analyzer)
+
+    def respond(value):
+        return 200, b'<p>1 result</p>' if value.endswith("'1'='1") else b'<p>no results</p>', 0.01
+
+    (confirmed, technique), _ = confirm(respond, 'SQL Injection', baseline)
+    assert confirmed and technique.startswith('참/거짓 조건 쌍')
+
+def test_sql_boolean_pair_ignores_overloaded_false_probe():
+    analyzer = ResponseAnalyzer(PAYLOADS)
+    baseline = build_baseline(200, b'<p>1 result</p>', analyzer)
+
+    def respond(value):
+        # 거짓 조건 요청만 서버 과부하로 503
+        if value.endswith(('2', "'1'='2")):
+            return 503, b'<p>Service Unavailable</p>', 0.01
+        return 200, b'<p>1 result</p>', 0.01
+
+    (confirmed, _), _ = confirm(respond, 'SQL Injection', baseline)
+    assert not confirmed
+
+def test_sql_boolean_pair_needs_a_body_difference():
+    analyzer = ResponseAnalyzer(PAYLOADS)
+    baseline = build_baseline(200, b'<p>1 result</p>', analyzer)
+
+    def respond(value):
+        # 거짓 조건에서 상태 코드만 바뀌고 본문은 같음
+        return (404 if value.endswith(('2', "'1'='2")) else 200), b'<p>1 result</p>', 0.01
+
+    (confirmed, _), _ = confirm(respond, 'SQL Injection', baseline)
+    assert not confirmed
+
+def test_command_echo_needs_the_computed_marker():
+    def shell(value):
+        match = re.search(r'fz\$\(\((\d+)\+(\d+)\)\)zf', value)
+        return 200, f'fz{int(match.group(1)) + int(match.group(2))}zf'.encode() if match else b'', 0.01
+
+    (confirmed, _), _ = confirm(shell, 'Command Injection')
+    assert confirmed
+    # 계산하지 않고 그대로 반사만 하는 응답은 확인되지 않음 (시간 지연도 없음)
+    (confirmed, _), target = confirm(lambda value: (200, value.encode(), 0.01), 'Command Injection')
+    assert not confirmed
+
+def test_command_timing_probes_are_flagged(monkeypatch):
+    monkeypatch.setattr(confirmation, 'SLEEP_SECONDS', 3)
+
+    def respond(value):
+        return 200, b'', 3.1 if value.endswith('sleep 3') else 0.05
+
+    (confirmed, technique), target = confirm(respond, 'Command Injection')
+    assert confirmed and technique.startswith('시간 지연 쌍')
+    timing = [value for value, flag in target.sent if flag]
+    assert timing and all('sleep' in value for value in timing)
+    assert all(not flag for value, flag in target.sent if 'sleep' not in value)
+
+def test_markup_echo_requires_unescaped_tag():
+    (confirmed, _), _ = confirm(lambda value: (200, value.encode(), 0.01), 'XSS')
+    assert confirmed
+    escaped = lambda value: (200, value.replace('<', '&lt;').encode(), 0.01)
+    (confirmed, _), _ = confirm(escaped, 'XSS')
+    assert not confirmed
+
+def test_concurrent_candidates_share_one_confirmation():
+    target = FakeTarget(lambda value: (200, value.encode(), 0.01))
+    confirmer = Confirmer(ResponseAnalyzer(PAYLOADS), target, lambda form: form['action'])
+
+    async def main():
+        return await asyncio.gather(*(confirmer.confirm(None, FORM, ('q',), 'XSS', None) for _ in range(5)))
+
+    results = asyncio.run(main())
+    assert len(set(results)) == 1 and results[0][0]
+    assert confirmer.probes_sent == 1
+
+def test_probe_errors_leave_candidate_unconfirmed():
+    def respond(value):
+        raise ConnectionError('refused')
+
+    (confirmed, technique), _ = confirm(respond, 'XSS')
+    assert (confirmed, technique) == (False, None)
@@ -0,0 +1,87 @@
+import pytest
+
+from detectors import ResponseAnalyzer
+
+SQL_PAYLOAD = "' OR '1'='1"
+XSS_PAYLOAD = "<script>alert('XSS')</script>"
+CMD_PAYLOAD = "; ls"
+
+@pytest.fixture
+def analyzer():
+    return ResponseAnalyzer({SQL_PAYLOAD: 'SQL Injection', XSS_PAYLOAD: 'XSS', CMD_PAYLOAD: 'Command Injection'})
+
+def kinds(hits):
+    return [hit.kind for hit in hits]
+
+def test_scan_collects_every_signature_in_one_pass(analyzer):
+    body = f"<p>{XSS_PAYLOAD}</p> SQL Syntax Error uid=33 sh: foo: command not found".encode()
+    hits = analyzer.scan(body)
+    assert set(kinds(hits)) == {'reflection', 'sql_error', 'command_output', 'command_not_found'}
+    assert [hit.signature.lower() for hit in hits if hit.kind == 'sql_error'] == [b'sql', b'syntax', b'error']
+    assert analyzer.signatures(hits) == {b'sql', b'syntax', b'error', b'uid=', b'command not found'}
+
+@pytest.mark.parametrize('payload, body, expected', [
+    (SQL_PAYLOAD, b'You have an error in your SQL syntax', 'SQL Injection'),
+    (SQL_PAYLOAD, b'Welcome back', None),
+    (XSS_PAYLOAD, f'<div>{XSS_PAYLOAD}</div>'.encode(), 'XSS'),
+    # 이스케이프된 반사는 취약점이 아님
+    (XSS_PAYLOAD, b'<div>&lt;script&gt;alert(&#x27;XSS&#x27;)&lt;/script&gt;</div>', None),
+    (CMD_PAYLOAD, b'uid=33(www-data) gid=33', 'Command Injection'),
+    (CMD_PAYLOAD, b'sh: 1: ls: command not found', 'Command Injection'),
+    # 'command not found'가 없다는 것만으로는 판정하지 않음
+    (CMD_PAYLOAD, b'nothing to see', None),
+])
+def test_verdict(analyzer, payload, body, expected):
+    assert analyzer.verdict(payload, analyzer.scan(body)) == expected
+
+def test_baseline_signatures_are_ignored(analyzer):
+    hits = analyzer.scan(b'Error: invalid login')
+    assert analyzer.verdict(SQL_PAYLOAD, hits) == 'SQL Injection'
+    assert analyzer.verdict(SQL_PAYLOAD, hits, ignore=frozenset({b'error'})) is None
+
+def test_xss_reflection_of_other_payload_does_not_count():
+    analyzer = ResponseAnalyzer({'<b>one</b>': 'XSS', '<i>two</i>': 'XSS'})
+    assert analyzer.verdict('<b>one</b>', analyzer.scan(b'<i>two</i>')) is None
+    assert analyzer.verdict('<b>one</b>', analyzer.scan(b'<b>one</b>')) == 'XSS'
+
+def stream(analyzer, payload, body, chunk_size, charset='utf-8', ignore=frozenset()):
+    scanner = analyzer.stream(payload, charset, ignore)
+    fed = 0
+    for start in range(0, len(body), chunk_size):
+        fed += 1
+        if scanner.feed(body[start:start + chunk_size]):
+            break
+    return scanner, fed
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 7, 64, 4096])
+def test_stream_matches_whole_body_scan(analyzer, chunk_size):
+    # 청크 경계에 걸친 시그니처도 한 번에 검사한 결과와 같아야 함
+    body = (b'x' * 50 + b'sh: ls: command not found ' + b'y' * 30 + b'uid=0 ' + b'z' * 20) * 3
+    scanner, _ = stream(analyzer, XSS_PAYLOAD, body, chunk_size)
+    assert scanner.finish() == (None, analyzer.scan(body))
+
+def test_stream_stops_reading_once_verdict_is_certain(analyzer):
+    body = b'<html>' + b'You have an error in your SQL syntax' + b'.' * 100000
+    scanner, fed = stream(analyzer, SQL_PAYLOAD, body, 1024)
+    assert fed == 1
+    vuln_type, _ = scanner.finish()
+    assert vuln_type == 'SQL Injection'
+    assert 'SQL syntax' in scanner.evidence
+
+def test_stream_respects_ignore_set(analyzer):
+    body = b'Login error. ' * 10
+    scanner, _ = stream(analyzer, SQL_PAYLOAD, body, 16, ignore=frozenset({b'error'}))
+    assert scanner.finish()[0] is None
+
+def test_stream_transcodes_non_ascii_compatible_charsets(analyzer):
+    body = f'<p>{XSS_PAYLOAD}</p>'.encode('utf-16')
+    scanner, _ = stream(analyzer, XSS_PAYLOAD, body, 5, charset='utf-16')
+    assert scanner.finish()[0] == 'XSS'
+    assert XSS_PAYLOAD in scanner.evidence
+
+def test_stream_scans_ascii_compatible_bytes_without_decoding(analyzer):
+    # EUC-KR 본문의 한글 바이트는 그대로 두고 ASCII 시그니처만 비교
+    body = '오류: SQL syntax 에러'.encode('euc-kr')
+    scanner, _ = stream(analyzer, SQL_PAYLOAD, body, 4, charset='euc-kr')
+    assert scanner.finish()[0] == 'SQL Injection'
+    assert '오류' in scanner.evidence
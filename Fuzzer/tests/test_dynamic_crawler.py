@@ -0,0 +1,241 @@
+import json
+import threading
+import time
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from frontier import canonicalize_url
+
+BASE_URL = 'http://site.test'
+
+class FakeElement:
+    def __init__(self, href=None):
+        self.href = href
+
+    def is_displayed(self):
+        return True
+
+    def get_attribute(self, name):
+        return self.href if name == 'href' else None
+
+class FakeDriver:
+    """site: {URL: [링크 URL, ...]}를 브라우저처럼 돌려주는 가짜 WebDriver
+
+    delays: {URL: 로드 시간(초)}, redirects: {URL: 최종 URL}, broken=True면 모든 로드가 실패 (죽은 브라우저)
+    """
+
+    def __init__(self, site, log, delays=None, redirects=None, forms=None, broken=False):
+        self.site = site
+        self.log = log
+        self.delays = delays or {}
+        self.redirects = redirects or {}
+        self.forms = forms or {}
+        self.broken = broken
+        self.current_url = None
+        self.quit_called = False
+
+    def get(self, url):
+        if self.broken:
+            raise WebDriverException('chrome not reachable')
+        time.sleep(self.delays.get(url, 0))
+        self.current_url = self.redirects.get(url, url)
+        self.log.append(url)
+
+    def find_element(self, by, value):
+        return FakeElement()
+
+    def find_elements(self, by, value):
+        return [FakeElement(href) for href in self.site.get(self.current_url, [])]
+
+    def execute_script(self, script):
+        return json.dumps({'links': self.site.get(self.current_url, []), 'forms': self.forms.get(self.current_url, []), 'inputs': []})
+
+    def quit(self):
+        self.quit_called = True
+
+def page(path):
+    return BASE_URL + path
+
+def crawl(fuzzer_module, drivers, max_depth, timeout=10, **options):
+    # 크롤링이 끝나지 않으면(멈춤) 실패로 처리
+    visited, results = set(), []
+    thread = threading.Thread(
+        target=fuzzer_module.crawl_dynamic_pool,
+        args=(drivers, page('/'), max_depth, visited, results),
+        kwargs=options, daemon=True
+    )
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), 'crawl did not finish'
+    return visited, results
+
+def visited_paths(results):
+    return sorted(canonicalize_url(result['url'])[len(BASE_URL):] or '/' for result in results)
+
+def test_pages_beyond_max_depth_are_not_visited(fuzzer_module):
+    site = {page('/'): [page('/a')], page('/a'): [page('/b')], page('/b'): [page('/c')], page('/c'): []}
+    log = []
+    _, results = crawl(fuzzer_module, [FakeDriver(site, log)], max_depth=2)
+    assert visited_paths(results) == ['/', '/a', '/b']
+
+def test_each_page_is_visited_once_across_workers(fuzzer_module):
+    paths = ['/', '/a', '/b', '/c', '/d']
+    site = {page(path): [page(other) for other in paths if other != path] for path in paths}
+    log = []
+    drivers = [FakeDriver(site, log, delays={page(path): 0.01 for path in paths}) for _ in range(3)]
+    _, results = crawl(fuzzer_module, drivers, max_depth=3)
+    assert sorted(log) == sorted(page(path) for path in paths)
+    assert visited_paths(results) == sorted(paths)
+
+def test_shallowest_discovery_wins_with_parallel_workers(fuzzer_module):
+    # /z는 /a -> /b -> /z(깊이 3)와 느린 /c -> /z(깊이 2) 두 경로로 발견되며, /w는 /z가 깊이 2일 때만 max_depth 안에 들어옴
+    site = {
+        page('/'): [page('/a'), page('/c')],
+        page('/a'): [page('/b')],
+        page('/b'): [page('/z')],
+        page('/c'): [page('/z')],
+        page('/z'): [page('/w')],
+        page('/w'): [],
+    }
+    for workers in (1, 2):
+        log = []
+        drivers = [FakeDriver(site, log, delays={page('/c'): 0.2}) for _ in range(workers)]
+        _, results = crawl(fuzzer_module, drivers, max_depth=3)
+        assert '/w' in visited_paths(results), f'{workers} workers'
+
+def test_dead_browser_does_not_drain_the_frontier(fuzzer_module):
+    paths = ['/'] + [f'/p{index}' for index in range(10)]
+    site = {page('/'): [page(path) for path in paths[1:]]}
+    log = []
+    dead = FakeDriver(site, log, broken=True)
+    live = FakeDriver(site, log, delays={page(path): 0.01 for path in paths})
+    _, results = crawl(fuzzer_module, [live, dead], max_depth=1)
+    assert visited_paths(results) == sorted(paths)
+
+def test_dead_browser_is_restarted_with_factory(fuzzer_module):
+    paths = ['/'] + [f'/p{index}' for index in range(5)]
+    site = {page('/'): [page(path) for path in paths[1:]]}
+    log = []
+    dead = FakeDriver(site, log, broken=True)
+    drivers = [dead]
+    _, results = crawl(fuzzer_module, drivers, max_depth=1, driver_factory=lambda: FakeDriver(site, log))
+    assert visited_paths(results) == sorted(paths)
+    assert dead.quit_called and drivers[0] is not dead
+
+def test_crawl_ends_when_every_browser_is_dead(fuzzer_module):
+    site = {page('/'): []}
+    drivers = [FakeDriver(site, [], broken=True) for _ in range(2)]
+    _, results = crawl(fuzzer_module, drivers, max_depth=2)
+    assert results == []
+
+def test_visit_page_records_redirect_and_filters_next_urls(fuzzer_module):
+    class Robots:
+        def can_fetch(self, agent, url):
+            return not url.endswith('/private')
+
+    site = {page('/home'): [page('/a/'), page('/seen'), page('/private'), 'http://other.test/x']}
+    forms = {page('/home'): [{'action': '', 'method': 'post', 'inputs': [{'tag': 'input', 'type': 'text', 'name': 'q'}]}]}
+    driver = FakeDriver(site, [], redirects={page('/'): page('/home')}, forms=forms)
+    visited, results = set(), []
+    seen = fuzzer_module.SeenIndex()
+    seen.add(page('/seen'))
+    next_items = fuzzer_module.visit_page_dynamic(driver, page('/'), 0, BASE_URL, visited, results, Robots(), seen=seen)
+    assert next_items == [(page('/a'), 1)]
+    assert visited == {page('/home')} and page('/home') in seen
+    assert results[0]['url'] == page('/home')
+    assert results[0]['forms'] == [{'action': page('/home'), 'method': 'post', 'inputs': [{'tag': 'input', 'type': 'text', 'name': 'q'}]}]
+
+class ScriptDriver(FakeDriver):
+    # execute_script 결과(JSON 문자열)를 직접 지정하거나, script_error가 있으면 스크립트 실행이 실패하는 가짜 브라우저
+    def __init__(self, extracted=None, script_error=None, page_source='', links=()):
+        super().__init__({page('/'): list(links)}, [])
+        self.extracted = extracted
+        self.script_error = script_error
+        self.page_source = page_source
+        self.current_url = page('/')
+
+    def execute_script(self, script):
+        if self.script_error:
+            raise self.script_error
+        return json.dumps(self.extracted)
+
+def test_extract_page_parses_script_result(fuzzer_module):
+    frame = page('/frame.html')
+    driver = ScriptDriver({
+        'links': [page('/a/'), page('/a'), 'http://other.test/b', 'mailto:me@site.test', 'javascript:void(0)'],
+        'forms': [{'action': '', 'method': 'get', 'inputs': [{'tag': 'input', 'type': 'text', 'name': 'q'}]}],
+        'inputs': [{'tag': 'input', 'type': 'text', 'name': 'top'}, {'tag': 'textarea', 'type': 'textarea', 'name': 'note', 'url': frame}],
+    })
+    urls, forms, inputs = fuzzer_module.extract_page_dynamic(driver, page('/'), BASE_URL)
+    assert urls == {page('/a')}
+    assert forms == [{'action': page('/'), 'method': 'get', 'inputs': [{'tag': 'input', 'type': 'text', 'name': 'q'}]}]
+    assert inputs[1]['url'] == frame
+
+def test_frame_inputs_are_fuzzed_against_the_frame_url(fuzzer_module):
+    frame = page('/frame.html')
+    results = [{
+        'url': page('/'),
+        'forms': [],
+        'independent_inputs': [{'tag': 'input', 'type': 'text', 'name': 'top'}, {'tag': 'input', 'type': 'text', 'name': 'inner', 'url': frame}],
+    }]
+    forms = fuzzer_module.index_forms(results).forms()
+    assert {form['inputs'][0]['name']: form['action'] for form in forms} == {'top': page('/'), 'inner': frame}
+    assert all('url' not in form['inputs'][0] for form in forms)
+
+def test_script_error_falls_back_to_page_source(fuzzer_module):
+    source = '<html><body><form action="/login" method="post"><input type="text" name="user"></form><input name="q"></body></html>'
+    driver = ScriptDriver(script_error=WebDriverException('javascript error'), page_source=source, links=[page('/next/')])
+    results = []
+    next_items = fuzzer_module.visit_page_dynamic(driver, page('/'), 0, BASE_URL, set(), results)
+    assert next_items == [(page('/next'), 1)]
+    assert [form['action'] for form in results[0]['forms']] == [page('/login')]
+    assert [field['name'] for field in results[0]['independent_inputs']] == ['q']
+
+def interrupted_checkpoint(tmp_path, max_depth=1):
+    # /는 처리 완료, /a는 /a/로 리다이렉트되어 결과까지 저장했지만 complete() 전에 중단된 체크포인트
+    from checkpoint import CrawlCheckpoint
+
+    checkpoint = CrawlCheckpoint(str(tmp_path / 'checkpoint.sqlite'))
+    checkpoint.reset(page('/'), max_depth)
+    checkpoint.enqueue(page('/'), 0)
+    checkpoint.mark_visited(page('/'))
+    checkpoint.save_result({'url': page('/'), 'forms': [], 'independent_inputs': []}, page('/'))
+    checkpoint.complete(page('/'))
+    checkpoint.enqueue(page('/a'), 1)
+    checkpoint.mark_visited(page('/a/'))
+    checkpoint.save_result({'url': page('/a/'), 'forms': [], 'independent_inputs': []}, page('/a'))
+    checkpoint.flush()
+    return checkpoint
+
+def test_resume_revisits_unfinished_page_once(fuzzer_module, tmp_path):
+    checkpoint = interrupted_checkpoint(tmp_path)
+    log = []
+    driver = FakeDriver({page('/a'): []}, log, redirects={page('/a'): page('/a/')})
+    _, results = crawl(fuzzer_module, [driver], max_depth=1, checkpoint=checkpoint, resume=True)
+    assert log == [page('/a')]
+    assert [result['url'] for result in results] == [page('/'), page('/a/')]
+    checkpoint.close()
+
+def test_resume_rejects_a_different_max_depth(fuzzer_module, tmp_path):
+    checkpoint = interrupted_checkpoint(tmp_path, max_depth=1)
+    with pytest.raises(ValueError):
+        fuzzer_module.crawl_dynamic_pool([FakeDriver({}, [])], page('/'), 3, set(), [], checkpoint=checkpoint, resume=True)
+    checkpoint.close()
+
+def test_browser_load_time_is_not_a_throttle_latency_sample(fuzzer_module):
+    from throttle import HostThrottle
+
+    # smoothing=1.0: 느린 로드 하나만 반영돼도 한도가 줄어드는 설정
+    throttle = HostThrottle(initial_limit=8, smoothing=1.0)
+    state = throttle.state(page('/'))
+    # 정적 요청으로 만들어진 짧은 기준 지연 시간
+    for _ in range(5):
+        with throttle.slot(page('/')) as slot:
+            slot.observe(200)
+    limit = state.limit
+    site = {page(f'/p{index}'): [] for index in range(2)}
+    driver = FakeDriver(site, [], delays={url: 0.2 for url in site})
+    for url in site:
+        fuzzer_module.visit_page_dynamic(driver, url, 1, BASE_URL, set(), [], throttle=throttle)
+    assert state.limit >= limit
@@ -0,0 +1,96 @@
+import json
+import re
+
+import pytest
+
+from exporters import DEFAULT_REPORT_FORMATS, generate_reports, parse_report_formats
+from scan_store import finding_fingerprint
+
+CRAWLED = ['http://example.com/', 'http://example.com/search']
+EXTRACTION = [{'url': 'http://example.com/', 'forms': [{'action': 'http://example.com/search', 'method': 'get', 'inputs': [{'name': 'q', 'type': 'text'}]}]}]
+FINDINGS = [{'type': 'XSS', 'payload': "<script>alert('XSS')</script>", 'form': 'http://example.com/search', 'parameter': 'q', 'response_code': 200, 'evidence': '</script><b>', 'confirmation': '마커 태그 반사'}]
+ATTEMPTS = [
+    {'form_action': 'http://example.com/search', 'parameter': 'q', 'payload': "<script>alert('XSS')</script>", 'response_code': 200, 'result': 'XSS 취약점 발견'},
+    {'form_action': 'http://example.com/search', 'parameter': 'q', 'payload': "' OR '1'='1", 'response_code': 200, 'result': '취약점 없음'},
+]
+
+def write(tmp_path, formats):
+    return generate_reports(formats, CRAWLED, EXTRACTION, FINDINGS, ATTEMPTS, output_base=str(tmp_path / 'report'))
+
+@pytest.mark.parametrize('text, expected', [
+    ('json', ('json',)),
+    (' PDF, sarif ,json,pdf ', ('pdf', 'sarif', 'json')),
+    ('xml, html', ('html',)),
+    ('', DEFAULT_REPORT_FORMATS),
+    (None, DEFAULT_REPORT_FORMATS),
+    ('xml', DEFAULT_REPORT_FORMATS),
+])
+def test_parse_report_formats(text, expected):
+    assert parse_report_formats(text) == expected
+
+def test_json_report_round_trips(tmp_path):
+    [path] = write(tmp_path, ('json',))
+    with open(path, encoding='utf-8') as report_file:
+        document = json.load(report_file)
+    assert document['tool'] == 'WebFuzzerTool'
+    assert document['crawled_urls'] == CRAWLED
+    assert document['forms'] == [{'url': 'http://example.com/', 'action': 'http://example.com/search', 'method': 'GET', 'inputs': [{'name': 'q', 'type': 'text'}]}]
+    assert document['vulnerabilities'] == FINDINGS
+    assert document['attempts'] == ATTEMPTS
+    assert document['unique_forms'] == []
+
+def test_json_report_with_empty_sections_is_valid(tmp_path):
+    [path] = generate_reports(('json',), [], [], [], [], output_base=str(tmp_path / 'empty'))
+    with open(path, encoding='utf-8') as report_file:
+        assert json.load(report_file)['attempts'] == []
+
+def test_sarif_report_lists_findings(tmp_path):
+    [path] = write(tmp_path, ('sarif',))
+    with open(path, encoding='utf-8') as report_file:
+        document = json.load(report_file)
+    assert document['version'] == '2.1.0'
+    run = document['runs'][0]
+    assert {rule['id'] for rule in run['tool']['driver']['rules']} == {'sql-injection', 'xss', 'command-injection'}
+    [result] = run['results']
+    assert result['ruleId'] == 'xss'
+    assert result['locations'][0]['physicalLocation']['artifactLocation']['uri'] == 'http://example.com/search'
+    assert result['partialFingerprints']['findingKey/v1'] == finding_fingerprint(FINDINGS[0])
+
+def test_html_report_escapes_script_end_tags(tmp_path):
+    [path] = write(tmp_path, ('html',))
+    with open(path, encoding='utf-8') as report_file:
+        html = report_file.read()
+    blocks = re.findall(r'<script type="application/json" id="([\w-]+)-data">(.*?)</script>', html, re.S)
+    assert [name for name, _ in blocks] == ['urls', 'forms', 'unique-forms', 'vulnerabilities', 'attempts']
+    data = {name: json.loads(block) for name, block in blocks}
+    assert data['vulnerabilities'] == FINDINGS
+    assert data['attempts'] == ATTEMPTS
+    assert not any('<' in block for _, block in blocks)
+
+def test_html_report_escapes_comment_openers_in_evidence(tmp_path):
+    findings = [dict(FINDINGS[0], evidence="<!--<script>a && b > c</script>")]
+    [path] = generate_reports(('html',), CRAWLED, EXTRACTION, findings, ATTEMPTS, output_base=str(tmp_path / 'report'))
+    with open(path, encoding='utf-8') as report_file:
+        html = report_file.read()
+    blocks = dict(re.findall(r'<script type="application/json" id="([\w-]+)-data">(.*?)</script>', html, re.S))
+    assert '<!--' not in html
+    assert not any(character in blocks['vulnerabilities'] for character in '<>&')
+    assert json.loads(blocks['vulnerabilities']) == findings
+
+def test_only_requested_formats_are_written(tmp_path):
+    written = write(tmp_path, ('json', 'html'))
+    assert written == [str(tmp_path / 'report.json'), str(tmp_path / 'report.html')]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['report.html', 'report.json']
+
+UNIQUE_FORMS = [{'action': 'http://example.com/search', 'method': 'get', 'inputs': [{'name': 'q', 'type': 'text'}], 'pages': [f'http://example.com/p{index}' for index in range(25)]}]
+
+def test_every_page_of_a_unique_form_is_exported(tmp_path):
+    json_path, html_path = generate_reports(('json', 'html'), CRAWLED, EXTRACTION, FINDINGS, ATTEMPTS, output_base=str(tmp_path / 'report'), unique_forms=UNIQUE_FORMS)
+    with open(json_path, encoding='utf-8') as report_file:
+        assert json.load(report_file)['unique_forms'][0]['pages'] == UNIQUE_FORMS[0]['pages']
+    with open(html_path, encoding='utf-8') as report_file:
+        html = report_file.read()
+    block = re.search(r'<script type="application/json" id="unique-forms-data">(.*?)</script>', html, re.S).group(1)
+    rows = json.loads(block)
+    assert [row['page'] for row in rows] == UNIQUE_FORMS[0]['pages']
+    assert {row['page_count'] for row in rows} == {25}
@@ -0,0 +1,35 @@
+import logging
+import shutil
+
+from font_manager import BUNDLED_FONT, FONT_DIR, FontManager, report_fonts
+
+def test_report_fonts_use_the_bundled_korean_font():
+    # 저장소에는 NanumGothicLight.ttf만 있으므로 두 글꼴 모두 Helvetica가 아닌 등록된 글꼴이어야 함
+    assert report_fonts() == ('NanumGothic', 'NanumGothic-Bold')
+
+def test_first_available_candidate_is_registered(tmp_path, caplog):
+    shutil.copy(f'{FONT_DIR}/{BUNDLED_FONT}', tmp_path / 'Second.ttf')
+    manager = FontManager({'TestCandidate': (('First.ttf', 'Second.ttf'), 'Helvetica')}, (str(tmp_path),))
+    with caplog.at_level(logging.INFO):
+        assert manager.resolve('TestCandidate') == 'TestCandidate'
+    assert 'Second.ttf' in caplog.text
+
+def test_missing_fonts_fall_back_to_base_font(tmp_path, caplog):
+    manager = FontManager({'TestMissing': (('Missing.ttf',), 'Helvetica-Bold')}, (str(tmp_path),))
+    with caplog.at_level(logging.WARNING):
+        assert manager.resolve('TestMissing') == 'Helvetica-Bold'
+    assert 'Missing.ttf' in caplog.text
+
+def test_unreadable_font_is_skipped(tmp_path):
+    (tmp_path / 'Broken.ttf').write_bytes(b'not a font')
+    shutil.copy(f'{FONT_DIR}/{BUNDLED_FONT}', tmp_path / 'Good.ttf')
+    manager = FontManager({'TestBroken': (('Broken.ttf', 'Good.ttf'), 'Helvetica')}, (str(tmp_path),))
+    assert manager.resolve('TestBroken') == 'TestBroken'
+
+def test_font_is_resolved_once(tmp_path, monkeypatch):
+    manager = FontManager({'TestOnce': (('Missing.ttf',), 'Helvetica')}, (str(tmp_path),))
+    calls = []
+    monkeypatch.setattr(manager, 'find', lambda filename: calls.append(filename))
+    manager.resolve('TestOnce')
+    manager.resolve('TestOnce')
+    assert calls == ['Missing.ttf']
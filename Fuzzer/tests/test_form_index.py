@@ -0,0 +1,23 @@
+from form_index import FormIndex, form_signature
+
+def login_form(action='http://example.com/login', method='post', names=('user', 'pw')):
+    return {'action': action, 'method': method, 'inputs': [{'tag': 'input', 'type': 'text', 'name': name} for name in names]}
+
+def test_signature_ignores_url_form_and_field_order():
+    assert form_signature(login_form()) == form_signature(login_form('HTTP://example.com:80/login/', 'POST', ('pw', 'user')))
+
+def test_signature_distinguishes_method_fields_and_action():
+    base = form_signature(login_form())
+    assert form_signature(login_form(method='get')) != base
+    assert form_signature(login_form(names=('user',))) != base
+    assert form_signature(login_form(action='http://example.com/signup')) != base
+
+def test_index_merges_repeated_forms_and_keeps_pages():
+    index = FormIndex()
+    assert index.add(login_form(), 'http://example.com/')
+    assert not index.add(login_form(names=('pw', 'user')), 'http://example.com/about')
+    assert not index.add(login_form(), 'http://example.com/about')
+    assert index.add(login_form(action='http://example.com/search', method='get', names=('q',)), 'http://example.com/')
+    assert len(index) == 2
+    assert index.total == 4
+    assert index.forms()[0]['pages'] == ['http://example.com/', 'http://example.com/about']
@@ -0,0 +1,54 @@
+import pytest
+
+from frontier import SeenIndex, canonicalize_url, create_url_store
+
+@pytest.mark.parametrize('url, expected', [
+    ('HTTP://Example.COM:80/a/', 'http://example.com/a'),
+    ('https://example.com:443/a#frag', 'https://example.com/a'),
+    ('http://example.com:8080/a', 'http://example.com:8080/a'),
+    ('http://example.com/p?b=2&a=1', 'http://example.com/p?a=1&b=2'),
+    ('http://example.com/%7euser/%2f', 'http://example.com/~user/%2F'),
+    ('http://example.com/a b', 'http://example.com/a%20b'),
+    ('http://[::1]:8000/x', 'http://[::1]:8000/x'),
+    ('http://user:pw@example.com/', 'http://user:pw@example.com'),
+])
+def test_canonicalize_url(url, expected):
+    assert canonicalize_url(url) == expected
+
+def test_equivalent_urls_share_canonical_form():
+    variants = ['http://example.com/a?x=1&y=2', 'HTTP://example.com:80/a/?y=2&x=1', 'http://EXAMPLE.com/a?x=1&y=2#top']
+    assert len({canonicalize_url(url) for url in variants}) == 1
+
+@pytest.mark.parametrize('kind', ['set', 'fingerprint', 'bloom'])
+def test_seen_index_returns_canonical_url_only_once(kind):
+    seen = SeenIndex(create_url_store(kind))
+    assert seen.add('http://example.com/a/') == 'http://example.com/a'
+    assert seen.add('HTTP://example.com/a#x') is None
+    assert 'http://example.com:80/a' in seen
+    assert 'http://example.com/b' not in seen
+    assert len(seen) == 1
+
+def test_fingerprint_set_grows_without_losing_keys():
+    store = create_url_store('fingerprint', capacity=8)
+    keys = [f'http://example.com/page/{i}' for i in range(5000)]
+    for key in keys:
+        store.add(key)
+        store.add(key)
+    assert len(store) == len(keys)
+    assert all(key in store for key in keys)
+    assert 'http://example.com/other' not in store
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_false_positives():
+    store = create_url_store('bloom', initial_capacity=1000, error_rate=0.01)
+    keys = [f'http://example.com/page/{i}' for i in range(10000)]
+    for key in keys:
+        store.add(key)
+    assert all(key in store for key in keys)
+    assert len(store) <= len(keys)
+    # 여러 필터로 늘어난 뒤에도 전체 오탐률이 error_rate 근처로 유지
+    false_positives = sum(f'http://example.com/missing/{i}' in store for i in range(10000))
+    assert false_positives / 10000 < 0.02
+
+def test_unknown_url_store_is_rejected():
+    with pytest.raises(ValueError):
+        create_url_store('redis')
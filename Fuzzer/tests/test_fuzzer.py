@@ -0,0 +1,239 @@
+import asyncio
+
+import aiohttp
+
+from conftest import stream_parts
+
+FILLER = b'<p>' + b'a' * 9992 + b'</p>\n'  # 10000바이트
+
+def page_form(base_url, path='/page', method='get', names=('q',)):
+    return {'action': base_url + path, 'method': method, 'inputs': [{'tag': 'input', 'type': 'text', 'name': name} for name in names]}
+
+def run_with_session(serve, routes, coro):
+    # 로컬 서버를 띄우고 coro(base_url, session)을 실행
+    async def main():
+        async with serve(routes) as base_url:
+            async with aiohttp.ClientSession() as session:
+                return await coro(base_url, session)
+    return asyncio.run(main())
+
+def test_baseline_reads_the_whole_streamed_body(serve, fuzzer_module):
+    async def page(request):
+        return await stream_parts(request, [FILLER] * 20)
+
+    async def fetch(base_url, session):
+        fuzzer = fuzzer_module.AsyncFuzzer([page_form(base_url)], fuzzer_module.sql_injection_payloads)
+        return await fuzzer.baselines.get(session, page_form(base_url))
+
+    baseline = run_with_session(serve, {'/page': page}, fetch)
+    assert baseline.length == 200000
+
+def test_body_read_stops_at_the_byte_cap(serve, fuzzer_module):
+    async def page(request):
+        return await stream_parts(request, [FILLER] * 20)
+
+    async def fetch(base_url, session):
+        fuzzer = fuzzer_module.AsyncFuzzer([page_form(base_url)], [], max_response_bytes=25000, chunk_size=4096)
+        return await fuzzer.fetch_baseline(session, page_form(base_url))
+
+    status, body = run_with_session(serve, {'/page': page}, fetch)
+    assert (status, len(body)) == (200, 25000)
+
+def test_static_error_text_after_first_chunk_is_not_a_candidate(serve, fuzzer_module):
+    # 입력과 관계없이 항상 나오는 에러 문구는 첫 청크 이후에 있어도 기준 응답으로 걸러져야 함
+    async def page(request):
+        return await stream_parts(request, [FILLER, FILLER, b'<footer>Error log: SQL syntax help</footer>'])
+
+    async def fuzz(base_url, session):
+        fuzzer = fuzzer_module.AsyncFuzzer([page_form(base_url)], fuzzer_module.sql_injection_payloads, concurrency=4)
+        await fuzzer.run()
+        return fuzzer
+
+    fuzzer = run_with_session(serve, {'/page': page}, fuzz)
+    assert fuzzer.vulnerabilities == []
+    assert fuzzer.unconfirmed == 0
+    assert fuzzer.confirmer.probes_sent == 0
+
+def test_response_identical_to_baseline_skips_pattern_scan(serve, fuzzer_module):
+    async def page(request):
+        return await stream_parts(request, [FILLER, b'<p>Error: nothing happened</p>'])
+
+    async def fuzz(base_url, session):
+        form = page_form(base_url)
+        fuzzer = fuzzer_module.AsyncFuzzer([form], fuzzer_module.sql_injection_payloads)
+        await fuzzer.baselines.get(session, form)
+        scans = []
+        scan = fuzzer.analyzer.scan
+        fuzzer.analyzer.scan = lambda data: scans.append(len(data)) or scan(data)
+        await fuzzer.fuzz_form(session, form, fuzzer_module.sql_injection_payloads[0], ('q',))
+        return fuzzer, scans
+
+    fuzzer, scans = run_with_session(serve, {'/page': page}, fuzz)
+    assert scans == []
+    assert [attempt['result'] for attempt in fuzzer.attempts] == ['취약점 없음']
+
+def half_open_fuzzer(fuzzer_module, base_url, **options):
+    # 엔드포인트 서킷이 열렸다가 reset_timeout이 지나 half-open 상태가 된 퍼저
+    fuzzer = fuzzer_module.AsyncFuzzer([page_form(base_url)], fuzzer_module.sql_injection_payloads, **options)
+    url = page_form(base_url)['action']
+    for _ in range(fuzzer.breaker.thresholds['endpoint']):
+        fuzzer.breaker.failure(url)
+    for circuit in fuzzer.breaker._circuits.values():
+        if circuit.opened_at is not None:
+            circuit.opened_at -= fuzzer.breaker.reset_timeout
+    return fuzzer, url
+
+def test_probe_ending_in_handler_error_does_not_wedge_circuit(serve, fuzzer_module):
+    async def page(request):
+        return await stream_parts(request, [FILLER])
+
+    async def broken(response):
+        raise UnicodeDecodeError('utf-8', b'', 0, 1, 'bad')
+
+    async def probe(base_url, session):
+        fuzzer, url = half_open_fuzzer(fuzzer_module, base_url)
+        try:
+            await fuzzer.request(session, page_form(base_url), {'q': 'x'}, broken)
+        except UnicodeDecodeError:
+            pass
+        return fuzzer.breaker.check(url)
+
+    assert run_with_session(serve, {'/page': page}, probe) is None
+
+def test_cancelled_probe_does_not_wedge_circuit(serve, fuzzer_module):
+    async def slow(request):
+        await asyncio.sleep(5)
+        return await stream_parts(request, [FILLER])
+
+    async def probe(base_url, session):
+        fuzzer, url = half_open_fuzzer(fuzzer_module, base_url)
+        task = asyncio.create_task(fuzzer.request(session, page_form(base_url), {'q': 'x'}, fuzzer.read_body))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        return fuzzer.breaker.check(url)
+
+    assert run_with_session(serve, {'/page': slow}, probe) is None
+
+def test_open_circuit_skips_without_charging_budget(serve, fuzzer_module):
+    requests = []
+
+    async def page(request):
+        requests.append(request.path)
+        return await stream_parts(request, [FILLER])
+
+    async def fuzz(base_url, session):
+        fuzzer = fuzzer_module.AsyncFuzzer([page_form(base_url)], fuzzer_module.sql_injection_payloads)
+        for _ in range(fuzzer.breaker.thresholds['endpoint']):
+            fuzzer.breaker.failure(page_form(base_url)['action'])
+        await fuzzer.fuzz_form(session, fuzzer.forms[0], fuzzer_module.sql_injection_payloads[0], ('q',))
+        return fuzzer
+
+    fuzzer = run_with_session(serve, {'/page': page}, fuzz)
+    assert requests == []
+    assert (fuzzer.budget.count, fuzzer.budget.skipped) == (0, 0)
+    assert fuzzer.attempts[0]['result'].startswith('건너뜀')
+
+def echo_form(base_url, names=('q', 'r', 's')):
+    return page_form(base_url, '/echo', names=names)
+
+def echo_parts(*parts):
+    # 모든 파라미터를 이스케이프하지 않고 그대로 출력하는 핸들러 (None 자리에 파라미터 출력)
+    async def echo(request):
+        values = ''.join(f'<p>{value}</p>' for value in request.query.values()).encode()
+        return await stream_parts(request, [values if part is None else part for part in parts])
+    return echo
+
+def test_first_policy_records_one_finding_per_form_and_type(serve, fuzzer_module):
+    async def main():
+        async with serve({'/echo': echo_parts(None, FILLER)}) as base_url:
+            fuzzer = fuzzer_module.AsyncFuzzer([echo_form(base_url)], fuzzer_module.xss_payloads, concurrency=8, scan_policy='first')
+            await fuzzer.run()
+            return fuzzer
+
+    fuzzer = asyncio.run(main())
+    assert [finding['type'] for finding in fuzzer.vulnerabilities] == ['XSS']
+
+def test_record_result_drops_findings_for_settled_keys(fuzzer_module):
+    form = echo_form('http://example.com')
+    fuzzer = fuzzer_module.AsyncFuzzer([form], fuzzer_module.xss_payloads, scan_policy='first')
+    payload = fuzzer_module.xss_payloads[0]
+    fuzzer.record_result('XSS', payload, form, 200, fields=('q',))
+    fuzzer.record_result('XSS', payload, form, 200, fields=('r',))
+    assert [finding['parameter'] for finding in fuzzer.vulnerabilities] == ['q']
+    assert [attempt['result'] for attempt in fuzzer.attempts] == ['XSS 취약점 발견', '중복 제외: XSS 취약점 이미 확인됨']
+
+def test_reflection_after_first_chunk_is_found(serve, fuzzer_module):
+    async def probe(base_url, session):
+        fuzzer = fuzzer_module.AsyncFuzzer([echo_form(base_url, ('q',))], fuzzer_module.xss_payloads)
+        await fuzzer.probe_reflections(session, fuzzer.forms[0])
+        return fuzzer.reflections[fuzzer.form_key(fuzzer.forms[0])]
+
+    assert run_with_session(serve, {'/echo': echo_parts(FILLER, FILLER, None)}, probe) == {'q': ['html']}
+
+def test_confirmation_probes_are_charged_to_the_budget(serve, fuzzer_module):
+    from scheduler import ScanBudget
+
+    async def confirm(base_url, session):
+        budget = ScanBudget(per_form=2)
+        fuzzer = fuzzer_module.AsyncFuzzer([echo_form(base_url, ('q',))], fuzzer_module.xss_payloads, budget=budget)
+        form = fuzzer.forms[0]
+        assert fuzzer.charge(form) and fuzzer.charge(form)
+        result = await fuzzer.confirmer.confirm(session, form, ('q',), 'XSS', None)
+        return result, budget
+
+    (confirmed, _), budget = run_with_session(serve, {'/echo': echo_parts(None)}, confirm)
+    assert not confirmed
+    assert (budget.count, budget.skipped) == (2, 1)
+
+def test_probe_reads_whole_body_and_times_only_the_request(serve, fuzzer_module):
+    async def probe(base_url, session):
+        fuzzer = fuzzer_module.AsyncFuzzer([echo_form(base_url, ('q',))], fuzzer_module.xss_payloads)
+        form = fuzzer.forms[0]
+        # 요청 간 최소 간격 때문에 두 번째 요청은 슬롯을 0.3초 기다림
+        fuzzer.throttle.set_crawl_delay(form['action'], 0.3)
+        await fuzzer.send_probe(session, form, ('q',), 'first')
+        started = asyncio.get_running_loop().time()
+        status, body, elapsed = await fuzzer.send_probe(session, form, ('q',), 'marker')
+        return status, body, elapsed, asyncio.get_running_loop().time() - started
+
+    status, body, elapsed, total = run_with_session(serve, {'/echo': echo_parts(FILLER, FILLER, None)}, probe)
+    assert (status, len(body)) == (200, 2 * len(FILLER) + len(b'<p>marker</p>'))
+    assert total >= 0.25
+    assert elapsed < 0.2
+
+def test_timing_probes_are_not_sampled_by_the_throttle(serve, fuzzer_module):
+    async def probe(base_url, session):
+        fuzzer = fuzzer_module.AsyncFuzzer([echo_form(base_url, ('q',))], fuzzer_module.xss_payloads)
+        form = fuzzer.forms[0]
+        await fuzzer.send_probe(session, form, ('q',), 'sleep 3', timing=True)
+        timed = fuzzer.throttle.state(form['action']).latency
+        await fuzzer.send_probe(session, form, ('q',), 'plain')
+        return timed, fuzzer.throttle.state(form['action']).latency
+
+    timed, plain = run_with_session(serve, {'/echo': echo_parts(None)}, probe)
+    assert timed is None
+    assert plain is not None
+
+def test_job_queue_is_bounded_and_survives_job_errors(fuzzer_module):
+    fuzzer = fuzzer_module.AsyncFuzzer([page_form('http://example.com')], [], concurrency=2)
+    produced, handled = [], []
+
+    def jobs():
+        for index in range(20):
+            # 생산자는 큐 크기(concurrency * 2) + 처리 중인 작업 수 이상 앞서가지 않음
+            assert len(produced) - len(handled) <= fuzzer.concurrency * 3 + 1
+            produced.append(index)
+            yield (page_form('http://example.com'), index)
+
+    async def handle(form, index):
+        await asyncio.sleep(0.001)
+        handled.append(index)
+        if index % 5 == 0:
+            raise RuntimeError('job failed')
+
+    asyncio.run(fuzzer.run_jobs(jobs(), handle))
+    assert sorted(handled) == list(range(20))
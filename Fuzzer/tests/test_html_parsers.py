@@ -0,0 +1,82 @@
+from urllib.parse import urljoin
+
+import pytest
+from bs4 import BeautifulSoup
+
+from html_parsers import PARSER_BACKENDS, extract_forms, extract_links
+
+BACKENDS = sorted(PARSER_BACKENDS)
+URL = 'http://example.com/dir/page'
+
+def reference_extract_forms(html, url):
+    # 파서 백엔드 도입 전 BeautifulSoup(find_all/find_parent) 기반 추출 결과
+    soup = BeautifulSoup(html, 'html.parser')
+    forms = []
+    for form in soup.find_all('form'):
+        action = form.get('action')
+        forms.append({
+            'action': urljoin(url, action) if action else url,
+            'method': form.get('method', 'get').lower(),
+            'inputs': [
+                {'tag': tag.name, 'type': tag.get('type', tag.name), 'name': tag.get('name')}
+                for tag in form.find_all(['input', 'textarea'])
+            ]
+        })
+    independent_inputs = [
+        {'tag': tag.name, 'type': tag.get('type', tag.name), 'name': tag.get('name')}
+        for tag in soup.find_all(['input', 'textarea']) if not tag.find_parent('form')
+    ]
+    return forms, independent_inputs
+
+WELL_FORMED_PAGES = [
+    '<html><body><form action="login" method="POST"><input name="user"><input type="password" name="pw">'
+    '<textarea name="memo"></textarea><input type="submit"></form></body></html>',
+    '<html><body><form><div><p><input name="q" type="search"></p></div></form>'
+    '<input name="outside"><form action="/b"><input name="x"></form></body></html>',
+    '<html><body><div><input name="lonely"><textarea></textarea></div><a href="/a">a</a></body></html>',
+    '<html><body><table><tr><td><form action="/cell"><input name="c"></form></td></tr></table></body></html>',
+]
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('html', WELL_FORMED_PAGES)
+def test_well_formed_pages_match_reference(backend, html):
+    assert extract_forms(html, URL, backend) == reference_extract_forms(html, URL)
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_links_keep_raw_href(backend):
+    html = '<html><body><a href="/a">a</a><a>none</a><a href="">empty</a><a href="b?x=1#f">b</a></body></html>'
+    assert extract_links(html, URL, backend) == ['/a', '', 'b?x=1#f']
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_deeply_nested_nodes_are_kept(backend):
+    # lxml 기본 파서는 256단계 이상 중첩된 노드를 버림
+    html = '<html><body>' + '<div>' * 300 + '<form action="/deep"><input name="q"></form><a href="/x">x</a>' + '</div>' * 300 + '</body></html>'
+    forms, _ = extract_forms(html, URL, backend)
+    assert [(form['action'], [field['name'] for field in form['inputs']]) for form in forms] == [('http://example.com/deep', ['q'])]
+    assert extract_links(html, URL, backend) == ['/x']
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_form_directly_inside_table_keeps_its_inputs(backend):
+    # HTML5 파서(selectolax)는 표 안의 <form>을 빈 요소로 만들지만, 뒤따르는 입력 필드는 그 폼에 속해야 함
+    html = ('<html><body><table><form action="/t" method="post"><tr><td><input name="user"></td></tr>'
+            '<tr><td><input type="submit"></td></tr></form></table><input name="outside"></body></html>')
+    forms, independent_inputs = extract_forms(html, URL, backend)
+    assert forms == reference_extract_forms(html, URL)[0]
+    assert [field['name'] for field in independent_inputs] == ['outside']
+
+NESTED_FORMS = '<html><body><form action="/outer"><input name="a"><form action="/inner"><input name="b"></form><input name="c"></form></body></html>'
+
+@pytest.mark.parametrize('backend, expected_forms, expected_independent', [
+    # 작성된 그대로의 트리
+    ('html.parser', [('/outer', ['a', 'c']), ('/inner', ['b'])], []),
+    # 안쪽 <form>에서 바깥 폼을 닫고 새 폼 시작
+    ('lxml', [('/outer', ['a']), ('/inner', ['b'])], ['c']),
+    # 브라우저와 같이 안쪽 <form> 무시, 첫 </form>에서 바깥 폼 닫음
+    ('selectolax', [('/outer', ['a', 'b'])], ['c']),
+])
+def test_nested_forms_follow_backend_tree(backend, expected_forms, expected_independent):
+    if backend not in PARSER_BACKENDS:
+        pytest.skip(f'{backend} 미설치')
+    forms, independent_inputs = extract_forms(NESTED_FORMS, URL, backend)
+    assert [(form['action'].replace('http://example.com', ''), [field['name'] for field in form['inputs']]) for form in forms] == expected_forms
+    assert [field['name'] for field in independent_inputs] == expected_independent
@@ -0,0 +1,23 @@
+import re
+
+from reflection import find_reflections, make_canaries, reflection_context
+
+def test_canaries_are_unique_and_plain():
+    canaries = make_canaries(['q', 'r', 's'])
+    assert len(set(canaries.values())) == 3
+    assert all(re.fullmatch('fz[0-9a-f]{10}', canary) for canary in canaries.values())
+
+def test_find_reflections_reports_fields_and_contexts():
+    canaries = {'q': 'fzaaaa', 'r': 'fzbbbb', 's': 'fzcccc'}
+    body = (
+        b'<p>fzaaaa</p><input value="fzbbbb">'
+        b'<script>var x = "fzaaaa";</script><!-- fzbbbb -->'
+    )
+    assert find_reflections(body, canaries) == {'q': ['html', 'script'], 'r': ['attribute', 'comment']}
+
+def test_find_reflections_without_canaries():
+    assert find_reflections(b'<p>anything</p>', {}) == {}
+
+def test_context_after_closed_script_and_comment_is_html():
+    body = b'<script>1</script><!-- x --><b>fz</b>'
+    assert reflection_context(body, body.index(b'fz')) == 'html'
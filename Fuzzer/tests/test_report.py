@@ -0,0 +1,62 @@
+import logging
+
+import pytest
+
+import report
+from report import generate_pdf_report
+
+def attempts(count, result='취약점 없음'):
+    return [{'form_action': f'http://example.com/{index}', 'parameter': 'q', 'payload': 'p', 'response_code': 200, 'result': result} for index in range(count)]
+
+def build(tmp_path, rows, **options):
+    path = tmp_path / 'report.pdf'
+    generate_pdf_report(['http://example.com/'], [], [], rows, output_path=str(path), **options)
+    return path
+
+@pytest.mark.parametrize('mode', ['all', 'cap', 'summary'])
+def test_report_is_written_in_every_mode(tmp_path, mode):
+    rows = attempts(30) + attempts(2, 'XSS 취약점 발견')
+    path = build(tmp_path, rows, non_vulnerable_mode=mode, max_non_vulnerable_rows=10)
+    assert path.read_bytes().startswith(b'%PDF')
+
+def test_unknown_mode_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        build(tmp_path, [], non_vulnerable_mode='everything')
+
+def test_all_mode_warns_on_large_attempt_lists(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(report, 'LARGE_REPORT_ATTEMPTS', 20)
+    with caplog.at_level(logging.WARNING):
+        build(tmp_path, attempts(10), non_vulnerable_mode='all')
+        assert 'PDF 생성이 오래 걸릴 수 있습니다' not in caplog.text
+        build(tmp_path, attempts(30), non_vulnerable_mode='all')
+        assert 'PDF 생성이 오래 걸릴 수 있습니다' in caplog.text
+
+def test_default_mode_does_not_warn(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(report, 'LARGE_REPORT_ATTEMPTS', 20)
+    with caplog.at_level(logging.WARNING):
+        build(tmp_path, attempts(30))
+    assert 'PDF 생성이 오래 걸릴 수 있습니다' not in caplog.text
+
+def test_unique_forms_list_every_page(tmp_path):
+    from reportlab.platypus import LongTable
+
+    pages = [f'http://example.com/page{index}' for index in range(25)]
+    form = {'action': 'http://example.com/search', 'method': 'get', 'inputs': [{'name': 'q', 'type': 'text'}], 'pages': pages}
+    flowables = report.report_flowables([], [], [], [form], 'cap', 10, 'Helvetica', 'Helvetica-Bold')
+    rows = [row for flowable in flowables if isinstance(flowable, LongTable) for row in flowable._cellvalues[1:]]
+    assert [getattr(row[3], 'text', row[3]) for row in rows] == pages
+    assert rows[0][1] == 'GET' and all(row[1] == '' for row in rows[1:])
+
+def test_omitted_attempts_are_capped_outside_the_finding_tables():
+    from reportlab.platypus import LongTable, Paragraph
+
+    rows = (attempts(15, '중복 제외: XSS 취약점 이미 확인됨') + attempts(5, '건너뜀: 예산 소진')
+            + attempts(5, '요청 실패: timeout') + attempts(3, 'XSS 취약점 발견') + attempts(3))
+    flowables = list(report.report_flowables([], [], rows, [], 'cap', 10, 'Helvetica', 'Helvetica-Bold'))
+    titles = [flowable.text for flowable in flowables if isinstance(flowable, Paragraph)]
+    assert not any(title.startswith(('중복 제외', '건너뜀', '요청 실패')) for title in titles)
+    assert titles.index('XSS') < titles.index('생략된 시도') < titles.index('취약점 없는 시도')
+    assert '생략된 시도 25건 중 10건만 표시했습니다.' in titles
+    start = next(index for index, flowable in enumerate(flowables) if getattr(flowable, 'text', None) == '생략된 시도')
+    table = next(flowable for flowable in flowables[start:] if isinstance(flowable, LongTable))
+    assert len(table._cellvalues) - 1 == 10
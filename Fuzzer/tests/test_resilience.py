@@ -0,0 +1,80 @@
+import pytest
+
+import resilience
+from resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+URL = 'http://example.com/login'
+OTHER = 'http://example.com/search'
+
+@pytest.fixture
+def clock(monkeypatch):
+    # 서킷의 시간 계산에 쓰는 monotonic()을 직접 조절
+    now = [1000.0]
+    monkeypatch.setattr(resilience.time, 'monotonic', lambda: now[0])
+    return now
+
+def open_endpoint(breaker, url=URL):
+    for _ in range(breaker.thresholds['endpoint']):
+        assert breaker.check(url) is None
+        breaker.failure(url)
+
+def test_retry_delay_is_jittered_and_capped():
+    policy = RetryPolicy(base_delay=0.5, max_delay=2.0)
+    for attempt in range(6):
+        assert 0 <= policy.delay(attempt) <= min(2.0, 0.5 * 2 ** attempt)
+    assert policy.delay(0, retry_after=5) >= 5
+
+def test_endpoint_circuit_opens_after_threshold(clock):
+    breaker = CircuitBreaker(host_threshold=10, endpoint_threshold=3)
+    open_endpoint(breaker)
+    blocked = breaker.check(URL)
+    assert isinstance(blocked, CircuitOpenError)
+    assert (blocked.scope, blocked.key) == ('endpoint', 'example.com/login')
+    # 같은 호스트의 다른 엔드포인트는 계속 허용
+    assert breaker.check(OTHER) is None
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker(endpoint_threshold=3)
+    for _ in range(2):
+        breaker.failure(URL)
+    breaker.success(URL)
+    for _ in range(2):
+        breaker.failure(URL)
+    assert breaker.check(URL) is None
+
+def test_half_open_allows_a_single_probe(clock):
+    breaker = CircuitBreaker(endpoint_threshold=2, reset_timeout=30)
+    open_endpoint(breaker)
+    clock[0] += 31
+    assert breaker.check(URL) is None
+    assert isinstance(breaker.check(URL), CircuitOpenError)
+    breaker.success(URL)
+    assert breaker.check(URL) is None
+
+def test_failed_probe_reopens_circuit(clock):
+    breaker = CircuitBreaker(endpoint_threshold=2, reset_timeout=30)
+    open_endpoint(breaker)
+    clock[0] += 31
+    assert breaker.check(URL) is None
+    breaker.failure(URL)
+    clock[0] += 10
+    assert isinstance(breaker.check(URL), CircuitOpenError)
+    clock[0] += 21
+    assert breaker.check(URL) is None
+
+def test_abandoned_probe_lets_the_next_request_probe(clock):
+    breaker = CircuitBreaker(endpoint_threshold=2, reset_timeout=30)
+    open_endpoint(breaker)
+    clock[0] += 31
+    assert breaker.check(URL) is None
+    breaker.abandon(URL)
+    assert breaker.check(URL) is None
+
+def test_peek_does_not_take_the_probe(clock):
+    breaker = CircuitBreaker(endpoint_threshold=2, reset_timeout=30)
+    open_endpoint(breaker)
+    assert isinstance(breaker.peek(URL), CircuitOpenError)
+    clock[0] += 31
+    assert breaker.peek(URL) is None
+    assert breaker.peek(URL) is None
+    assert breaker.check(URL) is None
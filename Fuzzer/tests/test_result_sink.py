@@ -0,0 +1,69 @@
+import gzip
+import json
+
+import pytest
+
+from result_sink import JsonlSpool, MemorySink, TeeSink
+
+def attempt(index, result='취약점 없음', status=200):
+    return {'form_action': f'http://example.com/{index % 3}', 'parameter': 'q', 'payload': 'p', 'response_code': status, 'result': result}
+
+def finding(index):
+    return {'type': 'XSS', 'payload': 'p', 'form': f'http://example.com/{index}', 'parameter': 'q'}
+
+def test_memory_sink_keeps_records_and_stats():
+    sink = MemorySink()
+    sink.add_attempt(attempt(0))
+    sink.add_attempt(attempt(1, 'XSS 취약점 발견', 500))
+    sink.add_finding(finding(1))
+    assert len(sink.attempts) == 2 and sink.findings == [finding(1)]
+    assert sink.stats.by_result == {'취약점 없음': 1, 'XSS 취약점 발견': 1}
+    assert sink.stats.by_status == {200: 1, 500: 1}
+    assert sink.stats.by_type == {'XSS': 1}
+    assert sink.stats.result_types() == ['취약점 없음', 'XSS 취약점 발견']
+
+@pytest.mark.parametrize('name', ['spool.jsonl', 'spool.jsonl.gz'])
+def test_spool_round_trips_and_can_be_iterated_repeatedly(tmp_path, name):
+    spool = JsonlSpool(str(tmp_path / name), flush_every=7)
+    for index in range(50):
+        spool.add_attempt(attempt(index))
+        if index % 10 == 0:
+            spool.add_finding(finding(index))
+    # 기록 중에도 읽을 수 있고, 여러 번 순회해도 같은 내용
+    assert list(spool.attempts) == [attempt(index) for index in range(50)]
+    assert list(spool.attempts) == list(spool.attempts)
+    assert len(spool.findings) == 5 and bool(spool.findings)
+    spool.close()
+    assert [record['form'] for record in spool.findings] == [f'http://example.com/{index}' for index in range(0, 50, 10)]
+
+def test_compressed_spool_is_gzip(tmp_path):
+    path = tmp_path / 'spool.jsonl.gz'
+    spool = JsonlSpool(str(path))
+    spool.add_attempt(attempt(0))
+    spool.close()
+    with gzip.open(path, 'rt', encoding='utf-8') as spool_file:
+        assert json.loads(spool_file.readline())['kind'] == 'attempt'
+
+def test_spool_stops_at_truncated_last_line(tmp_path):
+    path = tmp_path / 'spool.jsonl'
+    spool = JsonlSpool(str(path))
+    for index in range(3):
+        spool.add_attempt(attempt(index))
+    spool.close()
+    with open(path, 'a', encoding='utf-8') as spool_file:
+        spool_file.write('{"kind": "attempt", "form_act')
+    assert len(list(spool.attempts)) == 3
+
+def test_empty_spool_is_falsy(tmp_path):
+    spool = JsonlSpool(str(tmp_path / 'spool.jsonl'))
+    assert not spool.attempts and list(spool.findings) == []
+    spool.close()
+
+def test_tee_sink_forwards_to_every_sink(tmp_path):
+    primary, other = MemorySink(), MemorySink()
+    tee = TeeSink(primary, other)
+    tee.add_attempt(attempt(0))
+    tee.add_finding(finding(0))
+    tee.close()
+    assert tee.attempts is primary.attempts and tee.stats is primary.stats
+    assert other.attempts == primary.attempts and other.findings == primary.findings
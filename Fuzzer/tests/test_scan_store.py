@@ -0,0 +1,74 @@
+import pytest
+
+from scan_store import ScanStore, finding_fingerprint
+
+BASE = 'http://example.com/'
+
+@pytest.fixture
+def store(tmp_path):
+    store = ScanStore(str(tmp_path / 'scans.sqlite'), batch_size=3)
+    yield store
+    store.close()
+
+def finding(action, parameter='q', vuln_type='XSS', payload='<script>'):
+    return {'type': vuln_type, 'form': BASE + action, 'parameter': parameter, 'payload': payload, 'response_code': 200}
+
+def record_scan(store, findings, base_url=BASE):
+    scan_id = store.start_scan(base_url, max_depth=2)
+    recorder = store.recorder(scan_id)
+    for item in findings:
+        recorder.add_attempt({'form_action': item['form'], 'parameter': item['parameter'], 'payload': item['payload'], 'response_code': 200, 'result': f"{item['type']} 취약점 발견"})
+        recorder.add_finding(item)
+    recorder.close()
+    store.finish_scan(scan_id)
+    return scan_id
+
+def test_fingerprint_ignores_payload():
+    assert finding_fingerprint(finding('a', payload='x')) == finding_fingerprint(finding('a', payload='y'))
+    assert finding_fingerprint(finding('a')) != finding_fingerprint(finding('a', parameter='r'))
+
+def test_pages_forms_and_attempts_are_stored(store):
+    scan_id = store.start_scan(BASE)
+    store.add_pages(scan_id, [BASE, BASE + 'a', BASE])
+    store.add_forms(scan_id, [{'action': BASE + 'a', 'method': 'post', 'inputs': [{'name': 'q', 'type': 'text'}], 'pages': [BASE]}])
+    for index in range(5):
+        store.add_attempt(scan_id, {'form_action': BASE + 'a', 'parameter': 'q', 'payload': str(index), 'response_code': 200, 'result': '취약점 없음'})
+    # batch_size(3)를 넘지 않은 나머지도 조회 전에 반영됨
+    assert [attempt['payload'] for attempt in store.iter_attempts(scan_id)] == ['0', '1', '2', '3', '4']
+    assert store._conn.execute("SELECT COUNT(*) FROM pages WHERE scan_id = ?", (scan_id,)).fetchone()[0] == 2
+    assert store._conn.execute("SELECT method FROM forms WHERE scan_id = ?", (scan_id,)).fetchone()[0] == 'post'
+
+def test_previous_scan_uses_finished_scans_of_same_base_url(store):
+    first = record_scan(store, [])
+    record_scan(store, [], base_url='http://other.example/')
+    unfinished = store.start_scan(BASE)
+    latest = record_scan(store, [])
+    assert store.previous_scan(latest) == first
+    assert store.previous_scan(first) is None
+    assert store.previous_scan(unfinished) == first
+    assert [scan['id'] for scan in store.scans(BASE)] == [first, unfinished, latest]
+
+def test_diff_classifies_new_fixed_and_persisting(store):
+    old = record_scan(store, [finding('login'), finding('search', payload='a'), finding('search', vuln_type='SQL Injection')])
+    new = record_scan(store, [finding('search', payload='b'), finding('admin', parameter='id')])
+    diff = store.diff(old, new)
+    assert diff['new'] == [{'type': 'XSS', 'form_action': BASE + 'admin', 'parameter': 'id'}]
+    assert sorted(item['form_action'] + item['type'] for item in diff['fixed']) == [BASE + 'login' + 'XSS', BASE + 'search' + 'SQL Injection']
+    assert diff['persisting'] == [{'type': 'XSS', 'form_action': BASE + 'search', 'parameter': 'q'}]
+
+def test_findings_for_action_spans_scans(store):
+    first = record_scan(store, [finding('search')])
+    second = record_scan(store, [finding('search'), finding('login')])
+    assert [row['scan_id'] for row in store.findings_for_action(BASE + 'search')] == [first, second]
+    assert len(store.findings(second)) == 2
+
+def test_store_reopens_existing_file(tmp_path):
+    path = str(tmp_path / 'scans.sqlite')
+    store = ScanStore(path)
+    scan_id = record_scan(store, [finding('search')])
+    store.close()
+    reopened = ScanStore(path)
+    try:
+        assert [row['type'] for row in reopened.findings(scan_id)] == ['XSS']
+    finally:
+        reopened.close()
@@ -0,0 +1,65 @@
+import pytest
+
+import scheduler
+from scheduler import InjectionScheduler, ScanBudget, injectable_fields
+
+def form(action='http://example.com/search', method='get', inputs=(('q', 'text'),)):
+    return {'action': action, 'method': method, 'inputs': [{'tag': 'input', 'type': kind, 'name': name} for name, kind in inputs]}
+
+def scheduler_for(forms, payloads, budget=None, skip=None, pairwise=False, reflections=None):
+    return InjectionScheduler(
+        forms, payloads,
+        fields=lambda f: injectable_fields(f, reflections),
+        targets=lambda f, payload, fields: fields,
+        form_key=lambda f: f['action'],
+        budget=budget, skip=skip, pairwise=pairwise,
+    )
+
+def test_budget_limits_per_form_and_per_host():
+    budget = ScanBudget(per_form=2, per_host=3)
+    assert [budget.charge('a', 'h') for _ in range(3)] == [True, True, False]
+    assert budget.charge('b', 'h') is True
+    assert budget.charge('c', 'h') is False
+    assert budget.charge('c', 'other') is True
+    assert (budget.count, budget.skipped) == (4, 2)
+
+def test_budget_total_and_time_limit(monkeypatch):
+    budget = ScanBudget(total=1)
+    assert budget.charge('a', 'h')
+    assert budget.exhausted() and not budget.allows('b', 'h')
+
+    now = [100.0]
+    monkeypatch.setattr(scheduler.time, 'monotonic', lambda: now[0])
+    budget = ScanBudget(time_limit=10)
+    assert not budget.exhausted()
+    now[0] += 10
+    assert budget.exhausted()
+
+def test_injectable_fields_rank_types_query_and_reflections():
+    f = form('http://example.com/search?page=1', inputs=(('token', 'hidden'), ('pw', 'password'), ('q', 'text'), ('go', 'submit')))
+    assert injectable_fields(f) == ['q', 'page', 'token', 'pw']
+    assert injectable_fields(f, {'pw': ['html']}) == ['pw', 'q', 'page', 'token']
+
+def test_scheduler_interleaves_forms():
+    forms = [form('http://a.example/1'), form('http://b.example/2')]
+    jobs = [(job.form['action'], job.payload, job.fields) for job in scheduler_for(forms, ['x', 'y'])]
+    assert jobs == [
+        ('http://a.example/1', 'x', ('q',)), ('http://b.example/2', 'x', ('q',)),
+        ('http://a.example/1', 'y', ('q',)), ('http://b.example/2', 'y', ('q',)),
+    ]
+
+def test_scheduler_skips_jobs_and_stops_exhausted_forms():
+    forms = [form('http://a.example/1', inputs=(('q', 'text'), ('r', 'text'))), form('http://b.example/2')]
+    budget = ScanBudget(per_form=1)
+    jobs = []
+    for job in scheduler_for(forms, ['x', 'y'], budget=budget, skip=lambda f, payload, fields: payload == 'x'):
+        budget.charge(job.form['action'], 'host')
+        jobs.append((job.form['action'], job.payload, job.fields))
+    assert jobs == [('http://a.example/1', 'y', ('q',)), ('http://b.example/2', 'y', ('q',))]
+
+@pytest.mark.parametrize('pairwise, expected', [(False, 3), (True, 6)])
+def test_scheduler_pairwise_adds_field_pairs(pairwise, expected):
+    f = form(inputs=(('a', 'text'), ('b', 'text'), ('c', 'text')))
+    jobs = list(scheduler_for([f], ['x'], pairwise=pairwise))
+    assert len(jobs) == expected
+    assert all(len(job.fields) == 2 for job in jobs[3:])
@@ -0,0 +1,70 @@
+import pytest
+
+from scope import CrawlScope, RobotsRules
+
+ROBOTS = """
+User-agent: *
+Disallow: /private
+Allow: /private/public
+Disallow: /*.pdf$
+Disallow: /search?
+Crawl-delay: 2
+
+User-agent: FuzzBot
+Disallow: /
+Allow: /open
+"""
+
+@pytest.fixture
+def robots():
+    return RobotsRules.parse(ROBOTS)
+
+@pytest.mark.parametrize('url, allowed', [
+    ('http://example.com/', True),
+    ('http://example.com/private', False),
+    ('http://example.com/private/data', False),
+    # 더 길게 일치하는 Allow가 우선
+    ('http://example.com/private/public/page', True),
+    ('http://example.com/files/report.pdf', False),
+    ('http://example.com/files/report.pdf.html', True),
+    ('http://example.com/search?q=1', False),
+    ('http://example.com/search', True),
+    ('http://example.com/robots.txt', True),
+])
+def test_default_group_rules(robots, url, allowed):
+    assert robots.can_fetch('*', url) is allowed
+
+def test_specific_user_agent_group(robots):
+    assert not robots.can_fetch('FuzzBot/1.0', 'http://example.com/page')
+    assert robots.can_fetch('FuzzBot/1.0', 'http://example.com/open/page')
+    assert robots.crawl_delay('FuzzBot/1.0') is None
+    assert robots.crawl_delay('OtherBot') == 2.0
+
+def test_allow_wins_on_equal_length():
+    robots = RobotsRules.parse("User-agent: *\nDisallow: /page\nAllow: /page\n")
+    assert robots.can_fetch('*', 'http://example.com/page')
+
+def test_empty_disallow_allows_everything():
+    robots = RobotsRules.parse("User-agent: *\nDisallow:\n")
+    assert robots.can_fetch('*', 'http://example.com/anything')
+
+@pytest.mark.parametrize('url, reason', [
+    ('http://example.com/a', None),
+    ('https://example.com/a', None),
+    ('ftp://example.com/a', 'scheme'),
+    ('mailto:someone@example.com', 'scheme'),
+    ('http://other.com/a', 'host'),
+    ('http://sub.example.com/a', 'host'),
+    ('http://example.com/logout', 'exclude'),
+    ('http://example.com/private/x', 'robots'),
+])
+def test_crawl_scope_reasons(robots, url, reason):
+    scope = CrawlScope('http://example.com/', robots=robots, exclude_patterns=[r'/logout\b'])
+    assert scope.check(url) == reason
+    assert scope.is_allowed(url) is (reason is None)
+
+def test_crawl_scope_subdomains_and_include_patterns():
+    scope = CrawlScope('http://example.com/', include_subdomains=True, include_patterns=[r'/app/'])
+    assert scope.check('http://api.example.com/app/x') is None
+    assert scope.check('http://api.example.com/other') == 'include'
+    assert scope.check('http://badexample.com/app/x') == 'host'
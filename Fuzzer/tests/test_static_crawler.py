@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from static_crawler import StaticCrawler
+
+def html_page(*hrefs):
+    links = ''.join(f'<a href="{href}">link</a>' for href in hrefs)
+
+    async def handler(request):
+        return web.Response(text=f'<html><body>{links}</body></html>', content_type='text/html')
+    return handler
+
+@pytest.mark.parametrize('concurrency', [1, 3])
+def test_malformed_link_does_not_stop_crawl(serve, concurrency):
+    # 잘못된 링크(http://[bad)가 있어도 워커가 죽지 않고 나머지 링크를 계속 크롤링
+    async def crawl():
+        routes = {'/': html_page('http://[bad', '/a'), '/a': html_page('/b'), '/b': html_page('/c'), '/c': html_page()}
+        async with serve(routes) as base_url:
+            crawler = StaticCrawler(base_url, concurrency=concurrency)
+            urls = await asyncio.wait_for(crawler.crawl_async(), timeout=10)
+            return base_url, urls
+
+    base_url, urls = asyncio.run(crawl())
+    assert {f'{base_url}/a', f'{base_url}/b', f'{base_url}/c'} <= urls
+
+def test_unexpected_error_does_not_hang_single_worker(serve, monkeypatch):
+    # 한 페이지 처리 중 예상하지 못한 예외가 나도 워커 하나로 끝까지 크롤링 (to_visit.join()이 멈추지 않음)
+    import static_crawler
+    extract_links = static_crawler.extract_links
+
+    def flaky_extract_links(html, url, parser=None):
+        if url.endswith('/a'):
+            raise RuntimeError('parser failure')
+        return extract_links(html, url, parser)
+
+    monkeypatch.setattr(static_crawler, 'extract_links', flaky_extract_links)
+
+    async def crawl():
+        routes = {'/': html_page('/a', '/b'), '/a': html_page('/x'), '/b': html_page('/c'), '/c': html_page()}
+        async with serve(routes) as base_url:
+            urls = await asyncio.wait_for(StaticCrawler(base_url, concurrency=1).crawl_async(), timeout=10)
+            return base_url, urls
+
+    base_url, urls = asyncio.run(crawl())
+    assert f'{base_url}/c' in urls
+    assert f'{base_url}/x' not in urls
@@ -0,0 +1,148 @@
+import asyncio
+import threading
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from throttle import MAX_RETRY_AFTER, HostThrottle, host_of, parse_retry_after
+
+URL = 'http://Example.com:8080/path'
+
+def test_host_of_is_lowercase_netloc():
+    assert host_of(URL) == 'example.com:8080'
+
+def test_parse_retry_after_seconds_and_dates():
+    assert parse_retry_after('5') == 5.0
+    assert parse_retry_after(' 0.5 ') == 0.5
+    assert parse_retry_after('-3') == 0.0
+    assert parse_retry_after('100000') == MAX_RETRY_AFTER
+    later = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 <= parse_retry_after(later) <= 30
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('soon') is None
+
+def test_successes_raise_limit_by_one_per_window():
+    throttle = HostThrottle(initial_limit=4, max_limit=32)
+    for _ in range(4):
+        with throttle.slot(URL) as slot:
+            slot.observe(200)
+    assert 4.9 < throttle.state(URL).limit <= 5.0
+
+@pytest.mark.parametrize('status', [429, 503])
+def test_overload_status_halves_limit_once_per_rtt(status):
+    throttle = HostThrottle(initial_limit=8, min_limit=1)
+    for _ in range(3):
+        with throttle.slot(URL) as slot:
+            slot.observe(status)
+    assert throttle.state(URL).limit == 4
+
+def test_error_in_slot_decreases_limit_and_releases():
+    throttle = HostThrottle(initial_limit=2, min_limit=1)
+    with pytest.raises(ConnectionError):
+        with throttle.slot(URL):
+            raise ConnectionError
+    state = throttle.state(URL)
+    assert state.limit == 1
+    assert state.in_flight == 0
+
+def test_limit_never_drops_below_minimum():
+    throttle = HostThrottle(initial_limit=2, min_limit=2)
+    state = throttle.acquire(URL)
+    throttle.release(state, status=503)
+    assert throttle.state(URL).limit == 2
+
+def test_latency_spike_counts_as_overload():
+    throttle = HostThrottle(initial_limit=8, latency_factor=3.0, smoothing=1.0)
+    state = throttle.acquire(URL)
+    throttle.release(state, status=200, latency=0.1)
+    state = throttle.acquire(URL)
+    throttle.release(state, status=200, latency=1.0)
+    assert throttle.state(URL).limit < 8
+
+def test_missing_latency_is_not_sampled():
+    throttle = HostThrottle(initial_limit=8)
+    state = throttle.acquire(URL)
+    throttle.release(state, status=200, latency=None)
+    assert state.latency is None
+    assert state.limit > 8
+
+def test_retry_after_delays_next_request():
+    throttle = HostThrottle()
+    with throttle.slot(URL) as slot:
+        slot.observe(429, '0.2')
+    started = time.monotonic()
+    with throttle.slot(URL):
+        pass
+    assert time.monotonic() - started >= 0.15
+
+def test_crawl_delay_spaces_request_starts():
+    throttle = HostThrottle(initial_limit=4)
+    throttle.set_crawl_delay(URL, 0.1)
+    starts = []
+
+    async def one():
+        async with throttle.slot_async(URL) as slot:
+            starts.append(time.monotonic())
+            slot.observe(200)
+
+    async def main():
+        await asyncio.gather(*(one() for _ in range(3)))
+
+    asyncio.run(main())
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert all(gap >= 0.09 for gap in gaps)
+
+def test_async_waiters_respect_concurrency_limit():
+    throttle = HostThrottle(initial_limit=2, max_limit=2)
+    active = peak = 0
+
+    async def one():
+        nonlocal active, peak
+        async with throttle.slot_async(URL) as slot:
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            slot.observe(200)
+
+    async def main():
+        await asyncio.gather(*(one() for _ in range(8)))
+
+    asyncio.run(main())
+    assert peak == 2
+    assert throttle.state(URL).in_flight == 0
+
+def test_slot_without_latency_sampling_keeps_statistics():
+    throttle = HostThrottle(initial_limit=8)
+    with throttle.slot(URL, sample_latency=False) as slot:
+        time.sleep(0.05)
+        slot.observe(200)
+    assert throttle.state(URL).latency is None
+
+def test_slow_sync_holds_without_sampling_keep_async_limit():
+    throttle = HostThrottle(initial_limit=8, max_limit=32)
+
+    async def fast_requests():
+        for _ in range(20):
+            async with throttle.slot_async(URL) as slot:
+                await asyncio.sleep(0.005)
+                slot.observe(200)
+
+    asyncio.run(fast_requests())
+    state = throttle.state(URL)
+    limit, latency = state.limit, state.latency
+
+    def browser_load():
+        # 브라우저 로드처럼 느린 동기 슬롯 (지연 시간 통계에서 제외)
+        with throttle.slot(URL, sample_latency=False):
+            time.sleep(0.2)
+
+    threads = [threading.Thread(target=browser_load) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert state.latency == latency
+    assert state.limit >= limit
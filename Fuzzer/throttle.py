@@ -0,0 +1,219 @@
+import asyncio
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# 과부하로 보는 상태 코드
+OVERLOAD_STATUSES = frozenset({429, 503})
+# 이보다 빠른 응답은 지연 시간 비교에서 이 값으로 취급 (로컬 서버의 미세한 흔들림에 반응하지 않도록)
+MIN_LATENCY = 0.05
+# Retry-After 최대 대기 시간(초)
+MAX_RETRY_AFTER = 300
+
+def host_of(url):
+    return urlsplit(url).netloc.lower()
+
+def parse_retry_after(value):
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환, 해석할 수 없으면 None"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError, IndexError, OverflowError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+class HostState:
+    """호스트 하나의 동시 요청 한도(limit), 진행 중 요청 수, 다음 요청 가능 시각, 지연 시간 통계"""
+
+    def __init__(self, host, limit, delay=0.0):
+        self.host = host
+        self.limit = float(limit)
+        self.in_flight = 0
+        self.delay = delay  # 요청 시작 간 최소 간격 (robots Crawl-delay)
+        self.next_start = 0.0  # time.monotonic() 기준
+        self.latency = None  # 지연 시간 지수 이동 평균
+        self.base_latency = None  # 관측된 최소 지연 시간
+        self.last_decrease = 0.0
+        self.waiters = []  # 슬롯을 기다리는 asyncio (루프, Future)
+
+class HostThrottle:
+    """호스트별 동시 요청 수를 AIMD로 조절하는 컨트롤러
+
+    응답이 정상이고 지연 시간이 기준의 latency_factor배 이내면 한도를 RTT마다 1씩 늘리고,
+    429/503, 타임아웃/연결 오류, 지연 시간 급증이 보이면 한도를 decrease_factor배로 줄임.
+    Retry-After와 robots Crawl-delay를 지키며, 스레드(Selenium)와 asyncio(크롤러/퍼저)에서 함께 사용 가능
+    """
+
+    def __init__(self, initial_limit=4, min_limit=1, max_limit=32, decrease_factor=0.5, latency_factor=3.0, smoothing=0.2):
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_factor = latency_factor
+        self.smoothing = smoothing
+        self._hosts = {}
+        self._delays = {}
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+
+    def set_crawl_delay(self, url, delay):
+        """robots.txt의 Crawl-delay를 해당 호스트의 요청 간 최소 간격으로 설정"""
+        if not delay:
+            return
+        host = host_of(url)
+        with self._lock:
+            self._delays[host] = float(delay)
+            if host in self._hosts:
+                self._hosts[host].delay = float(delay)
+        logger.info(f"[Throttle] Crawl-delay 적용 - 호스트: {host}, 간격: {delay}초")
+
+    def state(self, url):
+        host = host_of(url)
+        with self._lock:
+            return self._state(host)
+
+    def _state(self, host):
+        state = self._hosts.get(host)
+        if state is None:
+            state = HostState(host, self.initial_limit, self._delays.get(host, 0.0))
+            self._hosts[host] = state
+        return state
+
+    def _try_acquire(self, state):
+        # 슬롯을 얻으면 0, 시간이 지나야 하면 대기 시간(초), 다른 요청이 끝나야 하면 None
+        if state.in_flight >= max(int(state.limit), self.min_limit):
+            return None
+        now = time.monotonic()
+        if now < state.next_start:
+            return state.next_start - now
+        state.in_flight += 1
+        if state.delay:
+            state.next_start = now + state.delay
+        return 0
+
+    # 슬롯 획득
+    def acquire(self, url):
+        state = self.state(url)
+        with self._condition:
+            while True:
+                wait = self._try_acquire(state)
+                if wait == 0:
+                    return state
+                self._condition.wait(timeout=wait)
+
+    async def acquire_async(self, url):
+        state = self.state(url)
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                wait = self._try_acquire(state)
+                if wait == 0:
+                    return state
+                waiter = None
+                if wait is None:
+                    waiter = loop.create_future()
+                    state.waiters.append((loop, waiter))
+            if waiter is None:
+                await asyncio.sleep(wait)
+            else:
+                await waiter
+
+    # 결과 반영
+    def release(self, state, status=None, latency=None, error=False, retry_after=None):
+        with self._condition:
+            state.in_flight -= 1
+            now = time.monotonic()
+            if retry_after is not None:
+                state.next_start = max(state.next_start, now + retry_after)
+            overloaded = error or status in OVERLOAD_STATUSES
+            if latency is not None and not error:
+                state.latency = latency if state.latency is None else (1 - self.smoothing) * state.latency + self.smoothing * latency
+                state.base_latency = latency if state.base_latency is None else min(state.base_latency, latency)
+                if state.latency > max(state.base_latency, MIN_LATENCY) * self.latency_factor:
+                    overloaded = True
+            if overloaded:
+                self._decrease(state, now, status, error)
+            else:
+                # 한도만큼의 요청이 성공하면 한도가 1 늘어남 (RTT당 +1)
+                state.limit = min(self.max_limit, state.limit + 1 / state.limit)
+            self._condition.notify_all()
+            waiters, state.waiters = state.waiters, []
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(self._wake, waiter)
+
+    def _decrease(self, state, now, status, error):
+        # 같은 RTT 안에서 끝난 요청들은 이미 과부하 이전에 보낸 것이므로 한 번만 줄임
+        window = max(state.latency or 0.0, MIN_LATENCY)
+        if now - state.last_decrease < window:
+            return
+        state.last_decrease = now
+        previous = state.limit
+        state.limit = max(self.min_limit, state.limit * self.decrease_factor)
+        reason = '요청 오류' if error else (f"상태 코드 {status}" if status in OVERLOAD_STATUSES else '지연 시간 증가')
+        logger.warning(f"[Throttle] 동시 요청 한도 감소 - 호스트: {state.host}, {previous:.1f} -> {state.limit:.1f} ({reason})")
+
+    @staticmethod
+    def _wake(waiter):
+        if not waiter.done():
+            waiter.set_result(None)
+
+    def slot(self, url, sample_latency=True):
+        """with throttle.slot(url) as slot: ... slot.observe(status, retry_after) 형태로 사용 (동기)
+
+        sample_latency=False면 지연 시간을 통계에 반영하지 않음 (sleep 확인 요청처럼 일부러 느린 요청)
+        """
+        return _Slot(self, url, sample_latency)
+
+    def slot_async(self, url, sample_latency=True):
+        """async with throttle.slot_async(url) as slot: ... 형태로 사용 (asyncio)"""
+        return _Slot(self, url, sample_latency)
+
+    def limits(self):
+        with self._lock:
+            return {host: state.limit for host, state in self._hosts.items()}
+
+class _Slot:
+    # 획득부터 반납까지의 지연 시간을 재고, 블록 안에서 발생한 예외는 오류로 반영
+    def __init__(self, throttle, url, sample_latency=True):
+        self.throttle = throttle
+        self.url = url
+        self.sample_latency = sample_latency
+        self.state = None
+        self.status = None
+        self.retry_after = None
+        self._started = None
+
+    def observe(self, status, retry_after=None):
+        self.status = status
+        self.retry_after = parse_retry_after(retry_after)
+
+    def _release(self, exc_type):
+        latency = time.monotonic() - self._started if self.sample_latency else None
+        self.throttle.release(self.state, self.status, latency, error=exc_type is not None, retry_after=self.retry_after)
+
+    def __enter__(self):
+        self.state = self.throttle.acquire(self.url)
+        self._started = time.monotonic()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._release(exc_type)
+        return False
+
+    async def __aenter__(self):
+        self.state = await self.throttle.acquire_async(self.url)
+        self._started = time.monotonic()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._release(exc_type)
+        return False